@@ -5,9 +5,17 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from app.Models.booking import Booking
+from app.Models.waitlist_entry import WaitlistEntry
+from app.Models.seat_hold import SeatHold
 from app.Models.notification import Notification
+from app.Models.notification_counter import NotificationCounter
+from app.Models.idempotency_key import IdempotencyKey
+from app.Models.change_log import ChangeLogEntry
+from app.Models.change_log_floor import ChangeLogFloor
 from app.Models.prerequisite import TopicPrerequisite
+from app.Models.prerequisite_closure import TopicPrerequisiteClosure
 from app.Models.session import TrainingSession
+from app.Models.session_seat_slot import SessionSeatSlot
 from app.Models.student_topic import Studenttopic
 from app.Models.topic import Topic
 from app.Models.trainer_topic import Trainertopic
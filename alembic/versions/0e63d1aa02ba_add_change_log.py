@@ -0,0 +1,53 @@
+"""add change log
+
+Revision ID: 0e63d1aa02ba
+Revises: 2909b10e0284
+Create Date: 2026-10-16 10:26:36.256748
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e63d1aa02ba'
+down_revision: Union[str, None] = '2909b10e0284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'change_log',
+        sa.Column('seq', sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column('txid', sa.BigInteger(), server_default=sa.text('txid_current()'), nullable=False),
+        sa.Column('entity', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.UUID(), nullable=False),
+        sa.Column('op', sa.String(length=10), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('seq')
+    )
+    op.create_index('ix_change_log_txid_seq', 'change_log', ['txid', 'seq'], unique=False)
+    op.create_index(
+        'ix_change_log_entity_entity_id_txid', 'change_log', ['entity', 'entity_id', 'txid'], unique=False
+    )
+    op.create_index('ix_change_log_created_at', 'change_log', ['created_at'], unique=False)
+
+    op.create_table(
+        'change_log_floor',
+        sa.Column('id', sa.SmallInteger(), nullable=False),
+        sa.Column('txid', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('change_log_floor')
+    op.drop_index('ix_change_log_created_at', table_name='change_log')
+    op.drop_index('ix_change_log_entity_entity_id_txid', table_name='change_log')
+    op.drop_index('ix_change_log_txid_seq', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,26 @@
+"""add booking reminded_at
+
+Revision ID: 2625515469c6
+Revises: cf1d8d79a212
+Create Date: 2026-10-16 09:28:52.418916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2625515469c6'
+down_revision: Union[str, None] = 'cf1d8d79a212'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bookings', sa.Column('reminded_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('bookings', 'reminded_at')
@@ -0,0 +1,67 @@
+"""add full text search
+
+Revision ID: 2909b10e0284
+Revises: f38e26d948d9
+Create Date: 2026-10-16 10:19:23.152019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2909b10e0284'
+down_revision: Union[str, None] = 'f38e26d948d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OPEN_SESSIONS = "deleted_at IS NULL AND status IN ('upcoming', 'active')"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('sessions', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_sessions_search_vector_open', 'sessions', ['search_vector'],
+        unique=False, postgresql_using='gin', postgresql_where=sa.text(OPEN_SESSIONS)
+    )
+
+    op.add_column('topics', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_topics_search_vector', 'topics', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_topics_name_trgm', 'topics', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_topics_name_trgm', table_name='topics')
+    op.drop_index('ix_topics_search_vector', table_name='topics')
+    op.drop_column('topics', 'search_vector')
+    op.drop_index('ix_sessions_search_vector_open', table_name='sessions')
+    op.drop_column('sessions', 'search_vector')
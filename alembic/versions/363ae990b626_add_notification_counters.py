@@ -0,0 +1,45 @@
+"""add notification counters
+
+Revision ID: 363ae990b626
+Revises: 2625515469c6
+Create Date: 2026-10-16 09:36:05.523645
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '363ae990b626'
+down_revision: Union[str, None] = '2625515469c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_counters',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('unread_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(
+        'ix_notifications_user_id_unread', 'notifications', ['user_id'],
+        unique=False, postgresql_where=sa.text('is_read = false')
+    )
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread_count, updated_at) "
+        "SELECT user_id, count(*), now() FROM notifications "
+        "WHERE is_read = false GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_notifications_user_id_unread', table_name='notifications',
+        postgresql_where=sa.text('is_read = false')
+    )
+    op.drop_table('notification_counters')
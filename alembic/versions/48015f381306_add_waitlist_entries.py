@@ -0,0 +1,42 @@
+"""add waitlist entries
+
+Revision ID: 48015f381306
+Revises: 363ae990b626
+Create Date: 2026-10-16 09:43:18.628374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '48015f381306'
+down_revision: Union[str, None] = '363ae990b626'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('waitlist_entries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('session_id', 'student_id', name='uc_waitlist_session_student')
+    )
+    op.create_index(
+        'ix_waitlist_entries_session_id_created_at_id', 'waitlist_entries',
+        ['session_id', 'created_at', 'id'], unique=False
+    )
+    op.create_index(op.f('ix_waitlist_entries_student_id'), 'waitlist_entries', ['student_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_waitlist_entries_student_id'), table_name='waitlist_entries')
+    op.drop_index('ix_waitlist_entries_session_id_created_at_id', table_name='waitlist_entries')
+    op.drop_table('waitlist_entries')
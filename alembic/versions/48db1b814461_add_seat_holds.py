@@ -0,0 +1,47 @@
+"""add seat holds
+
+Revision ID: 48db1b814461
+Revises: 7cee3d3d5c8c
+Create Date: 2026-10-16 10:04:57.942561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '48db1b814461'
+down_revision: Union[str, None] = '7cee3d3d5c8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sessions', sa.Column('held_seats', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('session_seat_slots', sa.Column('held', sa.Integer(), server_default='0', nullable=False))
+    op.create_check_constraint('ck_session_seat_slots_held', 'session_seat_slots', 'held >= 0')
+    op.create_table('seat_holds',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('slot', sa.SmallInteger(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('session_id', 'student_id', name='uc_seat_hold_session_student')
+    )
+    op.create_index(op.f('ix_seat_holds_expires_at'), 'seat_holds', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_seat_holds_student_id'), 'seat_holds', ['student_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_seat_holds_student_id'), table_name='seat_holds')
+    op.drop_index(op.f('ix_seat_holds_expires_at'), table_name='seat_holds')
+    op.drop_table('seat_holds')
+    op.drop_constraint('ck_session_seat_slots_held', 'session_seat_slots', type_='check')
+    op.drop_column('session_seat_slots', 'held')
+    op.drop_column('sessions', 'held_seats')
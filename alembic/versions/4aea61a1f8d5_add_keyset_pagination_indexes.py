@@ -0,0 +1,41 @@
+"""add keyset pagination indexes
+
+Revision ID: 4aea61a1f8d5
+Revises: eba46a9d71e2
+Create Date: 2026-10-16 09:07:13.104729
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4aea61a1f8d5'
+down_revision: Union[str, None] = 'eba46a9d71e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_sessions_created_at_id', 'sessions', ['created_at', 'id'],
+        unique=False, postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_topics_created_at_id', 'topics', ['created_at', 'id'],
+        unique=False, postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_notifications_user_id_created_at_id', 'notifications',
+        ['user_id', 'created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications')
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_index('ix_topics_created_at_id', table_name='topics')
+    op.drop_index('ix_sessions_created_at_id', table_name='sessions')
@@ -0,0 +1,31 @@
+"""add response cache versions
+
+Revision ID: 5b7e2c1d9a40
+Revises: 0e63d1aa02ba
+Create Date: 2026-10-16 13:05:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c1d9a40'
+down_revision: Union[str, None] = '0e63d1aa02ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('response_cache_versions',
+    sa.Column('namespace', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('namespace')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('response_cache_versions')
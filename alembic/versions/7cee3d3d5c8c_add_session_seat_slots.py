@@ -0,0 +1,36 @@
+"""add session seat slots
+
+Revision ID: 7cee3d3d5c8c
+Revises: 39c768f4cf6d
+Create Date: 2026-10-16 09:57:44.837832
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7cee3d3d5c8c'
+down_revision: Union[str, None] = '39c768f4cf6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sessions', sa.Column('seat_slots', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('session_seat_slots',
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('slot', sa.SmallInteger(), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('taken', sa.Integer(), nullable=False),
+    sa.CheckConstraint('taken >= 0', name='ck_session_seat_slots_taken'),
+    sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id', 'slot')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('session_seat_slots')
+    op.drop_column('sessions', 'seat_slots')
@@ -0,0 +1,31 @@
+"""drop response cache versions
+
+Revision ID: 8d2f4a6c1e37
+Revises: 5b7e2c1d9a40
+Create Date: 2026-10-16 15:42:08.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4a6c1e37'
+down_revision: Union[str, None] = '5b7e2c1d9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_table('response_cache_versions')
+
+
+def downgrade() -> None:
+    op.create_table('response_cache_versions',
+    sa.Column('namespace', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('namespace')
+    )
@@ -0,0 +1,63 @@
+"""add session and booking periods
+
+Revision ID: cf1d8d79a212
+Revises: dc3a7167a306
+Create Date: 2026-10-16 09:21:39.314187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cf1d8d79a212'
+down_revision: Union[str, None] = 'dc3a7167a306'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column('sessions', sa.Column(
+        'period',
+        postgresql.TSRANGE(),
+        sa.Computed(
+            "tsrange(start_time, start_time + COALESCE(duration_minutes, 0) * interval '1 minute', "
+            "CASE WHEN COALESCE(duration_minutes, 0) > 0 THEN '[)' ELSE '[]' END)",
+            persisted=True
+        ),
+        nullable=False
+    ))
+    op.create_index('ix_sessions_period', 'sessions', ['period'], unique=False, postgresql_using='gist')
+
+    op.add_column('bookings', sa.Column('period', postgresql.TSRANGE(), nullable=True))
+    op.execute(
+        "UPDATE bookings SET period = sessions.period "
+        "FROM sessions WHERE sessions.id = bookings.session_id"
+    )
+    # Existing overlapping bookings keep only their oldest booking period, so
+    # the exclusion constraint can be created over the backfilled rows
+    op.execute(
+        "UPDATE bookings b SET period = NULL "
+        "WHERE EXISTS (SELECT 1 FROM bookings o "
+        "WHERE o.student_id = b.student_id AND o.period && b.period "
+        "AND (o.created_at, o.id) < (b.created_at, b.id))"
+    )
+    op.create_exclude_constraint(
+        'ex_bookings_student_period',
+        'bookings',
+        ('student_id', '='),
+        ('period', '&&'),
+        using='gist'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_bookings_student_period', 'bookings', type_='exclude')
+    op.drop_column('bookings', 'period')
+    op.drop_index('ix_sessions_period', table_name='sessions', postgresql_using='gist')
+    op.drop_column('sessions', 'period')
@@ -0,0 +1,52 @@
+"""add topic prerequisite closure
+
+Revision ID: dc3a7167a306
+Revises: 4aea61a1f8d5
+Create Date: 2026-10-16 09:14:26.209458
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dc3a7167a306'
+down_revision: Union[str, None] = '4aea61a1f8d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('topic_prerequisite_closure',
+    sa.Column('ancestor_id', sa.UUID(), nullable=False),
+    sa.Column('descendant_id', sa.UUID(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['topics.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['descendant_id'], ['topics.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index(
+        'ix_topic_prerequisite_closure_descendant', 'topic_prerequisite_closure',
+        ['descendant_id', 'ancestor_id'], unique=False
+    )
+
+    # Backfill the closure from the existing prerequisite edges
+    op.execute("""
+        WITH RECURSIVE walk(descendant_id, ancestor_id, depth) AS (
+            SELECT topic_id, prerequisite_id, 1 FROM topic_prerequisites
+            UNION
+            SELECT walk.descendant_id, tp.prerequisite_id, walk.depth + 1
+            FROM walk JOIN topic_prerequisites tp ON tp.topic_id = walk.ancestor_id
+        )
+        INSERT INTO topic_prerequisite_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, min(depth)
+        FROM walk
+        GROUP BY ancestor_id, descendant_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_topic_prerequisite_closure_descendant', table_name='topic_prerequisite_closure')
+    op.drop_table('topic_prerequisite_closure')
@@ -0,0 +1,42 @@
+"""add session search indexes
+
+Revision ID: f38e26d948d9
+Revises: 48db1b814461
+Create Date: 2026-10-16 10:12:10.047290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f38e26d948d9'
+down_revision: Union[str, None] = '48db1b814461'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OPEN_SESSIONS = "deleted_at IS NULL AND status IN ('upcoming', 'active')"
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_sessions_start_time_id_open', 'sessions', ['start_time', 'id'],
+        unique=False, postgresql_where=sa.text(OPEN_SESSIONS)
+    )
+    op.create_index(
+        'ix_sessions_topic_id_start_time_id_open', 'sessions', ['topic_id', 'start_time', 'id'],
+        unique=False, postgresql_where=sa.text(OPEN_SESSIONS)
+    )
+    op.create_index(
+        'ix_sessions_trainer_id_start_time_id_open', 'sessions', ['trainer_id', 'start_time', 'id'],
+        unique=False, postgresql_where=sa.text(OPEN_SESSIONS)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sessions_trainer_id_start_time_id_open', table_name='sessions')
+    op.drop_index('ix_sessions_topic_id_start_time_id_open', table_name='sessions')
+    op.drop_index('ix_sessions_start_time_id_open', table_name='sessions')
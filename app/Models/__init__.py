@@ -5,19 +5,35 @@ Import order is important for relationships to work correctly
 from app.Models.user import User
 from app.Models.topic import Topic
 from app.Models.prerequisite import TopicPrerequisite
+from app.Models.prerequisite_closure import TopicPrerequisiteClosure
 from app.Models.trainer_topic import Trainertopic
 from app.Models.student_topic import Studenttopic
 from app.Models.session import TrainingSession
+from app.Models.session_seat_slot import SessionSeatSlot
 from app.Models.booking import Booking
+from app.Models.waitlist_entry import WaitlistEntry
+from app.Models.seat_hold import SeatHold
 from app.Models.notification import Notification
+from app.Models.notification_counter import NotificationCounter
+from app.Models.idempotency_key import IdempotencyKey
+from app.Models.change_log import ChangeLogEntry
+from app.Models.change_log_floor import ChangeLogFloor
 
 __all__ = [
     "User",
     "Topic",
     "TopicPrerequisite",
+    "TopicPrerequisiteClosure",
     "Trainertopic",
     "Studenttopic",
     "TrainingSession",
+    "SessionSeatSlot",
     "Booking",
+    "WaitlistEntry",
+    "SeatHold",
     "Notification",
+    "NotificationCounter",
+    "IdempotencyKey",
+    "ChangeLogEntry",
+    "ChangeLogFloor",
 ]
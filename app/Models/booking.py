@@ -3,7 +3,7 @@
 This module defines student bookings for training sessions.
 """
 from sqlalchemy import Column, ForeignKey, Boolean, Text, Integer, DateTime, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSRANGE, ExcludeConstraint
 from sqlalchemy.orm import relationship
 import uuid
 from sqlalchemy.sql import func
@@ -41,13 +41,27 @@ class Booking(Base):
     # Post-Session Feedback
     feedback = Column(Text, nullable=True)
     rating = Column(Integer, nullable=True)  # 1-5 scale
+
+    # Copy of the session period, so overlapping bookings of one student are
+    # rejected by ex_bookings_student_period instead of a pre-check query
+    period = Column(TSRANGE, nullable=True)
     
+    # Set once the start reminder has been sent
+    reminded_at = Column(DateTime, nullable=True)
+
     # Timestamp
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
     # Constraints
     __table_args__ = (
         UniqueConstraint('session_id', 'student_id', name='uc_session_student'),
+        # Requires the btree_gist extension for the equality part on student_id
+        ExcludeConstraint(
+            ('student_id', '='),
+            ('period', '&&'),
+            name='ex_bookings_student_period',
+            using='gist'
+        ),
     )
 
     # Relationships
@@ -0,0 +1,51 @@
+"""Change Log Model
+
+This module defines the append-only log behind the delta-sync change feed.
+"""
+from sqlalchemy import Column, BigInteger, String, DateTime, Identity, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class ChangeLogEntry(Base):
+    """One upsert or delete of a synced entity.
+
+    Entries are written in the same transaction as the change itself and
+    stamped with that transaction's id. Feed readers page by ``txid`` and
+    stop below the oldest transaction still running, so entries of a slow
+    transaction are never skipped even though ``seq`` values are handed out
+    before commit order is known.
+    """
+    
+    __tablename__ = "change_log"
+
+    # Primary Key
+    seq = Column(BigInteger, Identity(), primary_key=True)
+
+    # Writing transaction
+    txid = Column(BigInteger, server_default=text("txid_current()"), nullable=False)
+    
+    # Change
+    entity = Column(String(20), nullable=False)  # session, booking, notification, topic
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    op = Column(String(10), nullable=False)  # upsert, delete
+
+    # Only this user may see the entry; NULL for entries visible to everyone
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    
+    # Timestamp
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        # Feed reads in transaction order
+        Index("ix_change_log_txid_seq", "txid", "seq"),
+        # Compaction of entries superseded by a later change of the same entity
+        Index("ix_change_log_entity_entity_id_txid", "entity", "entity_id", "txid"),
+        # Retention
+        Index("ix_change_log_created_at", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<ChangeLogEntry(seq={self.seq}, entity={self.entity}, entity_id={self.entity_id}, op={self.op})>"
@@ -0,0 +1,29 @@
+"""Change Log Floor Model
+
+This module defines the retention floor of the change log.
+"""
+from sqlalchemy import Column, BigInteger, SmallInteger, DateTime
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class ChangeLogFloor(Base):
+    """Newest transaction whose change log entries were dropped by retention.
+
+    A single row. Feed positions below it may have missed changes, so
+    clients holding one must resync from the full listings.
+    """
+    
+    __tablename__ = "change_log_floor"
+
+    # Primary Key (always 1)
+    id = Column(SmallInteger, primary_key=True, default=1)
+    
+    # Floor
+    txid = Column(BigInteger, default=0, nullable=False)
+    
+    # Timestamp
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ChangeLogFloor(txid={self.txid})>"
@@ -0,0 +1,41 @@
+"""Idempotency Key Model
+
+This module defines stored responses of requests sent with an Idempotency-Key header.
+"""
+from sqlalchemy import Column, String, Integer, LargeBinary, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class IdempotencyKey(Base):
+    """Outcome of the first request made with a given key.
+
+    Retries with the same key replay ``response_body`` instead of running the
+    endpoint again. Rows expire after ``expires_at`` and are swept
+    periodically.
+    """
+    
+    __tablename__ = "idempotency_keys"
+
+    # Composite Primary Key (keys are scoped per user)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    key = Column(String(255), primary_key=True)
+    
+    # Fingerprint of method, path and body of the first request
+    request_hash = Column(String(64), nullable=False)
+    
+    # Stored Response
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id={self.user_id}, key={self.key}, status_code={self.status_code})>"
@@ -2,7 +2,7 @@
 
 This module defines user notifications for system events.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ENUM as pg_ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -43,6 +43,17 @@ class Notification(Base):
     # Timestamp
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
+    # Indexes
+    __table_args__ = (
+        # Per-user keyset pagination, newest first
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Unread counts and counter reconciliation
+        Index(
+            "ix_notifications_user_id_unread", "user_id",
+            postgresql_where=text("is_read = false")
+        ),
+    )
+
     # Relationship
     user = relationship("User", back_populates="notifications")
 
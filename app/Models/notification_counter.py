@@ -0,0 +1,35 @@
+"""Notification Counter Model
+
+This module defines the per-user unread notification counter.
+"""
+from sqlalchemy import Column, ForeignKey, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class NotificationCounter(Base):
+    """Maintained count of a user's unread notifications.
+
+    Updated by NotificationService in the same statement that creates, reads
+    or deletes notifications, and periodically reconciled against the
+    notifications table. A missing row means zero unread notifications.
+    """
+    
+    __tablename__ = "notification_counters"
+
+    # Primary Key
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    
+    # Counter
+    unread_count = Column(Integer, default=0, nullable=False)
+    
+    # Timestamp
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<NotificationCounter(user_id={self.user_id}, unread_count={self.unread_count})>"
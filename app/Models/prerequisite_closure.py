@@ -0,0 +1,49 @@
+"""Topic Prerequisite Closure Model
+
+This module defines the transitive closure of topic prerequisite relationships.
+"""
+from sqlalchemy import Column, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.DB.base import Base
+
+
+class TopicPrerequisiteClosure(Base):
+    """Every (ancestor, descendant) pair reachable through prerequisites.
+
+    A row means ``descendant_id`` transitively requires ``ancestor_id``;
+    ``depth`` is the length of the shortest prerequisite chain between them
+    (1 for a direct prerequisite). Maintained alongside ``topic_prerequisites``
+    by TopicPrerequisiteService.
+
+    Example: If C requires B and B requires A, the closure holds
+    (B, C, 1), (A, B, 1) and (A, C, 2).
+    """
+    
+    __tablename__ = "topic_prerequisite_closure"
+
+    # Composite Primary Key
+    ancestor_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("topics.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    descendant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("topics.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    
+    # Shortest chain length
+    depth = Column(Integer, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        # "All prerequisites of X" lookups
+        Index("ix_topic_prerequisite_closure_descendant", "descendant_id", "ancestor_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<TopicPrerequisiteClosure(ancestor_id={self.ancestor_id}, "
+            f"descendant_id={self.descendant_id}, depth={self.depth})>"
+        )
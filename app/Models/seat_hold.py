@@ -0,0 +1,55 @@
+"""Seat Hold Model
+
+This module defines short-lived seat holds taken before a booking is confirmed.
+"""
+from sqlalchemy import Column, ForeignKey, DateTime, SmallInteger, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+import uuid
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class SeatHold(Base):
+    """A seat set aside for a student until ``expires_at``.
+
+    The hold is counted in ``sessions.held_seats`` (or ``held`` of its slot
+    on striped sessions) and its id is the token the student presents to
+    convert it into a booking.
+    """
+    
+    __tablename__ = "seat_holds"
+
+    # Primary Key (the hold token)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # Foreign Keys
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    student_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    # Counter slot the seat was taken from, None for single-counter sessions
+    slot = Column(SmallInteger, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('session_id', 'student_id', name='uc_seat_hold_session_student'),
+    )
+
+    # Relationships
+    session = relationship("TrainingSession")
+    student = relationship("User")
+
+    def __repr__(self):
+        return f"<SeatHold(id={self.id}, session_id={self.session_id}, expires_at={self.expires_at})>"
@@ -2,13 +2,57 @@
 
 This module defines training sessions scheduled by trainers.
 """
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, ENUM as pg_ENUM
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, String, Text, DateTime, Integer, ForeignKey, Index, Computed, text,
+    case, cast, select, table, column
+)
+from sqlalchemy.dialects.postgresql import UUID, ENUM as pg_ENUM, TSRANGE, TSVECTOR
+from sqlalchemy.orm import relationship, deferred, column_property
 import uuid
 from sqlalchemy.sql import func
 from app.DB.base import Base
 
+# Stored [start, end) period of a session. Sessions without a duration are a
+# single instant and use a closed range so they still collide with sessions
+# running at that moment.
+SESSION_PERIOD_SQL = (
+    "tsrange(start_time, start_time + COALESCE(duration_minutes, 0) * interval '1 minute', "
+    "CASE WHEN COALESCE(duration_minutes, 0) > 0 THEN '[)' ELSE '[]' END)"
+)
+
+# Live sessions that can still be booked; the predicate of the partial
+# indexes behind session search
+OPEN_SESSIONS_SQL = "deleted_at IS NULL AND status IN ('upcoming', 'active')"
+
+# Weighted full-text document of a session: title ranks above description
+SESSION_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+# Striped seat counters (see SessionSeatSlot), declared as a lightweight table
+# so the seat totals below can be mapped here without importing that model
+_seat_slots = table(
+    "session_seat_slots",
+    column("session_id", UUID(as_uuid=True)),
+    column("taken", Integer),
+    column("held", Integer),
+)
+
+
+def _slot_total(slot_column, session_id, seat_slots, session_column):
+    """Sum a slot column on striped sessions, else read the sessions counter."""
+    return case(
+        (
+            seat_slots > 0,
+            select(cast(func.coalesce(func.sum(slot_column), 0), Integer))
+            .where(_seat_slots.c.session_id == session_id)
+            .correlate_except(_seat_slots)
+            .scalar_subquery()
+        ),
+        else_=session_column
+    )
+
 
 class TrainingSession(Base):
     """Training session model representing scheduled learning sessions.
@@ -38,14 +82,25 @@ class TrainingSession(Base):
     # Session Information
     title = Column(String(150), nullable=False)
     description = Column(Text, nullable=True)
+
+    # Full-text search document, loaded only when asked for
+    search_vector = deferred(Column(TSVECTOR, Computed(SESSION_SEARCH_VECTOR_SQL, persisted=True)))
     
     # Scheduling
     start_time = Column(DateTime, nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=True)
+    period = Column(TSRANGE, Computed(SESSION_PERIOD_SQL, persisted=True), nullable=False)
     
     # Capacity Management
     capacity = Column(Integer, default=10, nullable=False)
     current_attendees = Column(Integer, default=0, nullable=False)
+    # Striped counter slots (session_seat_slots); 0 counts on current_attendees
+    seat_slots = Column(Integer, default=0, server_default="0", nullable=False)
+    # Seats set aside by active seat holds
+    held_seats = Column(Integer, default=0, server_default="0", nullable=False)
+    # Seats booked and held whichever counter the session uses
+    seats_taken = column_property(_slot_total(_seat_slots.c.taken, id, seat_slots, current_attendees))
+    seats_held = column_property(_slot_total(_seat_slots.c.held, id, seat_slots, held_seats))
     
     # External Integration
     meet_link = Column(String(255), nullable=True)
@@ -63,10 +118,41 @@ class TrainingSession(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination over live sessions, newest first
+        Index(
+            "ix_sessions_created_at_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        # Range lookups over session periods
+        Index("ix_sessions_period", "period", postgresql_using="gist"),
+        # Session search over open sessions, by time window and optionally topic or trainer
+        Index(
+            "ix_sessions_start_time_id_open", "start_time", "id",
+            postgresql_where=text(OPEN_SESSIONS_SQL)
+        ),
+        Index(
+            "ix_sessions_topic_id_start_time_id_open", "topic_id", "start_time", "id",
+            postgresql_where=text(OPEN_SESSIONS_SQL)
+        ),
+        Index(
+            "ix_sessions_trainer_id_start_time_id_open", "trainer_id", "start_time", "id",
+            postgresql_where=text(OPEN_SESSIONS_SQL)
+        ),
+        # Full-text search over open sessions
+        Index(
+            "ix_sessions_search_vector_open", "search_vector",
+            postgresql_using="gin", postgresql_where=text(OPEN_SESSIONS_SQL)
+        ),
+    )
+
     # Relationships
     trainer = relationship("User", back_populates="sessions")
     topic = relationship("Topic", back_populates="sessions")
-    bookings = relationship("Booking", back_populates="session", cascade="all, delete-orphan")
+    bookings = relationship(
+        "Booking", back_populates="session", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<TrainingSession(id={self.id}, title={self.title}, status={self.status})>"
@@ -74,9 +160,9 @@ class TrainingSession(Base):
     @property
     def is_full(self) -> bool:
         """Check if session has reached capacity."""
-        return self.current_attendees >= self.capacity
+        return self.seats_taken + self.seats_held >= self.capacity
     
     @property
     def available_seats(self) -> int:
         """Get number of available seats."""
-        return max(0, self.capacity - self.current_attendees)
+        return max(0, self.capacity - self.seats_taken - self.seats_held)
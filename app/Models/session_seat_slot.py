@@ -0,0 +1,41 @@
+"""Session Seat Slot Model
+
+This module defines the striped seat counters of large sessions.
+"""
+from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from app.DB.base import Base
+
+
+class SessionSeatSlot(Base):
+    """One stripe of a session's seat counter.
+
+    A session created with ``seat_slots = N`` splits its capacity across N
+    rows; bookings increment a random slot with free seats instead of the
+    ``sessions`` row, so concurrent bookers lock different rows.
+    """
+    
+    __tablename__ = "session_seat_slots"
+
+    # Primary Key
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    slot = Column(SmallInteger, primary_key=True)
+    
+    # Share of the session capacity, seats booked and seats held from it
+    capacity = Column(Integer, nullable=False)
+    taken = Column(Integer, default=0, nullable=False)
+    held = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint("taken >= 0", name="ck_session_seat_slots_taken"),
+        CheckConstraint("held >= 0", name="ck_session_seat_slots_held"),
+    )
+
+    def __repr__(self):
+        return f"<SessionSeatSlot(session_id={self.session_id}, slot={self.slot}, taken={self.taken}/{self.capacity})>"
+
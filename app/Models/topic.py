@@ -2,13 +2,19 @@
 
 This module defines topics that can be taught in training sessions.
 """
-from sqlalchemy import Column, String, Text, DateTime
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, Index, Computed, text
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.sql import func
 import uuid
 from app.DB.base import Base
 
+# Weighted full-text document of a topic: name ranks above description
+TOPIC_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
 
 class Topic(Base):
     """Topic model representing subjects available for training.
@@ -24,12 +30,30 @@ class Topic(Base):
     # Topic Information
     name = Column(String(120), nullable=False, unique=True)
     description = Column(Text, nullable=True)
+
+    # Full-text search document, loaded only when asked for
+    search_vector = deferred(Column(TSVECTOR, Computed(TOPIC_SEARCH_VECTOR_SQL, persisted=True)))
     
     # Timestamps
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)  # Soft delete
 
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination over live topics, newest first
+        Index(
+            "ix_topics_created_at_id", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        # Full-text search, and typo-tolerant (trigram) matching on names
+        Index("ix_topics_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_topics_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+    )
+
     # Relationships
     trainer_topics = relationship("Trainertopic", back_populates="topic", cascade="all, delete-orphan")
     sessions = relationship("TrainingSession", back_populates="topic", cascade="all, delete-orphan")
@@ -3,7 +3,7 @@
 This module defines the User model representing students, trainers, and admins.
 """
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, ENUM as pg_ENUM
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -39,6 +39,12 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination, newest first
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
     # Relationships
     trainer_topics = relationship("Trainertopic", back_populates="trainer", cascade="all, delete-orphan")
     sessions = relationship("TrainingSession", back_populates="trainer", cascade="all, delete-orphan")
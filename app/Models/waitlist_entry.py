@@ -0,0 +1,53 @@
+"""Waitlist Entry Model
+
+This module defines the per-session queue of students waiting for a seat.
+"""
+from sqlalchemy import Column, ForeignKey, DateTime, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+import uuid
+from sqlalchemy.sql import func
+from app.DB.base import Base
+
+
+class WaitlistEntry(Base):
+    """A student queued for a full session.
+
+    Entries are served in enqueue order: when a booking is cancelled the
+    oldest entry is promoted into a booking by BookingService.
+    """
+    
+    __tablename__ = "waitlist_entries"
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # Foreign Keys
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    student_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    # Timestamp
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('session_id', 'student_id', name='uc_waitlist_session_student'),
+        # Queue head lookups, oldest first
+        Index("ix_waitlist_entries_session_id_created_at_id", "session_id", "created_at", "id"),
+    )
+
+    # Relationships
+    session = relationship("TrainingSession")
+    student = relationship("User")
+
+    def __repr__(self):
+        return f"<WaitlistEntry(id={self.id}, session_id={self.session_id}, student_id={self.student_id})>"
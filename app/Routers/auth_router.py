@@ -101,7 +101,8 @@ async def login_user(
     description="Get currently authenticated user profile"
 )
 async def get_current_user_profile(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> UserResponse:
     """Get current authenticated user."""
-    return current_user
+    return await AuthService.get_user_by_id(current_user.id, db)
@@ -6,21 +6,31 @@ from app.Schemas.booking_schema import BookingCreate, BookingResponse, BookingFe
 from app.Services.booking_service import BookingService
 from app.Services.auth_dependency import get_current_user, get_current_trainer_or_admin
 from app.Models.user import User
+from app.Services.idempotency_service import idempotent
+from app.core.response_cache import SESSIONS
 
 bookings_router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 @bookings_router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
+@idempotent(BookingResponse, status_code=status.HTTP_201_CREATED, invalidates=(SESSIONS,))
 async def book_session(
     booking_data: BookingCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Book a session (Student only)."""
+    """Book a session (Student only).
+
+    Send an `Idempotency-Key` header to make retries safe: repeats of the
+    same request replay the first response. Pass the `hold_token` of a seat
+    hold to book the seat it set aside.
+    """
     # Only students can book sessions
     if current_user.role not in ["student"]:
         raise HTTPException(status_code=403, detail="Only students can book sessions")
     
-    return await BookingService.create_booking(db, booking_data.session_id, current_user.id)
+    return await BookingService.create_booking(
+        db, booking_data.session_id, current_user.id, hold_token=booking_data.hold_token
+    )
 
 
 @bookings_router.patch("/{booking_id}/attendance", response_model=BookingResponse)
@@ -0,0 +1,38 @@
+"""Change Feed Router
+
+This module handles the delta-sync change feed endpoint.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.DB.session import get_db
+from app.Models.user import User
+from app.Schemas.change_schema import ChangeEntity, ChangeFeedResponse
+from app.Services.auth_dependency import get_current_user
+from app.Services.change_log_service import ChangeLogService, SYNCED_ENTITIES
+from app.core.serialization import serializer
+
+changes_router = APIRouter(prefix="/changes", tags=["Changes"])
+
+change_feed = serializer(ChangeFeedResponse)
+
+
+@changes_router.get("", response_model=ChangeFeedResponse)
+async def get_changes(
+    since: Optional[int] = Query(None, ge=0, description="`next_since` of the previous call"),
+    types: List[ChangeEntity] = Query(list(SYNCED_ENTITIES), description="Entities to sync"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of write transactions to cover"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get what changed since the last sync.
+
+    Call without `since` to get the current position, load the full
+    listings, then poll with the returned `next_since`. Each entity appears
+    once with its latest change: upserts carry the entity as the regular
+    endpoints return it. Sessions and topics are shared; bookings and
+    notifications are the caller's own. A 410 response means the position
+    is older than the retained history and the client must reload.
+    """
+    feed = await ChangeLogService.get_changes(db, current_user.id, since, types, limit)
+    return change_feed.response(feed, trusted=True)
@@ -0,0 +1,60 @@
+"""Export Router
+
+This module handles the streaming reporting exports for admins.
+"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from uuid import UUID
+from datetime import datetime
+from typing import Literal, Optional
+from app.Models.user import User
+from app.Services.auth_dependency import get_current_active_admin
+from app.Services.export_service import ExportService, MEDIA_TYPES
+
+exports_router = APIRouter(prefix="/exports", tags=["Exports"])
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def _export(name: str, stmt, export_format: str) -> StreamingResponse:
+    return StreamingResponse(
+        ExportService.stream(stmt, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+@exports_router.get("/bookings", response_class=StreamingResponse)
+async def export_bookings(
+    start_from: Optional[datetime] = Query(None, description="Sessions starting at or after, inclusive"),
+    start_to: Optional[datetime] = Query(None, description="Sessions starting before, exclusive"),
+    topic_id: Optional[UUID] = None,
+    format: ExportFormat = Query("ndjson", description="ndjson or csv"),
+    current_user: User = Depends(get_current_active_admin)
+):
+    """Stream every booking with its session, student, attendance and feedback."""
+    return _export("bookings", ExportService.bookings_query(start_from, start_to, topic_id), format)
+
+
+@exports_router.get("/sessions", response_class=StreamingResponse)
+async def export_sessions(
+    start_from: Optional[datetime] = Query(None, description="Sessions starting at or after, inclusive"),
+    start_to: Optional[datetime] = Query(None, description="Sessions starting before, exclusive"),
+    topic_id: Optional[UUID] = None,
+    format: ExportFormat = Query("ndjson", description="ndjson or csv"),
+    current_user: User = Depends(get_current_active_admin)
+):
+    """Stream every session with its topic, trainer and seat counts."""
+    return _export("sessions", ExportService.sessions_query(start_from, start_to, topic_id), format)
+
+
+@exports_router.get("/attendance", response_class=StreamingResponse)
+async def export_attendance(
+    start_from: Optional[datetime] = Query(None, description="Sessions starting at or after, inclusive"),
+    start_to: Optional[datetime] = Query(None, description="Sessions starting before, exclusive"),
+    topic_id: Optional[UUID] = None,
+    format: ExportFormat = Query("ndjson", description="ndjson or csv"),
+    current_user: User = Depends(get_current_active_admin)
+):
+    """Stream attendance, feedback and rating totals per session."""
+    return _export("attendance", ExportService.attendance_query(start_from, start_to, topic_id), format)
@@ -5,26 +5,37 @@ This module handles notification-related API endpoints.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from app.DB.session import get_db
 from app.Schemas.notification_schema import NotificationResponse
 from app.Services.notification_service import NotificationService
+from app.Services.read_models import ReadModelResponse
 from app.Services.auth_dependency import get_current_user
 from app.Models.user import User
+from app.core.pagination import set_next_cursor
 
 notifications_router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 @notifications_router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all notifications for the current user.
+    """Get notifications for the current user.
     
-    Returns notifications sorted by creation date (newest first).
+    Returns notifications sorted by creation date (newest first). Pass the
+    X-Next-Cursor response header back as `cursor` to fetch the next page.
     """
-    return await NotificationService.get_notifications_by_user(db, current_user.id)
+    notifications = await NotificationService.get_notifications_by_user(
+        db, current_user.id, skip, limit, cursor
+    )
+    response = ReadModelResponse(notifications)
+    set_next_cursor(response, notifications, limit)
+    return response
 
 
 @notifications_router.get("/unread/count", response_model=dict)
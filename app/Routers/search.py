@@ -0,0 +1,30 @@
+"""Search Router
+
+This module handles the keyword search endpoint.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.DB.session import get_db
+from app.Schemas.search_schema import SearchHit, SearchHitType
+from app.Services.search_service import SearchService
+from app.core.response_cache import response_cache, SESSIONS, TOPICS
+
+search_router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@search_router.get("", response_model=List[SearchHit])
+@response_cache.cached(List[SearchHit], SESSIONS, TOPICS, trusted=True)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Words, \"quoted phrases\", or and -word"),
+    type: List[SearchHitType] = Query(["session", "topic"], description="Kinds of results to include"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search upcoming and active sessions and topics, best match first.
+
+    Matched words are wrapped in `<mark>` in `title_highlight` and `snippet`.
+    Topic names also match on spelling similarity.
+    """
+    return await SearchService.search(db, q, type, skip, limit)
@@ -1,27 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
-from app.DB.session import get_db
-from app.Schemas.session_schema import SessionCreate, SessionUpdate, SessionResponse
-from app.Schemas.booking_schema import BookingResponse
+from datetime import datetime
+from typing import List, Optional
+from app.DB.session import get_db, AsyncSessionLocal
+from app.Schemas.session_schema import SessionCreate, SessionUpdate, SessionResponse, SessionStatus
+from app.Schemas.booking_schema import BookingResponse, BatchBookingCreate, BatchBookingResponse
+from app.Schemas.waitlist_schema import WaitlistEntryResponse
+from app.Schemas.seat_hold_schema import SeatHoldResponse
 from app.Services.session_service import SessionService
 from app.Services.booking_service import BookingService
+from app.Services.waitlist_service import WaitlistService
+from app.Services.seat_hold_service import SeatHoldService
+from app.Services.read_models import BookingRow, Projection, ReadModelResponse, SessionRow, projection
+from app.Services.seat_availability import SeatAvailabilityService, availability_broadcaster
 from app.Services.auth_dependency import get_current_user, get_current_trainer_or_admin
 from app.Models.user import User
+from app.Services.idempotency_service import idempotent
+from app.core.pagination import set_next_cursor
+from app.core.response_cache import response_cache, SESSIONS, TOPICS
 
 sessions_router = APIRouter(prefix="/sessions", tags=["Sessions"])
 
 # IMPORTANT: Specific routes MUST come before parameterized routes
 @sessions_router.get("/my-bookings", response_model=List[BookingResponse])
 async def get_my_bookings(
+    shape: Projection = Depends(projection(BookingRow)),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get bookings for the current user"""
-    return await BookingService.get_bookings_by_student(db, current_user.id)
+    """Get bookings for the current user. Supports `fields`, `embed` and `normalized`."""
+    bookings = await BookingService.get_bookings_by_student(db, current_user.id, shape)
+    return ReadModelResponse(bookings, shape)
+
+@sessions_router.get("/search", response_model=List[SessionResponse])
+@response_cache.cached(List[SessionResponse], SESSIONS, TOPICS)
+async def search_sessions(
+    response: Response,
+    start_from: Optional[datetime] = Query(None, description="Earliest start time, inclusive"),
+    start_to: Optional[datetime] = Query(None, description="Latest start time, exclusive"),
+    topic_id: Optional[UUID] = None,
+    trainer_id: Optional[UUID] = None,
+    status: List[SessionStatus] = Query(["upcoming", "active"], description="Allowed statuses"),
+    has_free_seats: Optional[bool] = Query(None, description="Only sessions with (true) or without (false) free seats"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Search sessions soonest first. Pass the X-Next-Cursor header back as `cursor` for the next page."""
+    sessions = await SessionService.search_sessions(
+        db, start_from, start_to, topic_id, trainer_id, status, has_free_seats, limit, cursor
+    )
+    set_next_cursor(response, sessions, limit, sort_attribute="start_time")
+    return sessions
 
 @sessions_router.post("/", response_model=SessionResponse)
+@idempotent(SessionResponse, invalidates=(SESSIONS,))
 async def create_session(
     session_in: SessionCreate, 
     db: AsyncSession = Depends(get_db),
@@ -46,14 +81,27 @@ async def create_session(
         raise HTTPException(status_code=500, detail=str(e))
 
 @sessions_router.get("/", response_model=List[SessionResponse])
+@response_cache.cached(List[SessionResponse], SESSIONS, TOPICS)
 async def get_sessions(
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
+    shape: Projection = Depends(projection(SessionRow)),
     db: AsyncSession = Depends(get_db)
 ):
-    return await SessionService.get_all_sessions(db, skip, limit)
+    """List sessions newest first. Pass the X-Next-Cursor header back as `cursor` for the next page.
+
+    `fields` limits the returned attributes, `embed` the relations joined in
+    (`trainer,topic` by default, empty for none), and `normalized=true` lists
+    each trainer and topic once under `included` instead of on every session.
+    """
+    sessions = await SessionService.get_all_sessions(db, skip, limit, cursor, shape)
+    response = ReadModelResponse(sessions, shape)
+    set_next_cursor(response, sessions, limit)
+    return response
 
 @sessions_router.get("/{session_id}", response_model=SessionResponse)
+@response_cache.cached(SessionResponse, SESSIONS, TOPICS)
 async def get_session(
     session_id: UUID, 
     db: AsyncSession = Depends(get_db)
@@ -63,6 +111,29 @@ async def get_session(
         raise HTTPException(status_code=404, detail="Session not found")
     return session
 
+@sessions_router.get("/{session_id}/availability/stream", response_class=StreamingResponse)
+async def stream_session_availability(session_id: UUID):
+    """Stream seat availability as Server-Sent Events.
+
+    The first `availability` event carries the current counts and one more
+    follows each committed booking, cancellation, seat hold or session
+    update. Changes arrive through the process-wide LISTEN connection and
+    their counts are read once per process, not once per watcher.
+    """
+    # Subscribe before reading the snapshot so no change falls in between
+    queue = availability_broadcaster.subscribe(session_id)
+    async with AsyncSessionLocal() as db:
+        snapshot = await SeatAvailabilityService.snapshot(db, session_id)
+    if snapshot is None:
+        availability_broadcaster.unsubscribe(session_id, queue)
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return StreamingResponse(
+        availability_broadcaster.stream(session_id, queue, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @sessions_router.patch("/{session_id}", response_model=SessionResponse)
 async def update_session(
     session_id: UUID, 
@@ -108,28 +179,71 @@ async def book_session(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    # Check prerequisites logic could be added here
-    
-    # Check if session exists
-    session = await SessionService.get_session_by_id(db, session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    # Check capacity
-    if session.capacity <= session.current_attendees:
-        raise HTTPException(status_code=400, detail="Session is full")
+    # Existence, capacity and duplicate checks all happen inside the single
+    # reservation statement (uc_session_student rejects duplicates), so the
+    # cost of booking does not grow with the student's booking history.
+    return await BookingService.create_booking(db, session_id, current_user.id)
 
-    # Check if already booked
-    existing_bookings = await BookingService.get_bookings_by_student(db, current_user.id)
-    for booking in existing_bookings:
-        if booking.session_id == session_id:
-             raise HTTPException(status_code=400, detail="Already booked")
+@sessions_router.post(
+    "/{session_id}/hold",
+    response_model=SeatHoldResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def hold_seat(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Set a seat aside for a short time. Book it by sending the returned
+    hold_token to POST /bookings/ before the hold expires."""
+    if current_user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can hold seats")
+    return await SeatHoldService.create_hold(db, session_id, current_user.id)
 
-    return await BookingService.create_booking(db, session_id, current_user.id)
+@sessions_router.post(
+    "/{session_id}/waitlist",
+    response_model=WaitlistEntryResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def join_waitlist(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue for a full session. A seat freed by a cancellation is booked for
+    the oldest entry automatically and the student is notified."""
+    if current_user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can join the waitlist")
+    return await WaitlistService.join_waitlist(db, session_id, current_user.id)
+
+@sessions_router.delete("/{session_id}/waitlist")
+async def leave_waitlist(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not await WaitlistService.leave_waitlist(db, session_id, current_user.id):
+        raise HTTPException(status_code=404, detail="Not on the waitlist")
+    return {"message": "Left the waitlist"}
+
+@sessions_router.post("/{session_id}/bookings:batch", response_model=BatchBookingResponse)
+async def batch_book_session(
+    session_id: UUID,
+    payload: BatchBookingCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_trainer_or_admin)
+):
+    results = await BookingService.create_bookings_batch(db, session_id, payload.student_ids, current_user)
+    return {
+        "session_id": session_id,
+        "booked": sum(1 for result in results if result["success"]),
+        "results": results,
+    }
 
 @sessions_router.get("/{session_id}/bookings", response_model=List[BookingResponse])
 async def get_session_bookings(
     session_id: UUID, 
+    shape: Projection = Depends(projection(BookingRow)),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -143,5 +257,6 @@ async def get_session_bookings(
         if current_user.role != "trainer" or session.trainer_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not authorized")
 
-    return await BookingService.get_bookings_by_session(db, session_id)
+    bookings = await BookingService.get_bookings_by_session(db, session_id, shape)
+    return ReadModelResponse(bookings, shape)
 
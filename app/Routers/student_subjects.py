@@ -7,6 +7,7 @@ from app.Schemas.student_topic_schema import StudentTopicCreate, StudentTopicRes
 from app.Schemas.booking_schema import BookingResponse
 from app.Services.student_topic_service import StudentTopicService
 from app.Services.booking_service import BookingService
+from app.Services.read_models import BookingRow, Projection, ReadModelResponse, projection
 from app.Services.auth_dependency import get_current_user, get_current_trainer_or_admin
 from app.Models.user import User
 
@@ -54,10 +55,12 @@ async def remove_completed_subject(
 @student_subjects_router.get("/{student_id}/bookings", response_model=List[BookingResponse])
 async def get_student_bookings(
     student_id: UUID,
+    shape: Projection = Depends(projection(BookingRow)),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != "admin" and current_user.id != student_id:
          raise HTTPException(status_code=403, detail="Not authorized")
          
-    return await BookingService.get_bookings_by_student(db, student_id)
+    bookings = await BookingService.get_bookings_by_student(db, student_id, shape)
+    return ReadModelResponse(bookings, shape)
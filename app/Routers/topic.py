@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from sqlalchemy.sql import func
 from uuid import UUID
+from typing import Optional
 from app.DB.session import get_db
 from app.Models.topic import Topic
 from app.Models.user import User
 from app.Schemas.topic import TopicCreate, TopicUpdate, TopicResponse
 from app.Services.auth_dependency import get_current_active_admin
+from app.core.pagination import paginate, set_next_cursor
+from app.core.response_cache import response_cache, TOPICS
+from app.Services.change_log_service import ChangeLogService, TOPIC, UPSERT, DELETE
 
 
 topic_router = APIRouter(prefix="/topics", tags=["Topics"])
@@ -26,18 +30,30 @@ async def create_topic(
         raise HTTPException(status_code=400, detail="topic is alrady exist")
     
     db.add(topic)
+    await db.flush()
+    await ChangeLogService.record(db, [(TOPIC, topic.id, UPSERT, None)])
     await db.commit()
     await db.refresh(topic)
+    await response_cache.invalidate(TOPICS)
     return topic
 
 @topic_router.get("/", response_model=list[TopicResponse])
-async def get_topics(skip: int = 0, limit: int = 20, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Topic).where(Topic.deleted_at == None).offset(skip).limit(limit)
-    )
-    return result.scalars().all()
+@response_cache.cached(list[TopicResponse], TOPICS)
+async def get_topics(
+    response: Response,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select(Topic).where(Topic.deleted_at == None)
+    result = await db.execute(paginate(stmt, Topic.created_at, Topic.id, cursor, skip, limit))
+    topics = result.scalars().all()
+    set_next_cursor(response, topics, limit)
+    return topics
 
 @topic_router.get("/{topic_id}", response_model=TopicResponse)
+@response_cache.cached(TopicResponse, TOPICS)
 async def get_topic(topic_id: UUID, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(Topic).where(Topic.id == topic_id, Topic.deleted_at == None))
     topic = result.scalar_one_or_none()
@@ -63,8 +79,10 @@ async def update_topic(
     for key, value in data.dict(exclude_unset=True).items():
         setattr(topic, key, value)
 
+    await ChangeLogService.record(db, [(TOPIC, topic.id, UPSERT, None)])
     await db.commit()
     await db.refresh(topic)
+    await response_cache.invalidate(TOPICS)
     return topic
 
 @topic_router.delete("/{topic_id}")
@@ -80,5 +98,7 @@ async def delete_topic(
         raise HTTPException(status_code=404, detail="Topic not found")
 
     topic.deleted_at = func.now()
+    await ChangeLogService.record(db, [(TOPIC, topic.id, DELETE, None)])
     await db.commit()
+    await response_cache.invalidate(TOPICS)
     return {"detail": "Topic deleted"}
@@ -10,9 +10,12 @@ from typing import List
 
 from app.DB.session import get_db
 from app.Models.prerequisite import TopicPrerequisite
+from app.Models.prerequisite_closure import TopicPrerequisiteClosure
 from app.Models.topic import Topic
 from app.Services.auth_dependency import get_current_active_admin
+from app.Services.topic_prerequisite_service import TopicPrerequisiteService
 from app.Models.user import User
+from app.core.response_cache import response_cache, TOPIC_PREREQUISITES, TOPICS
 
 
 router = APIRouter(prefix="/topic-prerequisites", tags=["Topic Prerequisites"])
@@ -48,6 +51,9 @@ async def add_prerequisite(
     if topic_id == prerequisite_topic_id:
         raise HTTPException(status_code=400, detail="A topic cannot be its own prerequisite")
     
+    # Serialize graph writes so concurrent additions cannot close a cycle
+    await TopicPrerequisiteService.lock_graph(db)
+    
     # Check for circular dependency
     if await has_circular_dependency(db, topic_id, prerequisite_topic_id):
         raise HTTPException(status_code=400, detail="Circular dependency detected")
@@ -62,13 +68,10 @@ async def add_prerequisite(
     if existing.scalars().first():
         raise HTTPException(status_code=400, detail="Prerequisite relationship already exists")
     
-    # Create the prerequisite relationship
-    prerequisite = TopicPrerequisite(
-        topic_id=topic_id,
-        prerequisite_id=prerequisite_topic_id
-    )
-    db.add(prerequisite)
+    # Create the prerequisite relationship and extend the closure
+    await TopicPrerequisiteService.add_prerequisite(db, topic_id, prerequisite_topic_id)
     await db.commit()
+    await response_cache.invalidate(TOPIC_PREREQUISITES)
     
     return {"message": "Prerequisite added successfully"}
 
@@ -81,6 +84,7 @@ async def remove_prerequisite(
     current_user: User = Depends(get_current_active_admin)
 ):
     """Remove a prerequisite relationship."""
+    await TopicPrerequisiteService.lock_graph(db)
     result = await db.execute(
         select(TopicPrerequisite).where(
             TopicPrerequisite.topic_id == topic_id,
@@ -92,24 +96,40 @@ async def remove_prerequisite(
     if not prerequisite:
         raise HTTPException(status_code=404, detail="Prerequisite relationship not found")
     
-    await db.delete(prerequisite)
+    await TopicPrerequisiteService.remove_prerequisite(db, prerequisite)
     await db.commit()
+    await response_cache.invalidate(TOPIC_PREREQUISITES)
     
     return {"message": "Prerequisite removed successfully"}
 
 
 @router.get("/{topic_id}")
+@response_cache.cached(None, TOPIC_PREREQUISITES, TOPICS)
 async def get_topic_prerequisites(
     topic_id: UUID,
+    transitive: bool = False,
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all prerequisites for a topic."""
-    result = await db.execute(
-        select(Topic).join(
-            TopicPrerequisite,
-            TopicPrerequisite.prerequisite_id == Topic.id
-        ).where(TopicPrerequisite.topic_id == topic_id)
-    )
+    """Get all prerequisites for a topic.
+    
+    With `transitive=true`, prerequisites of prerequisites are included as
+    well, nearest first, resolved with a single closure lookup.
+    """
+    if transitive:
+        result = await db.execute(
+            select(Topic).join(
+                TopicPrerequisiteClosure,
+                TopicPrerequisiteClosure.ancestor_id == Topic.id
+            ).where(TopicPrerequisiteClosure.descendant_id == topic_id)
+            .order_by(TopicPrerequisiteClosure.depth, Topic.name)
+        )
+    else:
+        result = await db.execute(
+            select(Topic).join(
+                TopicPrerequisite,
+                TopicPrerequisite.prerequisite_id == Topic.id
+            ).where(TopicPrerequisite.topic_id == topic_id)
+        )
     prerequisites = result.scalars().all()
     
     return [{"id": str(p.id), "name": p.name} for p in prerequisites]
@@ -120,30 +140,7 @@ async def has_circular_dependency(db: AsyncSession, topic_id: UUID, new_prerequi
     Check if adding new_prerequisite_id as a prerequisite of topic_id 
     would create a circular dependency.
     
-    Algorithm: Do a depth-first search starting from new_prerequisite_id.
-    If we can reach topic_id, then adding this relationship would create a cycle.
+    Uses the prerequisite closure: a cycle appears exactly when topic_id is
+    already a (transitive) prerequisite of new_prerequisite_id.
     """
-    async def dfs(current_id: UUID, visited: set) -> bool:
-        if current_id in visited:
-            return False
-        
-        if current_id == topic_id:
-            return True  # Found a path back to the original topic
-        
-        visited.add(current_id)
-        
-        # Get all prerequisites of current_id (topics that current_id depends on)
-        result = await db.execute(
-            select(TopicPrerequisite.prerequisite_id).where(
-                TopicPrerequisite.topic_id == current_id
-            )
-        )
-        dependent_topics = result.scalars().all()
-        
-        for dependent_id in dependent_topics:
-            if await dfs(dependent_id, visited):
-                return True
-        
-        return False
-    
-    return await dfs(new_prerequisite_id, set())
+    return await TopicPrerequisiteService.would_create_cycle(db, topic_id, new_prerequisite_id)
@@ -6,6 +6,7 @@ from app.Schemas.trainer_topic import TrainerTopicCreate, TrainerTopicResponse
 from app.Services.trainer_topic_service import TrainerTopicService
 from app.Services.auth_dependency import get_current_active_admin
 from app.Models.user import User
+from app.core.response_cache import response_cache, TRAINER_TOPICS
 
 trainer_topic_router = APIRouter(prefix="/trainer-topics", tags=["Trainer Topics"])
 
@@ -26,6 +27,7 @@ async def assign_topic(
 
 
 @trainer_topic_router.get("/{trainer_id}", response_model=list[TrainerTopicResponse])
+@response_cache.cached(list[TrainerTopicResponse], TRAINER_TOPICS)
 async def get_topics(trainer_id: UUID, db: AsyncSession = Depends(get_db)):
     result = await TrainerTopicService.get_trainer_topics(db, trainer_id)
     return result
@@ -1,25 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from app.DB.session import get_db
 from app.Schemas.user_schema import UserResponse
 from app.Services.user_service import UserService
 from app.Services.auth_dependency import get_current_user
 from app.Models.user import User
+from app.core.pagination import set_next_cursor
 
 users_router = APIRouter(prefix="/users", tags=["Users"])
 
 @users_router.get("/", response_model=List[UserResponse])
 async def get_users(
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role not in ["admin", "super_admin"]:
         raise HTTPException(status_code=403, detail="Not authorized")
-    return await UserService.get_all_users(db, skip, limit)
+    users = await UserService.get_all_users(db, skip, limit, cursor)
+    set_next_cursor(response, users, limit)
+    return users
 
 @users_router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
@@ -4,7 +4,7 @@ This module defines Pydantic models for booking data validation.
 """
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.Schemas.user_schema import UserResponse
 from app.Schemas.session_schema import SessionResponse
@@ -30,6 +30,35 @@ class BookingBase(BaseModel):
 class BookingCreate(BaseModel):
     """Schema for creating a booking."""
     session_id: UUID = Field(..., description="Session ID to book")
+    hold_token: Optional[UUID] = Field(
+        None,
+        description="Seat hold token from POST /sessions/{id}/hold to convert into the booking"
+    )
+
+
+class BatchBookingCreate(BaseModel):
+    """Schema for booking many students into one session."""
+    student_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Students to enroll, in priority order when seats run out"
+    )
+
+
+class BatchBookingResult(BaseModel):
+    """Outcome of a batch booking for one student."""
+    student_id: UUID = Field(..., description="Student ID")
+    success: bool = Field(..., description="Whether the student was booked")
+    booking_id: Optional[UUID] = Field(None, description="Created booking ID")
+    detail: Optional[str] = Field(None, description="Reason the booking was rejected")
+
+
+class BatchBookingResponse(BaseModel):
+    """Schema for batch booking response."""
+    session_id: UUID = Field(..., description="Session ID")
+    booked: int = Field(..., description="Number of bookings created")
+    results: List[BatchBookingResult] = Field(..., description="Per-student outcome")
 
 
 class BookingFeedback(BaseModel):
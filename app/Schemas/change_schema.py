@@ -0,0 +1,50 @@
+"""Change Feed Schemas
+
+This module defines Pydantic models for the delta-sync change feed.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+from typing import List, Literal, Optional, Union
+from app.Schemas.booking_schema import BookingResponse
+from app.Schemas.notification_schema import NotificationResponse
+from app.Schemas.session_schema import SessionResponse
+from app.Schemas.topic import TopicResponse
+
+# Entities carried by the change feed
+ChangeEntity = Literal["session", "booking", "notification", "topic"]
+
+
+class ChangeRecord(BaseModel):
+    """Latest change of one entity."""
+    seq: int = Field(..., description="Change log sequence number")
+    entity: ChangeEntity = Field(..., description="Changed entity")
+    id: UUID = Field(..., description="Entity ID")
+    op: Literal["upsert", "delete"] = Field(..., description="Whether to store or drop the entity")
+    data: Optional[Union[SessionResponse, BookingResponse, NotificationResponse, TopicResponse]] = Field(
+        None, description="Current representation, for upserts"
+    )
+
+
+class ChangeFeedResponse(BaseModel):
+    """Schema for a page of the change feed."""
+    changes: List[ChangeRecord] = Field(..., description="Changes after `since`, oldest first")
+    next_since: int = Field(..., description="Position to pass as `since` on the next call")
+    has_more: bool = Field(..., description="Whether more changes can be fetched right away")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "changes": [
+                    {
+                        "seq": 1042,
+                        "entity": "notification",
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "op": "delete",
+                        "data": None
+                    }
+                ],
+                "next_since": 88231,
+                "has_more": False
+            }
+        }
+    )
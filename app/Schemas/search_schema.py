@@ -0,0 +1,39 @@
+"""Search Schemas
+
+This module defines Pydantic models for full-text search results.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+from typing import Literal, Optional
+from datetime import datetime
+
+# Kinds of search results
+SearchHitType = Literal["session", "topic"]
+
+
+class SearchHit(BaseModel):
+    """Schema for one ranked search result."""
+    type: SearchHitType = Field(..., description="Kind of result")
+    id: UUID = Field(..., description="Session or topic ID")
+    rank: float = Field(..., description="Relevance, higher is better")
+    title: str = Field(..., description="Session title or topic name")
+    title_highlight: str = Field(..., description="Title with matched words wrapped in <mark>")
+    snippet: Optional[str] = Field(None, description="Description excerpt with matched words wrapped in <mark>")
+    topic_id: UUID = Field(..., description="Topic of the session, or the topic itself")
+    start_time: Optional[datetime] = Field(None, description="Session start time")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "type": "session",
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "rank": 0.8,
+                "title": "Graph Algorithms Workshop",
+                "title_highlight": "<mark>Graph</mark> Algorithms Workshop",
+                "snippet": "Shortest paths on weighted <mark>graphs</mark>",
+                "topic_id": "123e4567-e89b-12d3-a456-426614174001",
+                "start_time": "2024-01-01T10:00:00"
+            }
+        }
+    )
@@ -0,0 +1,25 @@
+"""Seat Hold Schemas
+
+This module defines Pydantic models for seat hold data.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+from datetime import datetime
+
+
+class SeatHoldResponse(BaseModel):
+    """Schema for seat hold response."""
+    hold_token: UUID = Field(..., description="Token to pass as hold_token when booking")
+    session_id: UUID = Field(..., description="Session ID")
+    expires_at: datetime = Field(..., description="Time the held seat is released")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "hold_token": "123e4567-e89b-12d3-a456-426614174000",
+                "session_id": "123e4567-e89b-12d3-a456-426614174001",
+                "expires_at": "2024-01-01T12:02:00Z"
+            }
+        }
+    )
@@ -2,13 +2,16 @@
 
 This module defines Pydantic models for training session data validation.
 """
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, AliasChoices
 from uuid import UUID
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 from app.Schemas.user_schema import UserResponse
 from app.Schemas.topic import TopicResponse
 
+# Values of the session_status enum
+SessionStatus = Literal["active", "cancelled", "completed", "upcoming"]
+
 
 class SessionBase(BaseModel):
     """Base session schema."""
@@ -40,8 +43,8 @@ class SessionBase(BaseModel):
     capacity: int = Field(
         default=10,
         ge=1,
-        le=100,
-        description="Maximum number of attendees (1-100)",
+        le=1000,
+        description="Maximum number of attendees (1-1000)",
         example=20
     )
     meet_link: Optional[str] = Field(
@@ -74,6 +77,13 @@ class SessionCreate(SessionBase):
         None,
         description="Trainer ID (Admin only, otherwise uses current user)"
     )
+    seat_slots: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Striped seat counter slots for large, heavily booked sessions (0 = single counter)",
+        example=0
+    )
 
 
 class SessionUpdate(BaseModel):
@@ -102,8 +112,8 @@ class SessionUpdate(BaseModel):
     capacity: Optional[int] = Field(
         None,
         ge=1,
-        le=100,
-        description="Maximum attendees (1-100)"
+        le=1000,
+        description="Maximum attendees (1-1000)"
     )
     meet_link: Optional[str] = Field(
         None,
@@ -135,7 +145,17 @@ class SessionResponse(SessionBase):
     id: UUID = Field(..., description="Session ID")
     trainer_id: UUID = Field(..., description="Trainer ID")
     topic_id: UUID = Field(..., description="Topic ID")
-    current_attendees: int = Field(..., description="Current number of bookings")
+    current_attendees: int = Field(
+        ...,
+        validation_alias=AliasChoices("seats_taken", "current_attendees"),
+        description="Current number of bookings"
+    )
+    held_seats: int = Field(
+        0,
+        validation_alias=AliasChoices("seats_held", "held_seats"),
+        description="Seats set aside by active seat holds"
+    )
+    seat_slots: int = Field(0, description="Striped seat counter slots (0 = single counter)")
     status: str = Field(..., description="Session status")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
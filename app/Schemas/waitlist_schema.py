@@ -0,0 +1,29 @@
+"""Waitlist Schemas
+
+This module defines Pydantic models for session waitlist data.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from uuid import UUID
+from datetime import datetime
+
+
+class WaitlistEntryResponse(BaseModel):
+    """Schema for waitlist entry response."""
+    id: UUID = Field(..., description="Waitlist entry ID")
+    session_id: UUID = Field(..., description="Session ID")
+    student_id: UUID = Field(..., description="Student ID")
+    position: int = Field(..., description="1-based position in the queue")
+    created_at: datetime = Field(..., description="Enqueue timestamp")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "session_id": "123e4567-e89b-12d3-a456-426614174001",
+                "student_id": "123e4567-e89b-12d3-a456-426614174002",
+                "position": 3,
+                "created_at": "2024-01-01T12:00:00Z"
+            }
+        }
+    )
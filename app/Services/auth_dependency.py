@@ -12,6 +12,7 @@ from app.DB.session import get_db
 from app.Models.user import User
 from app.Schemas.auth import TokenData
 from app.core.config import settings
+from app.core.principal_cache import principal_cache, CachedPrincipal
 
 security = HTTPBearer()
 
@@ -22,15 +23,18 @@ async def get_current_user(
 ) -> User:
     """Get the current authenticated user from JWT token.
     
+    The user's id, role and active flag are served from the in-process
+    principal cache when possible, so most requests run no auth query.
+    
     Args:
         credentials: HTTP Bearer credentials containing JWT token
         db: Database session
-        
+    
     Returns:
-        Authenticated user
+        Authenticated user (transient, only id/role/is_active populated)
         
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid, user not found or inactive
     """
     token = credentials.credentials
 
@@ -54,13 +58,28 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).filter(User.id == token_data.user_id))
-    user = result.scalar_one_or_none()
+    principal = principal_cache.get(token_data.user_id)
+    if principal is None:
+        result = await db.execute(
+            select(User.id, User.role, User.is_active).filter(User.id == token_data.user_id)
+        )
+        row = result.first()
 
-    if not user:
-        raise credentials_exception
+        if not row:
+            raise credentials_exception
+
+        principal = CachedPrincipal(id=row.id, role=row.role, is_active=row.is_active)
+        principal_cache.set(principal)
+
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is inactive"
+        )
 
-    return user
+    # Detached user carrying only the authorization fields; endpoints that
+    # need the full profile load it explicitly.
+    return User(id=principal.id, role=principal.role, is_active=principal.is_active)
 
 
 async def get_current_active_admin(
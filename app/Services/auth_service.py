@@ -12,7 +12,7 @@ from typing import Dict, Any, Union, Optional
 from fastapi import HTTPException, status
 from app.Models.user import User
 from app.Schemas.user_schema import UserCreate, UserLogin, UserRegister
-from app.core.hash import get_password_hash, verify_password
+from app.core.hash import password_hasher, HashingPoolSaturated
 from app.core.jwt import create_access_token
 from app.core.config import settings
 
@@ -21,6 +21,16 @@ logger = logging.getLogger(__name__)
 
 
 class AuthService:
+    @staticmethod
+    def _hashing_unavailable() -> HTTPException:
+        """Build the fast-fail response used when the hashing pool is full."""
+        logger.warning("Password hashing pool saturated, rejecting request")
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
     @staticmethod
     async def register_user(user_data: Union[UserCreate, UserRegister], db: AsyncSession, forced_role: str = None) -> User:
         """Register a new user.
@@ -34,7 +44,8 @@ class AuthService:
             Created user object
             
         Raises:
-            HTTPException: If email already exists or database error occurs
+            HTTPException: If email already exists, the hashing pool is saturated
+                or a database error occurs
         """
         try:
             # Check if user already exists
@@ -57,7 +68,7 @@ class AuthService:
             if role == "super_admin" and not forced_role:
                  role = "student" # Default to student if someone tries to sneak in super_admin
     
-            hashed_password = get_password_hash(user_data.password)
+            hashed_password = await password_hasher.hash(user_data.password)
             db_user = User(
                 name=user_data.name,
                 email=user_data.email,
@@ -74,6 +85,9 @@ class AuthService:
             
         except HTTPException:
             raise
+        except HashingPoolSaturated:
+            await db.rollback()
+            raise AuthService._hashing_unavailable()
         except Exception as e:
             await db.rollback()
             logger.error(f"Error registering user: {str(e)}", exc_info=True)
@@ -94,7 +108,8 @@ class AuthService:
             Dictionary containing access token and token type
             
         Raises:
-            HTTPException: If credentials are invalid or database error occurs
+            HTTPException: If credentials are invalid, the hashing pool is saturated
+                or a database error occurs
         """
         try:
             # Retrieve user
@@ -104,7 +119,7 @@ class AuthService:
             user = result.scalar_one_or_none()
             
             # Verify credentials
-            if not user or not verify_password(user_data.password, user.password):
+            if not user or not await password_hasher.verify(user_data.password, user.password):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Incorrect email or password",
@@ -130,6 +145,8 @@ class AuthService:
             
         except HTTPException:
             raise
+        except HashingPoolSaturated:
+            raise AuthService._hashing_unavailable()
         except Exception as e:
             logger.error(f"Error during login: {str(e)}", exc_info=True)
             raise HTTPException(
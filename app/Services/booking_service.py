@@ -1,161 +1,807 @@
+import uuid
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy import func
+from sqlalchemy.orm import joinedload, aliased
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy import func, update, insert, delete, literal, false, exists, null
 from app.Models.booking import Booking
 from app.Models.session import TrainingSession
+from app.Models.session_seat_slot import SessionSeatSlot
+from app.Models.user import User
+from app.Models.waitlist_entry import WaitlistEntry
+from app.Models.seat_hold import SeatHold
 from uuid import UUID
 from typing import List, Optional
 from fastapi import HTTPException, status
 from app.Models.student_topic import Studenttopic
-from datetime import timedelta
 
 from app.Models.topic import Topic
 from app.Models.prerequisite import TopicPrerequisite
-from datetime import datetime, timezone
-from sqlalchemy import and_, or_, text
+from app.Models.prerequisite_closure import TopicPrerequisiteClosure
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from app.DB.session import AsyncSessionLocal
+from app.core.response_cache import response_cache, SESSIONS
+from app.Services.notification_dispatcher import notification_dispatcher, NotificationEvent
+from app.Services.seat_counter_service import SeatCounterService
+from app.Services.seat_availability import SeatAvailabilityService
+from app.Services.read_models import BookingRow, Projection
+from app.Services.change_log_service import ChangeLogService, SESSION, BOOKING, UPSERT, DELETE
+from datetime import datetime
+from sqlalchemy import and_
+
+logger = logging.getLogger(__name__)
+
+BOOKABLE_STATUSES = ("active", "upcoming")
+
+# Waitlist heads tried per cancellation before giving up on stale entries
+WAITLIST_PROMOTION_ATTEMPTS = 5
+
+
+def _joined_bookings(shape: Projection):
+    """Select bookings as BookingRow columns, joined to the relations the shape embeds."""
+    embed = BookingRow.default_embed if shape.embed is None else shape.embed
+    student = aliased(User)
+    trainer = aliased(User)
+    stmt = select(*BookingRow.joined_columns(trainer, student, embed, shape.fields)).select_from(Booking)
+    if "student" in embed:
+        stmt = stmt.outerjoin(student, student.id == Booking.student_id)
+    if "session" in embed:
+        stmt = stmt.join(TrainingSession, TrainingSession.id == Booking.session_id)
+    if "session.trainer" in embed:
+        stmt = stmt.outerjoin(trainer, trainer.id == TrainingSession.trainer_id)
+    if "session.topic" in embed:
+        stmt = stmt.outerjoin(Topic, Topic.id == TrainingSession.topic_id)
+    return stmt, embed
+
 
 class BookingService:
     @staticmethod
-    async def create_booking(db: AsyncSession, session_id: UUID, student_id: UUID) -> Booking:
+    async def create_booking(
+        db: AsyncSession,
+        session_id: UUID,
+        student_id: UUID,
+        hold_token: Optional[UUID] = None
+    ) -> Booking:
         # Check prerequisites
         await BookingService.check_prerequisites(db, session_id, student_id)
-        
-        # Get session with SELECT FOR UPDATE lock to prevent race conditions
-        # This ensures only one transaction can modify the session at a time
+
+        # Reserve the seat and insert the booking in one statement. The
+        # conditional UPDATE only matches while a seat is free, so no row
+        # lock is held across round trips and concurrent bookers never
+        # oversell the session. Schedule overlaps with the student's other
+        # bookings are rejected by ex_bookings_student_period. A seat hold
+        # token books the seat the hold already set aside instead; without
+        # one, a hold the student has on the session is converted all the same.
+        try:
+            if hold_token is not None:
+                result = await db.execute(
+                    BookingService._convert_hold_and_book(session_id, student_id, hold_token, uuid.uuid4())
+                )
+                booking_id = result.scalar_one_or_none()
+            else:
+                result = await db.execute(
+                    BookingService._reserve_and_book(session_id, student_id, uuid.uuid4())
+                )
+                booking_id = result.scalar_one_or_none()
+
+                # On a striped session the free seats may all sit in slots that
+                # concurrent bookers hold or that ran dry: spread them out, retry once
+                if booking_id is None:
+                    restriped = await SeatCounterService.restripe(db, session_id)
+                    if restriped and restriped[1]:
+                        result = await db.execute(
+                            BookingService._reserve_and_book(session_id, student_id, uuid.uuid4())
+                        )
+                        booking_id = result.scalar_one_or_none()
+        except IntegrityError as e:
+            await db.rollback()
+            # Handle unique constraint violation (double booking)
+            if "uc_session_student" in str(e) or "duplicate key" in str(e).lower():
+                raise HTTPException(status_code=400, detail="Already booked this session")
+            # Handle exclusion constraint violation (overlapping booking)
+            if "ex_bookings_student_period" in str(e):
+                raise HTTPException(status_code=400, detail="Already booked a session on the same time")
+            # Re-raise other exceptions
+            raise
+
+        if booking_id is None:
+            await db.rollback()
+            if hold_token is not None:
+                raise HTTPException(status_code=400, detail="Seat hold not found or expired")
+            await BookingService._raise_booking_rejection(db, session_id)
+
+        await SeatAvailabilityService.publish(db, session_id)
+        await ChangeLogService.record(db, [
+            (BOOKING, booking_id, UPSERT, student_id),
+            (SESSION, session_id, UPSERT, None),
+        ])
+        await db.commit()
+        await response_cache.invalidate(SESSIONS)
+
+        # Eagerly load relationships including nested ones
         result = await db.execute(
-            select(TrainingSession)
-            .where(TrainingSession.id == session_id)
-            .with_for_update()  # Database-level lock
+            select(Booking)
+            .options(
+                joinedload(Booking.student),
+                joinedload(Booking.session).joinedload(TrainingSession.trainer),
+                joinedload(Booking.session).joinedload(TrainingSession.topic)
+            )
+            .where(Booking.id == booking_id)
+        )
+        booking = result.scalar_one()
+
+        notification_dispatcher.publish(NotificationEvent(
+            "booking",
+            f"Your booking for session '{booking.session.title}' is confirmed",
+            user_ids=(student_id,)
+        ))
+        return booking
+
+    @staticmethod
+    def reserve_seat(session_id: UUID, hold: bool = False, unless=None):
+        """Build the conditional seat reservation as a ``reserved`` subquery.
+
+        The ``reserved_row`` CTE increments the sessions row while a seat is
+        free and the session is bookable. Sessions with striped counters
+        leave that row alone and take the seat from a random slot with free
+        seats, skipping slots other bookers hold, in the ``reserved_slot``
+        CTE instead. Held seats count as taken either way.
+
+        Args:
+            session_id: Session to reserve a seat in
+            hold: Count the seat as held instead of booked
+            unless: CTE of the same statement; no seat is reserved when it
+                returns a row
+
+        Returns:
+            Subquery with the session's id, period and the slot used (None
+            for single-counter sessions); empty when no seat was reserved
+        """
+        bookable = and_(
+            TrainingSession.status.in_(BOOKABLE_STATUSES),
+            TrainingSession.start_time >= datetime.utcnow(),
+        )
+        if unless is not None:
+            bookable = and_(bookable, ~exists(select(literal(1)).select_from(unless)))
+        if hold:
+            row_counter, slot_counter = TrainingSession.held_seats, SessionSeatSlot.held
+        else:
+            row_counter, slot_counter = TrainingSession.current_attendees, SessionSeatSlot.taken
+
+        reserved_row = (
+            update(TrainingSession)
+            .where(
+                TrainingSession.id == session_id,
+                TrainingSession.seat_slots == 0,
+                TrainingSession.current_attendees + TrainingSession.held_seats < TrainingSession.capacity,
+                bookable,
+            )
+            .values({row_counter: row_counter + 1})
+            .returning(TrainingSession.id, TrainingSession.period)
+            .cte("reserved_row")
+        )
+        free_slot = (
+            select(SessionSeatSlot.slot)
+            .join(TrainingSession, TrainingSession.id == SessionSeatSlot.session_id)
+            .where(
+                SessionSeatSlot.session_id == session_id,
+                SessionSeatSlot.taken + SessionSeatSlot.held < SessionSeatSlot.capacity,
+                bookable,
+            )
+            .order_by(func.random())
+            .limit(1)
+            .with_for_update(of=SessionSeatSlot, skip_locked=True)
+            .scalar_subquery()
+        )
+        reserved_slot = (
+            update(SessionSeatSlot)
+            .where(SessionSeatSlot.session_id == session_id, SessionSeatSlot.slot == free_slot)
+            .values({slot_counter: slot_counter + 1})
+            .returning(SessionSeatSlot.session_id, SessionSeatSlot.slot)
+            .cte("reserved_slot")
+        )
+        return BookingService._reserved(reserved_row, reserved_slot)
+
+    @staticmethod
+    def _reserved(row_cte, slot_cte, name: str = "reserved"):
+        """Union a sessions-row CTE and a slot CTE into one ``reserved`` subquery."""
+        return (
+            select(row_cte.c.id, row_cte.c.period, null().label("slot"))
+            .union_all(
+                select(TrainingSession.id, TrainingSession.period, slot_cte.c.slot)
+                .join(slot_cte, slot_cte.c.session_id == TrainingSession.id)
+            )
+            .subquery(name)
+        )
+
+    @staticmethod
+    def _book_reserved(reserved, student_id: UUID, booking_id: UUID):
+        """Insert the booking for a seat from a ``reserved`` subquery."""
+        return (
+            insert(Booking)
+            .from_select(
+                ["id", "session_id", "student_id", "attended", "created_at", "period"],
+                select(
+                    literal(booking_id, PG_UUID(as_uuid=True)),
+                    reserved.c.id,
+                    literal(student_id, PG_UUID(as_uuid=True)),
+                    false(),
+                    func.now(),
+                    reserved.c.period,
+                ),
+            )
+            .returning(Booking.id)
+        )
+
+    @staticmethod
+    def _reserve_and_book(session_id: UUID, student_id: UUID, booking_id: UUID):
+        """Build the single-statement seat reservation.
+
+        Renders as ``WITH reserved AS (UPDATE sessions ... RETURNING id)
+        INSERT INTO bookings SELECT ... FROM reserved RETURNING id``. When the
+        session is missing, full, not bookable or already started the CTE
+        returns no row, nothing is inserted and the statement yields no id.
+        A duplicate booking raises on ``uc_session_student`` and an overlapping
+        one on ``ex_bookings_student_period``, rolling the seat increment back
+        with it.
+
+        A seat the student already holds on the session is booked instead of
+        a new one, even without its token, so the hold is never left counting
+        a second seat until the sweeper expires it.
+        """
+        converted, held = BookingService._convert_hold(session_id, student_id)
+        fresh = BookingService.reserve_seat(session_id, unless=converted)
+        reserved = (
+            select(held.c.id, held.c.period, held.c.slot)
+            .union_all(select(fresh.c.id, fresh.c.period, fresh.c.slot))
+            .subquery("booked_seat")
+        )
+        return BookingService._book_reserved(reserved, student_id, booking_id)
+
+    @staticmethod
+    def _convert_hold_and_book(session_id: UUID, student_id: UUID, hold_token: UUID, booking_id: UUID):
+        """Build the single-statement conversion of a seat hold into a booking.
+
+        Yields no id when the token does not match an unexpired hold of the
+        student on a bookable session.
+        """
+        _, held = BookingService._convert_hold(session_id, student_id, hold_token)
+        return BookingService._book_reserved(held, student_id, booking_id)
+
+    @staticmethod
+    def _convert_hold(session_id: UUID, student_id: UUID, hold_token: Optional[UUID] = None):
+        """Build the conversion of a student's seat hold into a booked seat.
+
+        The hold is deleted only while the session is still bookable; its
+        seat moves from the held to the booked counter of the sessions row or
+        of the slot the hold recorded. A token must match an unexpired hold.
+        Without one, the student's hold on the session is converted even if
+        it expired, since the sweeper has not given its seat back yet.
+
+        Returns:
+            The ``converted`` DELETE CTE and a ``held`` subquery with the
+            session's id, period and slot; both empty when no hold matched
+        """
+        now = datetime.utcnow()
+        criteria = [
+            SeatHold.session_id == session_id,
+            SeatHold.student_id == student_id,
+            TrainingSession.id == SeatHold.session_id,
+            TrainingSession.status.in_(BOOKABLE_STATUSES),
+            TrainingSession.start_time >= now,
+        ]
+        if hold_token is not None:
+            criteria += [SeatHold.id == hold_token, SeatHold.expires_at >= now]
+        converted = (
+            delete(SeatHold)
+            .where(*criteria)
+            .returning(SeatHold.session_id, SeatHold.slot)
+            .cte("converted")
         )
-        session = result.scalars().first()
+        converted_row = (
+            update(TrainingSession)
+            .where(TrainingSession.id == converted.c.session_id, converted.c.slot.is_(None))
+            .values(
+                held_seats=TrainingSession.held_seats - 1,
+                current_attendees=TrainingSession.current_attendees + 1
+            )
+            .returning(TrainingSession.id, TrainingSession.period)
+            .cte("converted_row")
+        )
+        converted_slot = (
+            update(SessionSeatSlot)
+            .where(
+                SessionSeatSlot.session_id == converted.c.session_id,
+                SessionSeatSlot.slot == converted.c.slot
+            )
+            .values(held=SessionSeatSlot.held - 1, taken=SessionSeatSlot.taken + 1)
+            .returning(SessionSeatSlot.session_id, SessionSeatSlot.slot)
+            .cte("converted_slot")
+        )
+        return converted, BookingService._reserved(converted_row, converted_slot, "held")
+
+    @staticmethod
+    async def _raise_booking_rejection(db: AsyncSession, session_id: UUID):
+        """Explain why the conditional reservation matched no session row.
+
+        Only runs on the failure path, so successful bookings never pay for it.
+        """
+        result = await db.execute(
+            select(
+                TrainingSession.capacity,
+                TrainingSession.seats_taken,
+                TrainingSession.seats_held,
+                TrainingSession.status,
+                TrainingSession.start_time,
+            ).where(TrainingSession.id == session_id)
+        )
+        session = result.first()
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Check if session is full
-        if session.current_attendees >= session.capacity:
+
+        # Check if session is full (held seats count as taken)
+        if session.seats_taken + session.seats_held >= session.capacity:
             raise HTTPException(status_code=400, detail="Session is full")
-        
+
         # Check session status
-        if session.status not in ["active", "upcoming"]:
+        if session.status not in BOOKABLE_STATUSES:
             raise HTTPException(status_code=400, detail=f"Cannot book {session.status} session")
-        
+
         # Check if session is in the past (use naive datetime for comparison)
         if session.start_time < datetime.utcnow():
             raise HTTPException(status_code=400, detail="Cannot book past sessions")
-        
-        # Check that there are no inclusive_sessions .
 
-        session_end = session.start_time + timedelta(minutes=session.duration_minutes)
-        inclusive_sessions = await db.execute(
-            select(Booking)
-            .join(Booking.session)
-            .where(
-                or_(
-                    # session starts inside existing session
-                    and_(
-                        TrainingSession.start_time >= session.start_time,
-                        TrainingSession.start_time < session_end,
-                    ),
-                    # existing session starts inside new session
-                    and_(
-                        TrainingSession.start_time
-                        + (TrainingSession.duration_minutes * text("interval '1 minute'"))
-                        > session.start_time,
-                        TrainingSession.start_time <= session.start_time,
-                    ),
+        # The seat was taken between the reservation and this check
+        raise HTTPException(status_code=400, detail="Session is full")
+
+    @staticmethod
+    async def create_bookings_batch(
+        db: AsyncSession,
+        session_id: UUID,
+        student_ids: List[UUID],
+        requested_by: User
+    ) -> List[dict]:
+        """Book many students into one session in a single transaction.
+
+        Eligibility is checked set-based: one query for unknown/non-student
+        ids and existing bookings, one for missing prerequisites and one for
+        bookings overlapping the session. Seats are then reserved for the
+        eligible students with one conditional UPDATE and the bookings written
+        with one multi-row INSERT. Students beyond the free seats are reported
+        as full; the INSERT's ON CONFLICT clause only catches overlaps booked
+        concurrently, whose seats are given back.
+
+        Args:
+            db: Database session
+            session_id: Session to book into
+            student_ids: Students to enroll, in priority order
+            requested_by: Trainer of the session or an admin
+
+        Returns:
+            One result dict (student_id, success, booking_id, detail) per
+            distinct student, in request order
+        """
+        result = await db.execute(
+            select(
+                TrainingSession.trainer_id,
+                TrainingSession.topic_id,
+                TrainingSession.title,
+                TrainingSession.start_time,
+                TrainingSession.period,
+                TrainingSession.status,
+                TrainingSession.seat_slots,
+            ).where(TrainingSession.id == session_id)
+        )
+        session = result.first()
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if requested_by.role not in ["admin", "super_admin"] and session.trainer_id != requested_by.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+
+        if session.status not in BOOKABLE_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Cannot book {session.status} session")
+
+        if session.start_time < datetime.utcnow():
+            raise HTTPException(status_code=400, detail="Cannot book past sessions")
+
+        student_ids = list(dict.fromkeys(student_ids))
+        rejected = {}
+
+        # Unknown ids, non-students and students already in this session
+        result = await db.execute(
+            select(
+                User.id,
+                exists().where(
+                    Booking.session_id == session_id,
+                    Booking.student_id == User.id
+                ).label("booked")
+            ).where(User.id.in_(student_ids), User.role == "student")
+        )
+        students = {row.id: row.booked for row in result}
+        for student_id in student_ids:
+            if student_id not in students:
+                rejected[student_id] = "Student not found"
+            elif students[student_id]:
+                rejected[student_id] = "Already booked this session"
+
+        candidates = [s for s in student_ids if s not in rejected]
+
+        # Missing prerequisites for every candidate in one query
+        if candidates:
+            if settings.ENFORCE_TRANSITIVE_PREREQUISITES:
+                edges = TopicPrerequisiteClosure
+                required_id, dependent_id = edges.ancestor_id, edges.descendant_id
+            else:
+                edges = TopicPrerequisite
+                required_id, dependent_id = edges.prerequisite_id, edges.topic_id
+
+            result = await db.execute(
+                select(User.id, Topic.name)
+                .join(edges, dependent_id == session.topic_id)
+                .join(Topic, Topic.id == required_id)
+                .where(
+                    User.id.in_(candidates),
+                    ~exists().where(
+                        Studenttopic.student_id == User.id,
+                        Studenttopic.topic_id == required_id
+                    )
                 )
+                .order_by(User.id, Topic.name)
             )
-        )
+            missing = {}
+            for row in result:
+                missing.setdefault(row.id, []).append(row.name)
+            for student_id, names in missing.items():
+                rejected[student_id] = f"Prerequisites not met. Missing topics: {', '.join(names)}"
+            candidates = [s for s in candidates if s not in rejected]
 
-        if inclusive_sessions.scalars().first():
-            raise HTTPException(
-                status_code=400,
-                detail="Already booked a session on the same time"
+        # Candidates with another booking overlapping this session, in one
+        # query over ex_bookings_student_period's index, so they never take
+        # a seat that the students after them could have had
+        if candidates:
+            result = await db.execute(
+                select(Booking.student_id).distinct()
+                .where(
+                    Booking.student_id.in_(candidates),
+                    Booking.period.op("&&")(
+                        select(TrainingSession.period)
+                        .where(TrainingSession.id == session_id)
+                        .scalar_subquery()
+                    )
+                )
             )
+            for student_id in result.scalars():
+                rejected[student_id] = "Already booked a session on the same time"
+            candidates = [s for s in candidates if s not in rejected]
+
+        booked = {}
+        if candidates:
+            granted = await BookingService._take_seats(db, session_id, session.seat_slots, len(candidates))
+            if granted:
+                result = await db.execute(
+                    pg_insert(Booking)
+                    .values([
+                        {
+                            "id": uuid.uuid4(),
+                            "session_id": session_id,
+                            "student_id": student_id,
+                            "attended": False,
+                            "created_at": func.now(),
+                            "period": session.period,
+                        }
+                        for student_id in candidates[:granted]
+                    ])
+                    .on_conflict_do_nothing()
+                    .returning(Booking.student_id, Booking.id)
+                )
+                booked = {row.student_id: row.id for row in result}
+
+                # Overlaps booked concurrently since the check give their seat back
+                if len(booked) < granted:
+                    await BookingService._release_seats(
+                        db, session_id, session.seat_slots, granted - len(booked)
+                    )
+                    for student_id in candidates[:granted]:
+                        if student_id not in booked:
+                            rejected[student_id] = "Already booked a session on the same time"
+
+            for student_id in candidates[granted:]:
+                rejected[student_id] = "Session is full"
+
+        if booked:
+            await SeatAvailabilityService.publish(db, session_id)
+            await ChangeLogService.record(db, [
+                *((BOOKING, booking_id, UPSERT, student_id) for student_id, booking_id in booked.items()),
+                (SESSION, session_id, UPSERT, None),
+            ])
+        await db.commit()
+        if booked:
+            await response_cache.invalidate(SESSIONS)
+            notification_dispatcher.publish(NotificationEvent(
+                "booking",
+                f"Your booking for session '{session.title}' is confirmed",
+                user_ids=tuple(booked)
+            ))
 
+        return [
+            {
+                "student_id": student_id,
+                "success": student_id in booked,
+                "booking_id": booked.get(student_id),
+                "detail": rejected.get(student_id),
+            }
+            for student_id in student_ids
+        ]
 
-        # Create booking
-        db_booking = Booking(
-            session_id=session_id,
-            student_id=student_id
+    @staticmethod
+    async def _take_seats(db: AsyncSession, session_id: UUID, seat_slots: int, seats: int) -> int:
+        """Take up to ``seats`` free seats of a bookable session at once.
+
+        Returns:
+            Number of seats granted
+        """
+        if seat_slots:
+            # Striped counters: take the seats across all slots at once
+            restriped = await SeatCounterService.restripe(db, session_id, taken_delta=seats)
+            return restriped[0] if restriped else 0
+
+        # Lock the session row and grant up to the free seats in one statement
+        free_seats = (
+            select(
+                TrainingSession.id,
+                func.least(
+                    seats,
+                    TrainingSession.capacity - TrainingSession.current_attendees - TrainingSession.held_seats
+                ).label("granted")
+            )
+            .where(
+                TrainingSession.id == session_id,
+                TrainingSession.current_attendees + TrainingSession.held_seats < TrainingSession.capacity,
+                TrainingSession.status.in_(BOOKABLE_STATUSES),
+            )
+            .with_for_update()
+            .cte("free_seats")
         )
-        db.add(db_booking)
-        
-        # Increment current_attendees (session already fetched above with lock)
-        session.current_attendees += 1
-        db.add(session)
-        
-        try:
-            await db.commit()
-        except Exception as e:
-            await db.rollback()
-            # Handle unique constraint violation (double booking)
-            if "uc_session_student" in str(e) or "duplicate key" in str(e).lower():
-                raise HTTPException(status_code=400, detail="Already booked this session")
-            # Re-raise other exceptions
-            raise
-            
-        await db.refresh(db_booking)
-        
-        # Eagerly load relationships including nested ones
         result = await db.execute(
-            select(Booking)
-            .options(
-                selectinload(Booking.student),
-                selectinload(Booking.session).selectinload(TrainingSession.trainer),
-                selectinload(Booking.session).selectinload(TrainingSession.topic)
-            )
-            .where(Booking.id == db_booking.id)
+            update(TrainingSession)
+            .where(TrainingSession.id == free_seats.c.id)
+            .values(current_attendees=TrainingSession.current_attendees + free_seats.c.granted)
+            .returning(free_seats.c.granted)
         )
-        db_booking = result.scalar_one()
-        
-        return db_booking
+        return result.scalar_one_or_none() or 0
 
     @staticmethod
-    async def get_bookings_by_student(db: AsyncSession, student_id: UUID) -> List[Booking]:
-        result = await db.execute(
-            select(Booking)
-            .options(
-                selectinload(Booking.student),
-                selectinload(Booking.session).selectinload(TrainingSession.trainer),
-                selectinload(Booking.session).selectinload(TrainingSession.topic)
-            )
-            .where(Booking.student_id == student_id)
+    async def _release_seats(db: AsyncSession, session_id: UUID, seat_slots: int, seats: int) -> None:
+        """Give back seats taken with :meth:`_take_seats`."""
+        if seat_slots:
+            await SeatCounterService.restripe(db, session_id, taken_delta=-seats)
+            return
+        await db.execute(
+            update(TrainingSession)
+            .where(TrainingSession.id == session_id)
+            .values(current_attendees=TrainingSession.current_attendees - seats)
         )
-        return result.scalars().all()
 
     @staticmethod
-    async def get_bookings_by_session(db: AsyncSession, session_id: UUID) -> List[Booking]:
-        result = await db.execute(
-            select(Booking)
-            .options(
-                selectinload(Booking.student),
-                selectinload(Booking.session).selectinload(TrainingSession.trainer),
-                selectinload(Booking.session).selectinload(TrainingSession.topic)
-            )
-            .where(Booking.session_id == session_id)
-        )
-        return result.scalars().all()
+    async def get_bookings_by_student(
+        db: AsyncSession,
+        student_id: UUID,
+        shape: Projection = Projection()
+    ) -> List[BookingRow]:
+        stmt, embed = _joined_bookings(shape)
+        result = await db.execute(stmt.where(Booking.student_id == student_id))
+        return [BookingRow.from_joined(row, embed) for row in result]
+
+    @staticmethod
+    async def get_bookings_by_session(
+        db: AsyncSession,
+        session_id: UUID,
+        shape: Projection = Projection()
+    ) -> List[BookingRow]:
+        stmt, embed = _joined_bookings(shape)
+        result = await db.execute(stmt.where(Booking.session_id == session_id))
+        return [BookingRow.from_joined(row, embed) for row in result]
 
     @staticmethod
     async def delete_booking(db: AsyncSession, booking_id: UUID) -> bool:
-        result = await db.execute(select(Booking).where(Booking.id == booking_id))
-        db_booking = result.scalars().first()
-        if not db_booking:
+        # Delete the booking and release its seat in one statement:
+        # DELETE ... RETURNING session_id feeds the decrement, which runs
+        # under the session row lock so concurrent cancellations never lose
+        # an update. Striped sessions release a seat of their fullest slot
+        # instead, keeping the free seats spread across slots.
+        cancelled = (
+            delete(Booking)
+            .where(Booking.id == booking_id)
+            .returning(Booking.id, Booking.session_id, Booking.student_id)
+            .cte("cancelled")
+        )
+        released_row = (
+            update(TrainingSession)
+            .where(TrainingSession.id == cancelled.c.session_id, TrainingSession.seat_slots == 0)
+            .values(current_attendees=func.greatest(TrainingSession.current_attendees - 1, 0))
+            .returning(TrainingSession.id)
+            .cte("released_row")
+        )
+        slot = aliased(SessionSeatSlot)
+        fullest_slot = (
+            select(slot.slot)
+            .join(cancelled, slot.session_id == cancelled.c.session_id)
+            .where(slot.taken > 0)
+            .order_by(slot.taken.desc(), slot.slot)
+            .limit(1)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        released_slot = (
+            update(SessionSeatSlot)
+            .where(
+                SessionSeatSlot.session_id == cancelled.c.session_id,
+                SessionSeatSlot.slot == fullest_slot,
+                SessionSeatSlot.taken > 0,
+            )
+            .values(taken=SessionSeatSlot.taken - 1)
+            .returning(SessionSeatSlot.session_id)
+            .cte("released_slot")
+        )
+        result = await db.execute(
+            select(TrainingSession.id, TrainingSession.title, cancelled.c.student_id)
+            .join(cancelled, cancelled.c.session_id == TrainingSession.id)
+            .add_cte(
+                released_row,
+                released_slot,
+                ChangeLogService.record_from(
+                    select(literal(BOOKING), cancelled.c.id, literal(DELETE), cancelled.c.student_id)
+                ).cte("logged")
+            )
+        )
+        session = result.first()
+        if not session:
+            await db.rollback()
             return False
-        
-        # Decrement current_attendees in session
-        session_result = await db.execute(select(TrainingSession).where(TrainingSession.id == db_booking.session_id))
-        session = session_result.scalars().first()
-        if session and session.current_attendees > 0:
-            session.current_attendees -= 1
-            db.add(session)
-
-        await db.delete(db_booking)
+
+        # Hand the freed seat to the head of the waitlist in the same transaction
+        promoted_id = await BookingService.promote_from_waitlist(db, session.id)
+
+        await SeatAvailabilityService.publish(db, session.id)
+        await ChangeLogService.record(db, [(SESSION, session.id, UPSERT, None)])
         await db.commit()
+        await response_cache.invalidate(SESSIONS)
+
+        notification_dispatcher.publish(NotificationEvent(
+            "booking",
+            f"Your booking for session '{session.title}' was cancelled",
+            user_ids=(session.student_id,)
+        ))
+        if promoted_id:
+            notification_dispatcher.publish(NotificationEvent(
+                "booking",
+                f"A seat opened up: you are now booked for session '{session.title}'",
+                user_ids=(promoted_id,)
+            ))
         return True
 
+    @staticmethod
+    async def promote_from_waitlist(db: AsyncSession, session_id: UUID) -> Optional[UUID]:
+        """Move the oldest waitlist entry of a session into a booking.
+
+        The head is claimed with ``FOR UPDATE SKIP LOCKED``, so concurrent
+        cancellations promote different students instead of queueing on the
+        same row. The seat is taken with the regular conditional reservation
+        inside a savepoint; entries that can no longer be booked (already
+        booked, clashing with another booking) are dropped and the next one
+        is tried. The caller is responsible for committing.
+
+        Args:
+            db: Database session
+            session_id: Session that has a free seat
+
+        Returns:
+            The promoted student's ID, or None if nobody was promoted
+        """
+        for _ in range(WAITLIST_PROMOTION_ATTEMPTS):
+            result = await db.execute(
+                select(WaitlistEntry.id, WaitlistEntry.student_id)
+                .where(WaitlistEntry.session_id == session_id)
+                .order_by(WaitlistEntry.created_at, WaitlistEntry.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            head = result.first()
+            if head is None:
+                return None
+
+            try:
+                async with db.begin_nested():
+                    result = await db.execute(
+                        BookingService._reserve_and_book(session_id, head.student_id, uuid.uuid4())
+                    )
+                    booking_id = result.scalar_one_or_none()
+            except IntegrityError:
+                await db.execute(delete(WaitlistEntry).where(WaitlistEntry.id == head.id))
+                continue
+
+            if booking_id is None:
+                # The seat went to a direct booker or the session is no longer bookable
+                return None
+
+            await db.execute(delete(WaitlistEntry).where(WaitlistEntry.id == head.id))
+            await ChangeLogService.record(db, [(BOOKING, booking_id, UPSERT, head.student_id)])
+            return head.student_id
+        return None
+
+    @staticmethod
+    async def reconcile_attendee_counts(db: AsyncSession) -> List[dict]:
+        """Correct ``current_attendees`` of bookable sessions that drifted from bookings.
+
+        One ``UPDATE ... FROM`` over per-session booking counts writes only
+        the rows that differ. The statement runs under REPEATABLE READ, so a
+        booking or cancellation that commits while it runs aborts the
+        reconciliation with a serialization error instead of letting a
+        stale count overwrite a fresh one; the next run simply retries.
+        Striped sessions that drifted get their slots restriped to the
+        actual count. The caller is responsible for committing.
+
+        Args:
+            db: Database session, with no transaction started yet
+
+        Returns:
+            One dict per corrected session with session_id, recorded and actual
+        """
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        counts = (
+            select(
+                TrainingSession.id.label("session_id"),
+                TrainingSession.current_attendees.label("recorded"),
+                func.count(Booking.id).label("actual")
+            )
+            .outerjoin(Booking, Booking.session_id == TrainingSession.id)
+            .where(TrainingSession.status.in_(BOOKABLE_STATUSES), TrainingSession.seat_slots == 0)
+            .group_by(TrainingSession.id)
+            .subquery("counts")
+        )
+        result = await db.execute(
+            update(TrainingSession)
+            .where(
+                TrainingSession.id == counts.c.session_id,
+                TrainingSession.current_attendees != counts.c.actual
+            )
+            .values(current_attendees=counts.c.actual)
+            .returning(counts.c.session_id, counts.c.recorded, counts.c.actual)
+            .execution_options(synchronize_session=False)
+        )
+        corrected = [dict(row._mapping) for row in result]
+
+        actual = (
+            select(func.count())
+            .where(Booking.session_id == TrainingSession.id)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            select(
+                TrainingSession.id.label("session_id"),
+                TrainingSession.seats_taken.label("recorded"),
+                actual.label("actual")
+            )
+            .where(
+                TrainingSession.status.in_(BOOKABLE_STATUSES),
+                TrainingSession.seat_slots > 0,
+                TrainingSession.seats_taken != actual
+            )
+        )
+        for row in result.all():
+            await SeatCounterService.restripe(
+                db, row.session_id, taken_delta=row.actual - row.recorded, clamp=False
+            )
+            corrected.append(dict(row._mapping))
+
+        await ChangeLogService.record(db, [(SESSION, drift["session_id"], UPSERT, None) for drift in corrected])
+        return corrected
+
     @staticmethod
     async def get_booking_by_id(db: AsyncSession, booking_id: UUID) -> Optional[Booking]:
         result = await db.execute(select(Booking).where(Booking.id == booking_id))
@@ -169,6 +815,7 @@ class BookingService:
         
         booking.attended = attended
         db.add(booking)
+        await ChangeLogService.record(db, [(BOOKING, booking.id, UPSERT, booking.student_id)])
         await db.commit()
         await db.refresh(booking)
         return booking
@@ -182,57 +829,69 @@ class BookingService:
         booking.feedback = feedback
         booking.rating = rating
         db.add(booking)
+        await ChangeLogService.record(db, [(BOOKING, booking.id, UPSERT, booking.student_id)])
         await db.commit()
         await db.refresh(booking)
         return booking
 
     @staticmethod
     async def check_prerequisites(db: AsyncSession, session_id: UUID, student_id: UUID):
-        """Check if student meets prerequisites for the session's topic."""
-        # Get session topic
-        result = await db.execute(select(TrainingSession).where(TrainingSession.id == session_id))
-        session = result.scalars().first()
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-            
-        # Get topic prerequisites
-        # We need to load prerequisites relationship or query it
-        # Assuming Topic model has 'prerequisites' relationship loaded or we query it
-        # Let's query TopicPrerequisite directly or join
-        
-        # Fetch topic with prerequisites
-        stmt = select(Topic).where(Topic.id == session.topic_id)
-        # We might need to use selectinload if lazy loading is issue, but let's try direct access if loaded
-        # Or better, query TopicPrerequisite
-        
-        # Find all prerequisite topic IDs for this topic
-        prereq_result = await db.execute(
-            select(TopicPrerequisite.prerequisite_id)
-            .where(TopicPrerequisite.topic_id == session.topic_id)
-        )
-        prereq_ids = prereq_result.scalars().all()
-        
-        if not prereq_ids:
-            return
-            
-        # Check which of these the student has completed
-        completed_result = await db.execute(
-            select(Studenttopic.topic_id)
+        """Check if student meets prerequisites for the session's topic.
+
+        Resolves the session's topic, its prerequisites and the student's
+        completed topics in a single query that returns only the names of
+        the prerequisites still missing. An unknown session has no missing
+        prerequisites; the caller reports it as not found.
+
+        Direct prerequisites are required by default; with
+        ENFORCE_TRANSITIVE_PREREQUISITES every prerequisite in the closure is.
+        """
+        if settings.ENFORCE_TRANSITIVE_PREREQUISITES:
+            edges = TopicPrerequisiteClosure
+            required_id, dependent_id = edges.ancestor_id, edges.descendant_id
+        else:
+            edges = TopicPrerequisite
+            required_id, dependent_id = edges.prerequisite_id, edges.topic_id
+
+        missing_topics_result = await db.execute(
+            select(Topic.name)
+            .join(edges, required_id == Topic.id)
+            .join(TrainingSession, TrainingSession.topic_id == dependent_id)
             .where(
-                Studenttopic.student_id == student_id,
-                Studenttopic.topic_id.in_(prereq_ids)
+                TrainingSession.id == session_id,
+                ~exists().where(
+                    Studenttopic.student_id == student_id,
+                    Studenttopic.topic_id == required_id
+                )
             )
         )
-        completed_ids = completed_result.scalars().all()
-        
-        # Compare
-        missing_prereqs = set(prereq_ids) - set(completed_ids)
-        
-        if missing_prereqs:
-            # Get names of missing topics for better error message
-            missing_topics_result = await db.execute(select(Topic.name).where(Topic.id.in_(missing_prereqs)))
-            missing_names = missing_topics_result.scalars().all()
+        missing_names = missing_topics_result.scalars().all()
+
+        if missing_names:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Prerequisites not met. Missing topics: {', '.join(missing_names)}"
             )
+
+
+async def reconcile_attendee_counts() -> int:
+    """Repair drifted attendee counters and report each correction."""
+    async with AsyncSessionLocal() as db:
+        corrected = await BookingService.reconcile_attendee_counts(db)
+        await db.commit()
+    for drift in corrected:
+        logger.warning(
+            f"Corrected current_attendees of session {drift['session_id']}: "
+            f"{drift['recorded']} -> {drift['actual']}"
+        )
+    if corrected:
+        await response_cache.invalidate(SESSIONS)
+    return len(corrected)
+
+
+# Attendee counter reconciler, started with the application
+attendee_reconciler = PeriodicTask(
+    "attendee-count-reconciler",
+    settings.ATTENDEE_RECONCILE_INTERVAL_SECONDS,
+    reconcile_attendee_counts,
+)
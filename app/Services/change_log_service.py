@@ -0,0 +1,289 @@
+"""Change Log Service
+
+This module records upserts and deletes of sessions, bookings, notifications
+and topics in ``change_log``, in the transaction that makes them, and serves
+them as a delta-sync feed. Feed positions are writer transaction ids: a read
+only returns transactions older than every transaction still running, so a
+later read can never reveal a change behind a position already handed out.
+A background job drops entries superseded by a newer change of the same
+entity and truncates entries past the retention window.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, insert, delete, func, literal, exists, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.sql import Select
+
+from app.DB.session import AsyncSessionLocal
+from app.Models.booking import Booking
+from app.Models.change_log import ChangeLogEntry
+from app.Models.change_log_floor import ChangeLogFloor
+from app.Models.notification import Notification
+from app.Models.session import TrainingSession
+from app.Models.topic import Topic
+from app.Schemas.booking_schema import BookingResponse
+from app.Schemas.change_schema import ChangeFeedResponse, ChangeRecord
+from app.Schemas.notification_schema import NotificationResponse
+from app.Schemas.session_schema import SessionResponse
+from app.Schemas.topic import TopicResponse
+from app.core.background import PeriodicTask
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Synced entities
+SESSION = "session"
+BOOKING = "booking"
+NOTIFICATION = "notification"
+TOPIC = "topic"
+SYNCED_ENTITIES = (SESSION, BOOKING, NOTIFICATION, TOPIC)
+
+# Change operations
+UPSERT = "upsert"
+DELETE = "delete"
+
+# (entity, entity_id, op, user_id); user_id None makes the change visible to everyone
+Change = Tuple[str, UUID, str, Optional[UUID]]
+
+
+def _snapshot_xmin():
+    """Oldest transaction still running when the statement's snapshot was taken."""
+    return func.txid_snapshot_xmin(func.txid_current_snapshot())
+
+
+def _current_rows(entity: str, ids: Sequence[UUID]):
+    """Select the live rows of a synced entity, with the response schema to serialize them."""
+    if entity == SESSION:
+        stmt = (
+            select(TrainingSession)
+            .options(selectinload(TrainingSession.trainer), selectinload(TrainingSession.topic))
+            .where(TrainingSession.id.in_(ids), TrainingSession.deleted_at.is_(None))
+        )
+        return stmt, SessionResponse
+    if entity == BOOKING:
+        stmt = (
+            select(Booking)
+            .options(
+                selectinload(Booking.student),
+                selectinload(Booking.session).selectinload(TrainingSession.trainer),
+                selectinload(Booking.session).selectinload(TrainingSession.topic)
+            )
+            .where(Booking.id.in_(ids))
+        )
+        return stmt, BookingResponse
+    if entity == NOTIFICATION:
+        return select(Notification).where(Notification.id.in_(ids)), NotificationResponse
+    return select(Topic).where(Topic.id.in_(ids), Topic.deleted_at.is_(None)), TopicResponse
+
+
+class ChangeLogService:
+    """Service for recording and reading the change feed."""
+
+    @staticmethod
+    async def record(db: AsyncSession, changes: Sequence[Change]) -> None:
+        """Log changes with one multi-row INSERT. The caller is responsible for committing.
+
+        Args:
+            db: Database session
+            changes: (entity, entity_id, op, user_id) tuples
+        """
+        if not changes:
+            return
+        await db.execute(
+            insert(ChangeLogEntry).values([
+                {"entity": entity, "entity_id": entity_id, "op": op, "user_id": user_id}
+                for entity, entity_id, op, user_id in changes
+            ])
+        )
+
+    @staticmethod
+    def record_from(rows: Select):
+        """Build an ``INSERT ... SELECT`` logging changes, for use as a CTE.
+
+        Args:
+            rows: Select of (entity, entity_id, op, user_id) columns
+
+        Example:
+            >>> deleted = delete(Notification).where(...).returning(Notification.id, Notification.user_id).cte()
+            >>> logged = ChangeLogService.record_from(
+            >>>     select(literal(NOTIFICATION), deleted.c.id, literal(DELETE), deleted.c.user_id)
+            >>> ).cte("logged")
+        """
+        return (
+            insert(ChangeLogEntry)
+            .from_select(["entity", "entity_id", "op", "user_id"], rows)
+            .returning(ChangeLogEntry.seq)
+        )
+
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession,
+        user_id: UUID,
+        since: Optional[int],
+        entities: Sequence[str] = SYNCED_ENTITIES,
+        limit: int = 100
+    ) -> ChangeFeedResponse:
+        """Return the changes visible to a user after a feed position.
+
+        Changes are compacted to the latest one per entity; upserts carry the
+        entity's current representation, and entities that no longer exist
+        are reported as deleted. Without ``since`` no changes are returned,
+        only the current position to load the full listings against.
+
+        Args:
+            db: Database session
+            user_id: Requesting user
+            since: ``next_since`` of the previous response
+            entities: Entities to include
+            limit: Maximum number of writer transactions to cover
+
+        Returns:
+            The changes, the position to pass as ``since`` next and whether
+            more changes are already available, built from validated data
+
+        Raises:
+            HTTPException: 410 if changes after ``since`` were dropped by retention
+        """
+        result = await db.execute(
+            select(_snapshot_xmin(), select(ChangeLogFloor.txid).scalar_subquery())
+        )
+        xmin, floor = result.one()
+        settled = xmin - 1
+        if since is None:
+            return ChangeFeedResponse.model_construct(changes=[], next_since=settled, has_more=False)
+        if since < (floor or 0):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Change feed position expired; reload and sync from the returned position"
+            )
+
+        visible = (
+            ChangeLogEntry.txid > since,
+            ChangeLogEntry.txid < xmin,
+            or_(ChangeLogEntry.user_id.is_(None), ChangeLogEntry.user_id == user_id),
+            ChangeLogEntry.entity.in_(entities),
+        )
+        result = await db.execute(
+            select(ChangeLogEntry.txid)
+            .where(*visible)
+            .group_by(ChangeLogEntry.txid)
+            .order_by(ChangeLogEntry.txid)
+            .limit(limit + 1)
+        )
+        txids = result.scalars().all()
+        has_more = len(txids) > limit
+        if not txids:
+            return ChangeFeedResponse.model_construct(changes=[], next_since=max(since, settled), has_more=False)
+        last = txids[min(len(txids), limit) - 1]
+
+        result = await db.execute(
+            select(ChangeLogEntry)
+            .where(*visible, ChangeLogEntry.txid <= last)
+            .order_by(ChangeLogEntry.txid, ChangeLogEntry.seq)
+        )
+        latest: Dict[Tuple[str, UUID], ChangeLogEntry] = {}
+        for entry in result.scalars():
+            latest.pop((entry.entity, entry.entity_id), None)
+            latest[(entry.entity, entry.entity_id)] = entry
+
+        upserted: Dict[str, List[UUID]] = {}
+        for entity, entity_id in latest:
+            if latest[(entity, entity_id)].op == UPSERT:
+                upserted.setdefault(entity, []).append(entity_id)
+        current = {}
+        for entity, ids in upserted.items():
+            stmt, schema = _current_rows(entity, ids)
+            result = await db.execute(stmt)
+            for row in result.scalars():
+                current[(entity, row.id)] = schema.model_validate(row)
+
+        changes = []
+        for key, entry in latest.items():
+            data = current.get(key) if entry.op == UPSERT else None
+            changes.append(ChangeRecord.model_construct(
+                seq=entry.seq,
+                entity=entry.entity,
+                id=entry.entity_id,
+                op=UPSERT if data is not None else DELETE,
+                data=data,
+            ))
+        return ChangeFeedResponse.model_construct(
+            changes=changes,
+            next_since=last if has_more else max(since, settled),
+            has_more=has_more,
+        )
+
+    @staticmethod
+    async def compact(db: AsyncSession, retention_seconds: int) -> Tuple[int, int]:
+        """Drop superseded entries and entries past retention.
+
+        An entry followed by a newer change of the same entity is redundant
+        for every reader, so it is removed without affecting any position.
+        Entries older than the retention window are removed and the floor is
+        raised to the newest transaction removed. The caller is responsible
+        for committing.
+
+        Args:
+            db: Database session
+            retention_seconds: Age after which entries are dropped
+
+        Returns:
+            Number of superseded and of expired entries removed
+        """
+        newer = aliased(ChangeLogEntry)
+        result = await db.execute(
+            delete(ChangeLogEntry).where(
+                exists().where(
+                    newer.entity == ChangeLogEntry.entity,
+                    newer.entity_id == ChangeLogEntry.entity_id,
+                    newer.txid > ChangeLogEntry.txid,
+                )
+            )
+        )
+        superseded = result.rowcount
+
+        expired = (
+            delete(ChangeLogEntry)
+            .where(ChangeLogEntry.created_at < datetime.utcnow() - timedelta(seconds=retention_seconds))
+            .returning(ChangeLogEntry.txid)
+            .cte("expired")
+        )
+        raised = pg_insert(ChangeLogFloor).from_select(
+            ["id", "txid"],
+            select(literal(1), func.max(expired.c.txid)).having(func.count() > 0)
+        )
+        raised = raised.on_conflict_do_update(
+            index_elements=[ChangeLogFloor.id],
+            set_={
+                "txid": func.greatest(ChangeLogFloor.txid, raised.excluded.txid),
+                "updated_at": func.now(),
+            }
+        )
+        result = await db.execute(
+            select(func.count()).select_from(expired).add_cte(raised.returning(ChangeLogFloor.id).cte("raised"))
+        )
+        return superseded, result.scalar_one()
+
+
+async def compact_change_log() -> int:
+    """Compact the change log and report how many entries were removed."""
+    async with AsyncSessionLocal() as db:
+        superseded, expired = await ChangeLogService.compact(db, settings.CHANGE_LOG_RETENTION_SECONDS)
+        await db.commit()
+    if superseded or expired:
+        logger.info(f"Compacted change log: {superseded} superseded, {expired} expired entries removed")
+    return superseded + expired
+
+
+# Change log compactor, started with the application
+change_log_compactor = PeriodicTask(
+    "change-log-compactor",
+    settings.CHANGE_LOG_COMPACT_INTERVAL_SECONDS,
+    compact_change_log,
+)
@@ -0,0 +1,188 @@
+"""Export Service
+
+This module streams reporting exports of bookings, sessions and attendance
+as NDJSON or CSV. Each export runs on its own database session through a
+server-side cursor fetched ``EXPORT_YIELD_PER`` rows at a time, and every
+batch is encoded and handed to the client before the next one is read, so
+memory stays flat however many rows are exported.
+"""
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import select, func, case, cast, Float
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Select
+
+from app.DB.session import AsyncSessionLocal
+from app.Models.booking import Booking
+from app.Models.session import TrainingSession
+from app.Models.topic import Topic
+from app.Models.user import User
+from app.Services.session_service import _naive_utc
+from app.core.config import settings
+from app.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+MEDIA_TYPES = {NDJSON: "application/x-ndjson", CSV: "text/csv"}
+
+
+def _in_window(
+    stmt: Select,
+    start_from: Optional[datetime],
+    start_to: Optional[datetime],
+    topic_id: Optional[UUID]
+) -> Select:
+    """Restrict an export to live sessions starting in a window, optionally of one topic."""
+    stmt = stmt.where(TrainingSession.deleted_at.is_(None))
+    if start_from is not None:
+        stmt = stmt.where(TrainingSession.start_time >= _naive_utc(start_from))
+    if start_to is not None:
+        stmt = stmt.where(TrainingSession.start_time < _naive_utc(start_to))
+    if topic_id is not None:
+        stmt = stmt.where(TrainingSession.topic_id == topic_id)
+    return stmt
+
+
+class ExportService:
+    """Service for building and streaming reporting exports."""
+
+    @staticmethod
+    def bookings_query(
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        topic_id: Optional[UUID] = None
+    ) -> Select:
+        """One row per booking with its session, topic, student, attendance and feedback."""
+        student = aliased(User)
+        stmt = (
+            select(
+                Booking.id.label("booking_id"),
+                TrainingSession.id.label("session_id"),
+                TrainingSession.title.label("session_title"),
+                TrainingSession.start_time.label("session_start"),
+                Topic.id.label("topic_id"),
+                Topic.name.label("topic_name"),
+                student.id.label("student_id"),
+                student.name.label("student_name"),
+                student.email.label("student_email"),
+                Booking.attended,
+                Booking.rating,
+                Booking.feedback,
+                Booking.created_at.label("booked_at"),
+            )
+            .select_from(Booking)
+            .join(TrainingSession, TrainingSession.id == Booking.session_id)
+            .join(Topic, Topic.id == TrainingSession.topic_id)
+            .join(student, student.id == Booking.student_id)
+            .order_by(TrainingSession.start_time, TrainingSession.id, Booking.created_at)
+        )
+        return _in_window(stmt, start_from, start_to, topic_id)
+
+    @staticmethod
+    def sessions_query(
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        topic_id: Optional[UUID] = None
+    ) -> Select:
+        """One row per session with its topic, trainer and seat counts."""
+        stmt = (
+            select(
+                TrainingSession.id.label("session_id"),
+                TrainingSession.title,
+                Topic.id.label("topic_id"),
+                Topic.name.label("topic_name"),
+                User.id.label("trainer_id"),
+                User.name.label("trainer_name"),
+                TrainingSession.start_time,
+                TrainingSession.duration_minutes,
+                TrainingSession.status,
+                TrainingSession.capacity,
+                TrainingSession.seats_taken.label("booked"),
+                TrainingSession.seats_held.label("held"),
+                TrainingSession.created_at,
+            )
+            .select_from(TrainingSession)
+            .join(Topic, Topic.id == TrainingSession.topic_id)
+            .join(User, User.id == TrainingSession.trainer_id)
+            .order_by(TrainingSession.start_time, TrainingSession.id)
+        )
+        return _in_window(stmt, start_from, start_to, topic_id)
+
+    @staticmethod
+    def attendance_query(
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        topic_id: Optional[UUID] = None
+    ) -> Select:
+        """One row per session with its booking, attendance and rating totals."""
+        stmt = (
+            select(
+                TrainingSession.id.label("session_id"),
+                TrainingSession.title,
+                Topic.id.label("topic_id"),
+                Topic.name.label("topic_name"),
+                TrainingSession.start_time,
+                TrainingSession.status,
+                func.count(Booking.id).label("booked"),
+                func.count(Booking.id).filter(Booking.attended).label("attended"),
+                cast(
+                    func.round(func.avg(case((Booking.attended, 1), else_=0)) * 100, 1), Float
+                ).label("attendance_percent"),
+                func.count(Booking.feedback).label("feedback_count"),
+                cast(func.round(func.avg(Booking.rating), 2), Float).label("average_rating"),
+            )
+            .select_from(TrainingSession)
+            .join(Topic, Topic.id == TrainingSession.topic_id)
+            .outerjoin(Booking, Booking.session_id == TrainingSession.id)
+            .group_by(TrainingSession.id, Topic.id)
+            .order_by(TrainingSession.start_time, TrainingSession.id)
+        )
+        return _in_window(stmt, start_from, start_to, topic_id)
+
+    @staticmethod
+    async def stream(stmt: Select, export_format: str = NDJSON) -> AsyncIterator[bytes]:
+        """Encode the rows of an export query batch by batch.
+
+        The export opens its own database session, since it keeps reading
+        after the request's session is closed, and holds one server-side
+        cursor for its whole run. CSV output starts with the header row
+        before the query runs.
+
+        Args:
+            stmt: Export query with labelled columns
+            export_format: "ndjson" or "csv"
+
+        Yields:
+            Encoded chunks of up to EXPORT_YIELD_PER rows
+        """
+        columns = [column.name for column in stmt.selected_columns]
+        if export_format == CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue().encode("utf-8")
+
+        exported = 0
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(stmt.execution_options(yield_per=settings.EXPORT_YIELD_PER))
+            async for rows in result.partitions():
+                if export_format == CSV:
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows(
+                        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+                        for row in rows
+                    )
+                    yield buffer.getvalue().encode("utf-8")
+                else:
+                    yield b"".join(dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+                exported += len(rows)
+        logger.info(f"Exported {exported} rows as {export_format}")
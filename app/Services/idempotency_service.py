@@ -0,0 +1,254 @@
+"""Idempotency Service
+
+This module implements ``Idempotency-Key`` support for create endpoints. The
+first request with a key claims a row in ``idempotency_keys`` on the
+endpoint's own connection, runs the endpoint and stores its response, all
+in one transaction. Concurrent duplicates wait on the claimed row and then
+replay the stored response without touching the underlying services; a
+crash before the commit leaves neither the write nor the key behind.
+"""
+import functools
+import hashlib
+import inspect
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.DB.session import AsyncSessionLocal
+from app.Models.idempotency_key import IdempotencyKey
+from app.Models.user import User
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.core.serialization import dumps, serializer
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Keyword argument the idempotency wrapper adds to endpoint signatures
+_REQUEST_PARAM = "idempotency_request"
+
+
+class IdempotencyService:
+    """Service for claiming, completing and sweeping idempotency keys."""
+
+    @staticmethod
+    async def claim(
+        db: AsyncSession,
+        user_id: UUID,
+        key: str,
+        request_hash: str
+    ) -> Optional[IdempotencyKey]:
+        """Claim a key for a new execution, or return the stored outcome.
+
+        A new (or expired) key is inserted without committing, so the row
+        stays locked until the caller commits the write together with the
+        response stored by :meth:`complete`. If another request holds the key,
+        the insert waits for its transaction and the stored row is returned.
+
+        Args:
+            db: The endpoint's database session
+            user_id: Requesting user
+            key: Client supplied idempotency key
+            request_hash: Fingerprint of the request
+
+        Returns:
+            None if the caller now owns the key, else the stored record
+        """
+        now = datetime.utcnow()
+        stmt = insert(IdempotencyKey).values(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            created_at=now,
+            expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "status_code": None,
+                "response_body": None,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at < now
+        ).returning(IdempotencyKey.key)
+
+        result = await db.execute(stmt)
+        if result.first() is not None:
+            return None
+
+        result = await db.execute(
+            select(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key
+            )
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    async def complete(
+        db: AsyncSession,
+        user_id: UUID,
+        key: str,
+        status_code: int,
+        body: bytes
+    ) -> None:
+        """Store the response of a claimed key; the caller commits it."""
+        result = await db.execute(
+            select(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key
+            )
+        )
+        record = result.scalar_one()
+        record.status_code = status_code
+        record.response_body = body
+        await db.flush()
+
+    @staticmethod
+    async def sweep_expired(db: AsyncSession) -> int:
+        """Delete expired keys in one statement.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of keys removed
+        """
+        result = await db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at < datetime.utcnow())
+        )
+        await db.commit()
+        return result.rowcount
+
+
+def _json_response(status_code: int, body: bytes, replayed: bool = False) -> Response:
+    response = Response(content=body, status_code=status_code, media_type="application/json")
+    if replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+
+def idempotent(
+    response_model: Any,
+    status_code: int = status.HTTP_200_OK,
+    invalidates: Sequence[str] = ()
+):
+    """Decorate an authenticated create endpoint with Idempotency-Key support.
+
+    Requests without the header run unchanged. With it, the first request
+    runs the endpoint and stores its response (including 4xx errors); retries
+    with the same key and payload replay that response, and reusing a key
+    for a different payload is rejected with 422. Server errors are not
+    stored, so the key can be retried.
+
+    The endpoint gets a session joined to the claim's transaction, where the
+    services' commits only release savepoints; the key, the write and the
+    response are committed once at the end. Services bump response cache
+    namespaces at their inner commits, so the namespaces in ``invalidates``
+    are bumped again once the write is actually visible.
+
+    Example:
+        >>> @bookings_router.post("/", response_model=BookingResponse, status_code=201)
+        >>> @idempotent(BookingResponse, status_code=201, invalidates=(SESSIONS,))
+        >>> async def book_session(..., current_user: User = Depends(get_current_user)):
+        >>>     ...
+    """
+    compiled = serializer(response_model)
+
+    def decorator(endpoint):
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.pop(_REQUEST_PARAM)
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return await endpoint(*args, **kwargs)
+            if len(key) > 255:
+                raise HTTPException(status_code=400, detail=f"{IDEMPOTENCY_HEADER} is too long")
+
+            user = next(arg for arg in kwargs.values() if isinstance(arg, User))
+            fingerprint = hashlib.sha256()
+            for part in (request.method.encode(), request.url.path.encode(), await request.body()):
+                fingerprint.update(part)
+                fingerprint.update(b"\0")
+            request_hash = fingerprint.hexdigest()
+
+            db_param = next(name for name, arg in kwargs.items() if isinstance(arg, AsyncSession))
+            db: AsyncSession = kwargs[db_param]
+            record = await IdempotencyService.claim(db, user.id, key, request_hash)
+            if record is not None:
+                stored = (record.request_hash, record.status_code, record.response_body)
+                await db.rollback()
+                if stored[0] != request_hash:
+                    raise HTTPException(
+                        status_code=422,
+                        detail=f"{IDEMPOTENCY_HEADER} was already used for a different request"
+                    )
+                return _json_response(stored[1], stored[2], replayed=True)
+
+            # Service commits and rollbacks only touch savepoints of the claim's transaction
+            write_db = AsyncSession(
+                bind=await db.connection(),
+                join_transaction_mode="create_savepoint",
+                expire_on_commit=False
+            )
+            kwargs[db_param] = write_db
+            try:
+                result = await endpoint(*args, **kwargs)
+                body = compiled.validate_json(result)
+            except HTTPException as e:
+                # Closing rolls back the write's open savepoint
+                await write_db.close()
+                if e.status_code >= 500:
+                    await db.rollback()
+                    raise
+                await IdempotencyService.complete(db, user.id, key, e.status_code, dumps({"detail": e.detail}))
+                await db.commit()
+                raise
+            except Exception:
+                await write_db.close()
+                await db.rollback()
+                raise
+
+            await write_db.close()
+            await IdempotencyService.complete(db, user.id, key, status_code, body)
+            await db.commit()
+            await response_cache.invalidate(*invalidates)
+            return _json_response(status_code, body)
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
+        return wrapper
+
+    return decorator
+
+
+async def sweep_expired_keys() -> int:
+    """Remove expired idempotency keys."""
+    async with AsyncSessionLocal() as db:
+        removed = await IdempotencyService.sweep_expired(db)
+    if removed:
+        logger.info(f"Swept {removed} expired idempotency keys")
+    return removed
+
+
+# Expired key sweeper, started with the application
+idempotency_sweeper = PeriodicTask(
+    "idempotency-key-sweeper",
+    settings.IDEMPOTENCY_SWEEP_INTERVAL_SECONDS,
+    sweep_expired_keys,
+)
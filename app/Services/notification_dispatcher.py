@@ -0,0 +1,172 @@
+"""Notification Dispatcher
+
+This module queues notification events raised by booking and session writes
+and persists them from a background worker. Events arriving close together
+are coalesced, so a burst of bookings costs one multi-row INSERT and a burst
+of session updates one INSERT ... SELECT over their bookers. The periodic
+reminder and unread-counter reconciliation jobs live here as well.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.DB.session import AsyncSessionLocal
+from app.Services.notification_service import NotificationService
+from app.core.background import PeriodicTask
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NotificationEvent:
+    """A notification to deliver after the triggering write has committed.
+
+    Recipients are either the explicit ``user_ids`` or, when ``session_id``
+    is set, every student booked on that session at write time.
+    """
+    type: str
+    message: str
+    user_ids: Tuple[UUID, ...] = ()
+    session_id: Optional[UUID] = None
+
+
+class NotificationDispatcher:
+    """In-process queue of notification events drained by one worker task.
+
+    Example:
+        >>> notification_dispatcher.publish(
+        >>>     NotificationEvent("booking", "Booked 'Graphs'", user_ids=(student_id,))
+        >>> )
+    """
+
+    def __init__(self, max_queue_size: int, batch_size: int, flush_interval_seconds: float):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.written = 0
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, event: NotificationEvent) -> None:
+        """Queue an event without waiting; drops it if the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Notification queue full, dropped {event.type} event")
+
+    def start(self) -> None:
+        """Start the worker on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-dispatcher")
+
+    async def stop(self) -> None:
+        """Flush queued events and stop the worker."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and delivery counters."""
+        return {
+            "running": self._task is not None,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            event = await self._queue.get()
+            if event is None:
+                break
+
+            # Coalesce whatever arrives within the flush interval
+            batch = [event]
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            await self._write(batch)
+
+    async def _write(self, batch: List[NotificationEvent]) -> None:
+        rows = [
+            (user_id, event.type, event.message)
+            for event in batch if event.session_id is None
+            for user_id in event.user_ids
+        ]
+        session_events = [
+            (event.session_id, event.type, event.message)
+            for event in batch if event.session_id is not None
+        ]
+        try:
+            async with AsyncSessionLocal() as db:
+                written = await NotificationService.create_notifications(db, rows)
+                written += await NotificationService.notify_session_bookers(db, session_events)
+                await db.commit()
+            self.written += written
+        except Exception as e:
+            self.dropped += len(batch)
+            logger.error(f"Failed to write {len(batch)} notification events: {e}", exc_info=True)
+
+
+async def send_due_reminders() -> int:
+    """Create reminders for sessions starting within the configured lead time."""
+    async with AsyncSessionLocal() as db:
+        created = await NotificationService.create_due_reminders(
+            db, settings.NOTIFICATION_REMINDER_LEAD_MINUTES
+        )
+        await db.commit()
+    if created:
+        logger.info(f"Sent {created} session reminders")
+    return created
+
+
+async def reconcile_unread_counters() -> int:
+    """Repair drifted unread counters and report how many were off."""
+    async with AsyncSessionLocal() as db:
+        corrected = await NotificationService.reconcile_unread_counters(db)
+        await db.commit()
+    if corrected:
+        logger.warning(f"Corrected {corrected} drifted unread notification counters")
+    return corrected
+
+
+# Global notification dispatcher instance
+notification_dispatcher = NotificationDispatcher(
+    max_queue_size=settings.NOTIFICATION_QUEUE_MAX_SIZE,
+    batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    flush_interval_seconds=settings.NOTIFICATION_FLUSH_INTERVAL_SECONDS,
+)
+
+# Reminder scheduler, started with the application
+reminder_scheduler = PeriodicTask(
+    "session-reminders",
+    settings.NOTIFICATION_REMINDER_INTERVAL_SECONDS,
+    send_due_reminders,
+    enabled=settings.NOTIFICATION_REMINDERS_ENABLED,
+)
+
+# Unread counter reconciler, started with the application
+counter_reconciler = PeriodicTask(
+    "unread-counter-reconciler",
+    settings.NOTIFICATION_COUNTER_RECONCILE_INTERVAL_SECONDS,
+    reconcile_unread_counters,
+)
@@ -3,11 +3,20 @@
 This module handles notification management operations.
 """
 import logging
+import uuid
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, delete, insert, func, cast, column, values, literal, false, exists, String, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from app.Models.booking import Booking
 from app.Models.notification import Notification
+from app.Models.notification_counter import NotificationCounter
+from app.Models.session import TrainingSession
+from app.core.pagination import paginate
+from app.Services.read_models import NotificationRow
+from app.Services.change_log_service import ChangeLogService, NOTIFICATION, UPSERT, DELETE
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,23 +25,200 @@ class NotificationService:
     """Service for managing user notifications."""
     
     @staticmethod
-    async def get_notifications_by_user(db: AsyncSession, user_id: UUID) -> List[Notification]:
-        """Get all notifications for a user.
+    async def get_notifications_by_user(
+        db: AsyncSession,
+        user_id: UUID,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[NotificationRow]:
+        """Get notifications for a user, newest first.
         
         Args:
             db: Database session
             user_id: User UUID
+            skip: Number of records to skip (ignored when cursor is given)
+            limit: Maximum number of records to return, None for all
+            cursor: Keyset cursor of the previous page
             
         Returns:
-            List of notifications
+            List of notification read models
         """
+        stmt = select(*NotificationRow.columns()).where(Notification.user_id == user_id)
         result = await db.execute(
-            select(Notification)
-            .where(Notification.user_id == user_id)
-            .order_by(Notification.created_at.desc())
+            paginate(stmt, Notification.created_at, Notification.id, cursor, skip, limit)
         )
-        return result.scalars().all()
+        return [NotificationRow(*row) for row in result]
     
+    @staticmethod
+    async def create_notifications(db: AsyncSession, rows: Sequence[Tuple[UUID, str, str]]) -> int:
+        """Insert notifications with a single multi-row INSERT.
+
+        The caller is responsible for committing.
+
+        Args:
+            db: Database session
+            rows: (user_id, type, message) tuples
+
+        Returns:
+            Number of notifications created
+        """
+        if not rows:
+            return 0
+        return await NotificationService._insert_counted(
+            db,
+            insert(Notification).values([
+                {"id": uuid.uuid4(), "user_id": user_id, "type": type_, "message": message, "is_read": False}
+                for user_id, type_, message in rows
+            ])
+        )
+
+    @staticmethod
+    async def notify_session_bookers(db: AsyncSession, events: Sequence[Tuple[UUID, str, str]]) -> int:
+        """Notify every student booked on the given sessions in one statement.
+
+        Renders as ``INSERT INTO notifications SELECT ... FROM bookings JOIN
+        (VALUES ...) ON session_id``, so fanning out to a full session costs
+        one round trip regardless of its size. The caller is responsible for
+        committing.
+
+        Args:
+            db: Database session
+            events: (session_id, type, message) tuples
+
+        Returns:
+            Number of notifications created
+        """
+        if not events:
+            return 0
+        event_rows = values(
+            column("session_id", PG_UUID(as_uuid=True)),
+            column("type", String),
+            column("message", String),
+            name="events"
+        ).data(list(events))
+        return await NotificationService._insert_counted(
+            db,
+            insert(Notification).from_select(
+                ["id", "user_id", "type", "message", "is_read", "created_at"],
+                select(
+                    func.gen_random_uuid(),
+                    Booking.student_id,
+                    cast(event_rows.c.type, Notification.type.type),
+                    event_rows.c.message,
+                    false(),
+                    func.now(),
+                ).join(event_rows, event_rows.c.session_id == Booking.session_id)
+            )
+        )
+
+    @staticmethod
+    async def create_due_reminders(db: AsyncSession, lead_minutes: int) -> int:
+        """Create "session starts in N minutes" reminders for all due bookings.
+
+        Bookings of live sessions starting within ``lead_minutes`` are marked
+        as reminded and notified in one ``UPDATE ... RETURNING`` feeding an
+        ``INSERT ... SELECT``. Marking and inserting happen atomically, so
+        concurrent schedulers never remind a booking twice. The caller is
+        responsible for committing.
+
+        Args:
+            db: Database session
+            lead_minutes: How long before the start reminders are sent
+
+        Returns:
+            Number of reminders created
+        """
+        now = datetime.utcnow()
+        due = (
+            update(Booking)
+            .where(
+                Booking.session_id == TrainingSession.id,
+                Booking.reminded_at.is_(None),
+                TrainingSession.status.in_(("active", "upcoming")),
+                TrainingSession.deleted_at.is_(None),
+                TrainingSession.start_time > now,
+                TrainingSession.start_time <= now + timedelta(minutes=lead_minutes),
+            )
+            .values(reminded_at=now)
+            .returning(
+                Booking.student_id,
+                TrainingSession.title,
+                TrainingSession.start_time,
+            )
+            .cte("due")
+        )
+        minutes_left = func.ceil(
+            func.extract("epoch", due.c.start_time - literal(now)) / 60
+        ).cast(Integer)
+        return await NotificationService._insert_counted(
+            db,
+            insert(Notification).from_select(
+                ["id", "user_id", "type", "message", "is_read", "created_at"],
+                select(
+                    func.gen_random_uuid(),
+                    due.c.student_id,
+                    cast(literal("reminder"), Notification.type.type),
+                    func.concat("Session '", due.c.title, "' starts in ", minutes_left, " minutes"),
+                    false(),
+                    func.now(),
+                )
+            )
+        )
+
+    @staticmethod
+    async def _insert_counted(db: AsyncSession, stmt) -> int:
+        """Run a notification INSERT and bump the recipients' unread counters.
+
+        The INSERT becomes a CTE whose returned user ids feed an upsert into
+        notification_counters, so rows, counters and the change log change
+        in one statement. Counters are upserted in user id order to keep
+        concurrent writers from deadlocking on each other's rows.
+
+        Returns:
+            Number of notifications created
+        """
+        inserted = stmt.returning(Notification.id, Notification.user_id).cte("inserted")
+        per_user = (
+            select(inserted.c.user_id, func.count())
+            .group_by(inserted.c.user_id)
+            .order_by(inserted.c.user_id)
+        )
+        bump = pg_insert(NotificationCounter).from_select(["user_id", "unread_count"], per_user)
+        bump = bump.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={
+                "unread_count": NotificationCounter.unread_count + bump.excluded.unread_count,
+                "updated_at": func.now(),
+            }
+        )
+        result = await db.execute(
+            select(func.count()).select_from(inserted).add_cte(
+                bump.cte("bumped"),
+                NotificationService._log_changes(inserted, UPSERT)
+            )
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    def _log_changes(rows, op: str):
+        """Build the change log CTE for notifications returned by a DML CTE."""
+        return ChangeLogService.record_from(
+            select(literal(NOTIFICATION), rows.c.id, literal(op), rows.c.user_id)
+        ).cte(f"logged_{rows.name}")
+
+    @staticmethod
+    def _decrement_unread(user_id, amount):
+        """Build an UPDATE lowering a user's unread counter, never below zero."""
+        return (
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(
+                unread_count=func.greatest(NotificationCounter.unread_count - amount, 0),
+                updated_at=func.now()
+            )
+        )
+
     @staticmethod
     async def get_notification_by_id(db: AsyncSession, notification_id: UUID) -> Optional[Notification]:
         """Get a notification by ID.
@@ -58,14 +244,23 @@ class NotificationService:
         Returns:
             Updated notification if found, None otherwise
         """
-        result = await db.execute(select(Notification).where(Notification.id == notification_id))
-        notification = result.scalars().first()
+        # Flip the flag and decrement the counter only if it was unread
+        marked = (
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.is_read == False)
+            .values(is_read=True)
+            .returning(Notification.id, Notification.user_id)
+            .cte("marked")
+        )
+        await db.execute(
+            NotificationService._decrement_unread(marked.c.user_id, 1)
+            .add_cte(NotificationService._log_changes(marked, UPSERT))
+        )
+        await db.commit()
+
+        notification = await NotificationService.get_notification_by_id(db, notification_id)
         if not notification:
             return None
-            
-        notification.is_read = True
-        db.add(notification)
-        await db.commit()
         await db.refresh(notification)
         logger.info(f"Marked notification {notification_id} as read")
         return notification
@@ -81,19 +276,32 @@ class NotificationService:
         Returns:
             Number of notifications updated
         """
-        result = await db.execute(
+        # Decrement by the rows actually marked, so notifications created
+        # concurrently stay counted
+        marked = (
             update(Notification)
             .where(Notification.user_id == user_id, Notification.is_read == False)
             .values(is_read=True)
+            .returning(Notification.id, Notification.user_id)
+            .cte("marked")
+        )
+        marked_count = select(func.count()).select_from(marked).scalar_subquery()
+        result = await db.execute(
+            select(func.count()).select_from(marked).add_cte(
+                NotificationService._decrement_unread(user_id, marked_count).cte("decremented"),
+                NotificationService._log_changes(marked, UPSERT)
+            )
         )
         await db.commit()
-        count = result.rowcount
+        count = result.scalar_one()
         logger.info(f"Marked {count} notifications as read for user {user_id}")
         return count
     
     @staticmethod
     async def get_unread_count(db: AsyncSession, user_id: UUID) -> int:
         """Get count of unread notifications for a user.
+
+        Served from the maintained counter, a single primary-key lookup.
         
         Args:
             db: Database session
@@ -103,11 +311,53 @@ class NotificationService:
             Number of unread notifications
         """
         result = await db.execute(
-            select(Notification)
-            .where(Notification.user_id == user_id, Notification.is_read == False)
+            select(NotificationCounter.unread_count)
+            .where(NotificationCounter.user_id == user_id)
         )
-        return len(result.scalars().all())
+        return result.scalar_one_or_none() or 0
     
+    @staticmethod
+    async def reconcile_unread_counters(db: AsyncSession) -> int:
+        """Correct unread counters that drifted from the notifications table.
+
+        Counts come from the ``is_read = false`` partial index and only
+        counters that differ are written. The caller is responsible for
+        committing.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of counters corrected
+        """
+        actual = (
+            select(Notification.user_id, func.count())
+            .where(Notification.is_read == False)
+            .group_by(Notification.user_id)
+            .order_by(Notification.user_id)
+        )
+        upsert = pg_insert(NotificationCounter).from_select(["user_id", "unread_count"], actual)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={"unread_count": upsert.excluded.unread_count, "updated_at": func.now()},
+            where=NotificationCounter.unread_count != upsert.excluded.unread_count
+        )
+        corrected = (await db.execute(upsert)).rowcount
+
+        # Users whose unread notifications are all gone
+        result = await db.execute(
+            update(NotificationCounter)
+            .where(
+                NotificationCounter.unread_count != 0,
+                ~exists().where(
+                    Notification.user_id == NotificationCounter.user_id,
+                    Notification.is_read == False
+                )
+            )
+            .values(unread_count=0, updated_at=func.now())
+        )
+        return corrected + result.rowcount
+
     @staticmethod
     async def delete_notification(db: AsyncSession, notification_id: UUID) -> bool:
         """Delete a notification.
@@ -119,11 +369,24 @@ class NotificationService:
         Returns:
             True if deleted, False if not found
         """
-        notification = await NotificationService.get_notification_by_id(db, notification_id)
-        if not notification:
+        deleted = (
+            delete(Notification)
+            .where(Notification.id == notification_id)
+            .returning(Notification.id, Notification.user_id, Notification.is_read)
+            .cte("deleted")
+        )
+        result = await db.execute(
+            select(func.count()).select_from(deleted).add_cte(
+                NotificationService._decrement_unread(deleted.c.user_id, 1)
+                .where(deleted.c.is_read == False)
+                .cte("decremented"),
+                NotificationService._log_changes(deleted, DELETE)
+            )
+        )
+        if not result.scalar_one():
+            await db.rollback()
             return False
-        
-        await db.delete(notification)
+
         await db.commit()
         logger.info(f"Deleted notification {notification_id}")
         return True
@@ -0,0 +1,456 @@
+"""Read Models
+
+This module serves the hot list endpoints from a single Core SELECT. Joined
+columns are unpacked positionally into slotted dataclasses and encoded
+straight to JSON in the shape of the response schemas, skipping the ORM
+identity map, relationship loads and Pydantic re-validation of every row.
+
+Lists accept a :class:`Projection`: ``?fields=`` trims the columns read and
+returned, ``?embed=`` chooses which relations are joined in, and
+``?normalized=true`` lists each embedded user, topic or session once beside
+the items instead of repeating it on every row.
+"""
+import dataclasses
+import html
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import null
+
+from app.Models.booking import Booking
+from app.Models.notification import Notification
+from app.Models.session import TrainingSession
+from app.Models.topic import Topic
+from app.Models.user import User
+from app.core.serialization import FastJSONResponse, dumps
+
+# Fields read even when ?fields= leaves them out: the key and the cursor position
+ALWAYS_SELECTED = frozenset({"id", "created_at"})
+
+
+def _escaped(value: Optional[str]) -> Optional[str]:
+    """Apply the HTML escaping TopicBase performs on output."""
+    return html.escape(value) if value else value
+
+
+def _take(cls, row: Sequence[Any], start: int):
+    """Build ``cls`` from its columns at ``start``; None if the joined row is missing."""
+    values = row[start:start + cls.width]
+    return cls(*values) if values[0] is not None else None
+
+
+def _nested(embed: Optional[FrozenSet[str]], relation: str) -> Optional[FrozenSet[str]]:
+    """Embed paths below ``relation``, e.g. ``session.topic`` -> ``topic``."""
+    if embed is None:
+        return None
+    prefix = relation + "."
+    return frozenset(path[len(prefix):] for path in embed if path.startswith(prefix))
+
+
+@dataclass(frozen=True)
+class Projection:
+    """Requested shape of a read model list.
+
+    Attributes:
+        fields: Scalar fields to return, or None for all of them
+        embed: Relation paths to join in, or None for the default ones
+        normalized: Whether to list embedded objects once beside the items
+    """
+    fields: Optional[FrozenSet[str]] = None
+    embed: Optional[FrozenSet[str]] = None
+    normalized: bool = False
+
+
+class ReadModel:
+    """Base of the slotted read models.
+
+    Subclasses are dataclasses whose first ``width`` fields are columns,
+    followed by their embeddable relations.
+    """
+    __slots__ = ()
+
+    width: ClassVar[int]
+    # Collection name in a normalized envelope
+    collection: ClassVar[str]
+    # Relation attribute -> field holding its ID
+    relations: ClassVar[Dict[str, str]] = {}
+    # Relation paths embedded when ?embed= is not given
+    default_embed: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def field_names(cls) -> Tuple[str, ...]:
+        return tuple(field.name for field in dataclasses.fields(cls))[:cls.width]
+
+    @classmethod
+    def columns(cls, entity=None, fields: Optional[FrozenSet[str]] = None) -> Tuple:
+        """Column expressions in field order; fields not requested are read as NULL.
+
+        Keys, relation IDs and the cursor position are always read.
+        """
+        columns = cls._columns(entity) if entity is not None else cls._columns()
+        if fields is None:
+            return columns
+        wanted = fields | ALWAYS_SELECTED | frozenset(cls.relations.values())
+        return tuple(
+            column if name in wanted else null()
+            for name, column in zip(cls.field_names(), columns)
+        )
+
+    def to_json(
+        self,
+        fields: Optional[FrozenSet[str]] = None,
+        embed: Optional[FrozenSet[str]] = None,
+        included: Optional[Dict[str, Dict[str, dict]]] = None
+    ) -> dict:
+        """Return the response schema's shape, with values left for :func:`dumps` to encode.
+
+        Relations are inlined, or collected into ``included`` (keyed by
+        collection and ID) and referenced by their ID field when given.
+        """
+        data = self._scalars()
+        if fields is not None:
+            data = {name: value for name, value in data.items() if name in fields or name == "id"}
+        if embed is None:
+            embed = self.default_embed
+        for relation, id_field in self.relations.items():
+            if relation not in embed:
+                continue
+            related = getattr(self, relation)
+            if included is None:
+                data[relation] = related.to_json(None, _nested(embed, relation)) if related is not None else None
+                continue
+            data[id_field] = str(getattr(self, id_field))
+            if related is not None:
+                collection = included.setdefault(related.collection, {})
+                if data[id_field] not in collection:
+                    collection[data[id_field]] = related.to_json(None, _nested(embed, relation), included)
+        return data
+
+    def _scalars(self) -> dict:
+        raise NotImplementedError
+
+
+@dataclass(slots=True)
+class UserRow(ReadModel):
+    """Projection of UserResponse."""
+    id: UUID
+    name: str
+    email: str
+    role: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    width: ClassVar[int] = 8
+    collection: ClassVar[str] = "users"
+
+    @staticmethod
+    def _columns(user=User) -> Tuple:
+        return (
+            user.id, user.name, user.email, user.role,
+            user.is_active, user.is_verified, user.created_at, user.updated_at,
+        )
+
+    def _scalars(self) -> dict:
+        return {
+            "name": self.name,
+            "email": self.email,
+            "role": self.role,
+            "id": self.id,
+            "is_active": self.is_active,
+            "is_verified": self.is_verified,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(slots=True)
+class TopicRow(ReadModel):
+    """Projection of TopicResponse."""
+    id: UUID
+    name: str
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    width: ClassVar[int] = 5
+    collection: ClassVar[str] = "topics"
+
+    @staticmethod
+    def _columns(topic=Topic) -> Tuple:
+        return topic.id, topic.name, topic.description, topic.created_at, topic.updated_at
+
+    def _scalars(self) -> dict:
+        return {
+            "name": _escaped(self.name),
+            "description": _escaped(self.description),
+            "id": self.id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(slots=True)
+class SessionRow(ReadModel):
+    """Projection of SessionResponse, with its trainer and topic."""
+    id: UUID
+    title: str
+    description: Optional[str]
+    start_time: datetime
+    duration_minutes: int
+    capacity: int
+    meet_link: Optional[str]
+    trainer_id: UUID
+    topic_id: UUID
+    current_attendees: int
+    held_seats: int
+    seat_slots: int
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    trainer: Optional[UserRow] = None
+    topic: Optional[TopicRow] = None
+
+    width: ClassVar[int] = 15
+    collection: ClassVar[str] = "sessions"
+    relations: ClassVar[Dict[str, str]] = {"trainer": "trainer_id", "topic": "topic_id"}
+    default_embed: ClassVar[FrozenSet[str]] = frozenset({"trainer", "topic"})
+
+    @staticmethod
+    def _columns() -> Tuple:
+        return (
+            TrainingSession.id, TrainingSession.title, TrainingSession.description,
+            TrainingSession.start_time, TrainingSession.duration_minutes, TrainingSession.capacity,
+            TrainingSession.meet_link, TrainingSession.trainer_id, TrainingSession.topic_id,
+            TrainingSession.seats_taken, TrainingSession.seats_held, TrainingSession.seat_slots,
+            TrainingSession.status, TrainingSession.created_at, TrainingSession.updated_at,
+        )
+
+    @classmethod
+    def joined_columns(
+        cls,
+        embed: FrozenSet[str] = default_embed,
+        fields: Optional[FrozenSet[str]] = None,
+        trainer=User
+    ) -> Tuple:
+        """Session columns plus those of the embedded relations, as read by :meth:`from_joined`."""
+        columns = cls.columns(fields=fields)
+        if "trainer" in embed:
+            columns += UserRow.columns(trainer)
+        if "topic" in embed:
+            columns += TopicRow.columns()
+        return columns
+
+    @classmethod
+    def from_joined(
+        cls,
+        row: Sequence[Any],
+        start: int = 0,
+        embed: FrozenSet[str] = default_embed
+    ) -> "SessionRow":
+        session = _take(cls, row, start)
+        start += cls.width
+        if "trainer" in embed:
+            session.trainer = _take(UserRow, row, start)
+            start += UserRow.width
+        if "topic" in embed:
+            session.topic = _take(TopicRow, row, start)
+        return session
+
+    def _scalars(self) -> dict:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "start_time": self.start_time,
+            "duration_minutes": self.duration_minutes,
+            "capacity": self.capacity,
+            "meet_link": self.meet_link,
+            "id": self.id,
+            "trainer_id": self.trainer_id,
+            "topic_id": self.topic_id,
+            "current_attendees": self.current_attendees,
+            "held_seats": self.held_seats,
+            "seat_slots": self.seat_slots,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(slots=True)
+class BookingRow(ReadModel):
+    """Projection of BookingResponse, with its session and student."""
+    id: UUID
+    session_id: UUID
+    student_id: UUID
+    attended: bool
+    feedback: Optional[str]
+    rating: Optional[int]
+    created_at: datetime
+    session: Optional[SessionRow] = None
+    student: Optional[UserRow] = None
+
+    width: ClassVar[int] = 7
+    collection: ClassVar[str] = "bookings"
+    relations: ClassVar[Dict[str, str]] = {"session": "session_id", "student": "student_id"}
+    default_embed: ClassVar[FrozenSet[str]] = frozenset(
+        {"session", "session.trainer", "session.topic", "student"}
+    )
+
+    @staticmethod
+    def _columns() -> Tuple:
+        return (
+            Booking.id, Booking.session_id, Booking.student_id, Booking.attended,
+            Booking.feedback, Booking.rating, Booking.created_at,
+        )
+
+    @classmethod
+    def joined_columns(
+        cls,
+        trainer,
+        student,
+        embed: FrozenSet[str] = default_embed,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> Tuple:
+        """Booking columns plus those of the embedded relations, as read by :meth:`from_joined`."""
+        columns = cls.columns(fields=fields)
+        if "student" in embed:
+            columns += UserRow.columns(student)
+        if "session" in embed:
+            columns += SessionRow.joined_columns(_nested(embed, "session"), trainer=trainer)
+        return columns
+
+    @classmethod
+    def from_joined(cls, row: Sequence[Any], embed: FrozenSet[str] = default_embed) -> "BookingRow":
+        booking = _take(cls, row, 0)
+        start = cls.width
+        if "student" in embed:
+            booking.student = _take(UserRow, row, start)
+            start += UserRow.width
+        if "session" in embed:
+            booking.session = SessionRow.from_joined(row, start, _nested(embed, "session"))
+        return booking
+
+    def _scalars(self) -> dict:
+        return {
+            "feedback": self.feedback,
+            "rating": self.rating,
+            "id": self.id,
+            "session_id": self.session_id,
+            "student_id": self.student_id,
+            "attended": self.attended,
+            "created_at": self.created_at,
+        }
+
+
+@dataclass(slots=True)
+class NotificationRow(ReadModel):
+    """Projection of NotificationResponse."""
+    id: UUID
+    user_id: UUID
+    type: str
+    message: str
+    is_read: bool
+    created_at: datetime
+
+    width: ClassVar[int] = 6
+    collection: ClassVar[str] = "notifications"
+
+    @staticmethod
+    def _columns() -> Tuple:
+        return (
+            Notification.id, Notification.user_id, Notification.type,
+            Notification.message, Notification.is_read, Notification.created_at,
+        )
+
+    def _scalars(self) -> dict:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "type": self.type,
+            "message": self.message,
+            "is_read": self.is_read,
+            "created_at": self.created_at,
+        }
+
+
+def _split(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    if value is None:
+        return None
+    return frozenset(name.strip() for name in value.split(",") if name.strip())
+
+
+def projection(model) -> Any:
+    """Build a dependency parsing ``?fields=``, ``?embed=`` and ``?normalized=`` for a read model.
+
+    Example:
+        >>> @sessions_router.get("/", response_model=List[SessionResponse])
+        >>> async def get_sessions(shape: Projection = Depends(projection(SessionRow)), ...):
+        >>>     sessions = await SessionService.get_all_sessions(db, skip, limit, cursor, shape)
+        >>>     return ReadModelResponse(sessions, shape)
+    """
+    field_names = frozenset(model.field_names())
+    embeddable = frozenset(model.default_embed)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated fields to return: {', '.join(model.field_names())}"
+        ),
+        embed: Optional[str] = Query(
+            None, description=f"Comma-separated relations to include: {', '.join(sorted(embeddable))}"
+        ),
+        normalized: bool = Query(
+            False, description="List embedded objects once under `included` instead of on every item"
+        )
+    ) -> Projection:
+        requested_fields, requested_embed = _split(fields), _split(embed)
+        unknown = sorted((requested_fields or frozenset()) - field_names)
+        unknown += sorted((requested_embed or frozenset()) - embeddable)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields or relations: {', '.join(unknown)}"
+            )
+        if requested_embed is None:
+            requested_embed = model.default_embed
+        else:
+            # Embedding session.topic embeds the session too
+            requested_embed |= {path.split(".")[0] for path in requested_embed}
+        return Projection(requested_fields, requested_embed, normalized)
+
+    return dependency
+
+
+def dump_json(rows: Sequence[ReadModel], shape: Optional[Projection] = None) -> bytes:
+    """Encode read models as a compact JSON array, or as a normalized envelope."""
+    shape = shape or Projection()
+    if shape.normalized:
+        included: Dict[str, Dict[str, dict]] = {}
+        data = [row.to_json(shape.fields, shape.embed, included) for row in rows]
+        content: Any = {
+            "data": data,
+            "included": {name: list(objects.values()) for name, objects in included.items()},
+        }
+    else:
+        content = [row.to_json(shape.fields, shape.embed) for row in rows]
+    return dumps(content)
+
+
+class ReadModelResponse(FastJSONResponse):
+    """JSON response rendering a list of read models without re-validation.
+
+    Example:
+        >>> sessions = await SessionService.get_all_sessions(db, skip, limit, cursor)
+        >>> return ReadModelResponse(sessions)
+    """
+
+    def __init__(self, content: Sequence[ReadModel], shape: Optional[Projection] = None, **kwargs):
+        self.shape = shape
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Sequence[ReadModel]) -> bytes:
+        return dump_json(content, self.shape)
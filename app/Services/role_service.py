@@ -5,6 +5,7 @@ from uuid import UUID
 
 from app.Models.role import AppRole
 from app.Schemas.role import RoleCreate, RoleUpdate
+from app.core.principal_cache import principal_cache
 
 async def create_role(
     db: AsyncSession,
@@ -69,6 +70,7 @@ async def update_role(
 
     await db.commit()
     await db.refresh(role)
+    principal_cache.clear()
     return role
 
 
@@ -81,3 +83,4 @@ async def delete_role(
 
     role.is_active = False
     await db.commit()
+    principal_cache.clear()
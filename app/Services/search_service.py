@@ -0,0 +1,118 @@
+"""Search Service
+
+This module implements keyword search over open sessions and live topics.
+Both tables carry a generated, weighted ``tsvector`` column behind a GIN
+index; topic names are also matched by trigram similarity, so a misspelled
+topic is still found. Only the requested page is joined back to its rows to
+build the highlighted snippets, since ``ts_headline`` is the costly part.
+"""
+from typing import List, Sequence
+
+from sqlalchemy import select, union_all, func, literal_column, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.Models.session import TrainingSession
+from app.Models.topic import Topic
+from app.Schemas.search_schema import SearchHit
+from app.Services.session_service import SessionService
+
+# Text search configuration of the generated search_vector columns
+SEARCH_CONFIG = "english"
+
+SESSION_HIT = "session"
+TOPIC_HIT = "topic"
+
+# ts_headline options for the matched title and the description excerpt
+TITLE_HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+
+
+class SearchService:
+    """Service for full-text search across sessions and topics."""
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        types: Sequence[str] = (SESSION_HIT, TOPIC_HIT),
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """Find sessions and topics matching a web-style query, best first.
+
+        ``q`` accepts quoted phrases, ``or`` and ``-word``. Sessions match on
+        title and description among upcoming and active sessions; topics
+        match on name and description, or on a name similar to ``q``.
+
+        Args:
+            db: Database session
+            q: Search text
+            types: Kinds of results to include ("session", "topic")
+            skip: Number of ranked results to skip
+            limit: Maximum number of results to return
+
+        Returns:
+            Hits with their kind, ID, rank, title, highlighted title and
+            description snippet, topic and (for sessions) start time
+        """
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+        branches = []
+        if SESSION_HIT in types:
+            branches.append(
+                SessionService.build_search_query()
+                .with_only_columns(
+                    literal_column(f"'{SESSION_HIT}'").label("type"),
+                    TrainingSession.id,
+                    func.ts_rank_cd(TrainingSession.search_vector, query).label("rank"),
+                )
+                .where(TrainingSession.search_vector.bool_op("@@")(query))
+            )
+        if TOPIC_HIT in types:
+            branches.append(
+                select(
+                    literal_column(f"'{TOPIC_HIT}'").label("type"),
+                    Topic.id,
+                    func.greatest(
+                        func.ts_rank_cd(Topic.search_vector, query),
+                        func.similarity(Topic.name, q)
+                    ).label("rank"),
+                )
+                .where(
+                    Topic.deleted_at.is_(None),
+                    or_(Topic.search_vector.bool_op("@@")(query), Topic.name.bool_op("%")(q))
+                )
+            )
+        if not branches:
+            return []
+
+        matches = union_all(*branches).subquery("matches")
+        hits = (
+            select(matches)
+            .order_by(matches.c.rank.desc(), matches.c.id)
+            .offset(skip)
+            .limit(limit)
+            .subquery("hits")
+        )
+
+        title = func.coalesce(TrainingSession.title, Topic.name)
+        description = func.coalesce(TrainingSession.description, Topic.description)
+        stmt = (
+            select(
+                hits.c.type,
+                hits.c.id,
+                hits.c.rank,
+                title.label("title"),
+                func.ts_headline(SEARCH_CONFIG, title, query, TITLE_HIGHLIGHT_OPTIONS).label("title_highlight"),
+                func.ts_headline(SEARCH_CONFIG, description, query, SNIPPET_OPTIONS).label("snippet"),
+                func.coalesce(TrainingSession.topic_id, Topic.id).label("topic_id"),
+                TrainingSession.start_time,
+            )
+            .select_from(hits)
+            .outerjoin(TrainingSession, and_(hits.c.type == SESSION_HIT, TrainingSession.id == hits.c.id))
+            .outerjoin(Topic, and_(hits.c.type == TOPIC_HIT, Topic.id == hits.c.id))
+            .order_by(hits.c.rank.desc(), hits.c.id)
+        )
+        result = await db.execute(stmt)
+        # Columns match SearchHit field for field, so the hits are built unvalidated
+        return [SearchHit.model_construct(**row) for row in result.mappings()]
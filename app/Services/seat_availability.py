@@ -0,0 +1,239 @@
+"""Seat Availability Stream
+
+This module pushes live seat availability to Server-Sent Event subscribers.
+Seat writes call ``pg_notify`` with the session id inside their transaction,
+so Postgres only delivers the signal once it commits. Each process holds a
+single LISTEN connection; on a signal it re-reads the session's committed
+counters once and fans them out to the in-memory queues of the session's
+subscribers, however many there are.
+"""
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, func, cast, Text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.DB.session import AsyncSessionLocal, engine
+from app.Models.session import TrainingSession
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel carrying the ids of sessions whose seats changed
+AVAILABILITY_CHANNEL = "seat_availability"
+
+
+def _availability_json():
+    """JSON text of a session's seat counters, as sent to subscribers."""
+    return cast(func.json_build_object(
+        "session_id", TrainingSession.id,
+        "status", TrainingSession.status,
+        "capacity", TrainingSession.capacity,
+        "seats_taken", TrainingSession.seats_taken,
+        "seats_held", TrainingSession.seats_held,
+        "available_seats", func.greatest(
+            TrainingSession.capacity - TrainingSession.seats_taken - TrainingSession.seats_held, 0
+        ),
+    ), Text)
+
+
+class SeatAvailabilityService:
+    """Service for reading and publishing seat availability."""
+
+    @staticmethod
+    async def snapshot(db: AsyncSession, session_id: UUID) -> Optional[str]:
+        """Return the current availability payload of a live session, or None."""
+        result = await db.execute(
+            select(_availability_json())
+            .where(TrainingSession.id == session_id, TrainingSession.deleted_at.is_(None))
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def publish(db: AsyncSession, session_id: UUID) -> None:
+        """Queue a change signal for a session's availability.
+
+        Postgres delivers it when the transaction commits and drops it on
+        rollback. Only the id is sent: counts read inside the transaction
+        would miss concurrent writers on other seat slots, so listeners read
+        them after the commit instead. The caller is responsible for
+        committing.
+        """
+        await db.execute(select(func.pg_notify(AVAILABILITY_CHANNEL, str(session_id))))
+
+
+class AvailabilityBroadcaster:
+    """Per-process LISTEN connection fanning availability out to subscribers.
+
+    Signals for a session are coalesced: while its counters are being
+    re-read, further signals only schedule one more read, so the last
+    payload delivered always reflects the last commit. Each subscriber gets
+    a single-slot queue holding the latest payload for its session: a slow
+    client skips intermediate counts instead of falling behind.
+
+    The connection also carries the channels other components register
+    with :meth:`listen`, so a process keeps a single LISTEN connection.
+
+    Example:
+        >>> queue = availability_broadcaster.subscribe(session_id)
+        >>> return StreamingResponse(availability_broadcaster.stream(session_id, queue, snapshot))
+    """
+
+    def __init__(self, heartbeat_seconds: float, reconnect_seconds: float):
+        self.heartbeat_seconds = heartbeat_seconds
+        self.reconnect_seconds = reconnect_seconds
+        self.connected = False
+        self.received = 0
+        self.refreshed = 0
+        self.delivered = 0
+        self.skipped = 0
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # Sessions being re-read, and those signalled again meanwhile
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._stale: Set[str] = set()
+        # Other channels: callback and hook run on every (re)connection
+        self._channels: Dict[str, Tuple[Callable, Optional[Callable[[], None]]]] = {}
+
+    def listen(self, channel: str, callback: Callable, on_connect: Optional[Callable[[], None]] = None) -> None:
+        """Deliver another channel's notifications to ``callback``; call before start()."""
+        self._channels[channel] = (callback, on_connect)
+
+    def subscribe(self, session_id: UUID) -> asyncio.Queue:
+        """Register a subscriber queue for a session's availability changes."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(str(session_id), set()).add(queue)
+        return queue
+
+    def unsubscribe(self, session_id: UUID, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue."""
+        key = str(session_id)
+        queues = self._subscribers.get(key)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[key]
+
+    async def stream(self, session_id: UUID, queue: asyncio.Queue, snapshot: str) -> AsyncIterator[str]:
+        """Yield SSE frames: the snapshot, then each change, with heartbeats.
+
+        The subscription is removed when the client disconnects.
+        """
+        try:
+            yield f"event: availability\ndata: {snapshot}\n\n"
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: availability\ndata: {payload}\n\n"
+        finally:
+            self.unsubscribe(session_id, queue)
+
+    def start(self) -> None:
+        """Start the listener on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="availability-listener")
+
+    async def stop(self) -> None:
+        """Stop the listener and release its connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for refresh in list(self._refreshing.values()):
+            refresh.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return listener state and fan-out counters."""
+        return {
+            "running": self._task is not None,
+            "connected": self.connected,
+            "sessions": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "received": self.received,
+            "refreshed": self.refreshed,
+            "delivered": self.delivered,
+            "skipped": self.skipped,
+        }
+
+    def _deliver(self, connection, pid, channel, session_id: str) -> None:
+        self.received += 1
+        if session_id not in self._subscribers:
+            return
+        if session_id in self._refreshing:
+            self._stale.add(session_id)
+            return
+        self._refreshing[session_id] = asyncio.create_task(self._refresh(session_id))
+
+    async def _refresh(self, session_id: str) -> None:
+        """Read a session's committed counters until no signal arrived meanwhile."""
+        try:
+            while True:
+                self._stale.discard(session_id)
+                async with AsyncSessionLocal() as db:
+                    payload = await SeatAvailabilityService.snapshot(db, UUID(session_id))
+                self.refreshed += 1
+                if payload is not None:
+                    self._fan_out(session_id, payload)
+                if session_id not in self._stale:
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Availability refresh of session {session_id} failed: {e}", exc_info=True)
+        finally:
+            self._refreshing.pop(session_id, None)
+
+    def _fan_out(self, session_id: str, payload: str) -> None:
+        for queue in self._subscribers.get(session_id, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.skipped += 1
+            queue.put_nowait(payload)
+            self.delivered += 1
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    listener = raw.driver_connection
+                    lost = asyncio.Event()
+                    listener.add_termination_listener(lambda _: lost.set())
+                    channels = {AVAILABILITY_CHANNEL: self._deliver}
+                    channels.update((channel, callback) for channel, (callback, _) in self._channels.items())
+                    for channel, callback in channels.items():
+                        await listener.add_listener(channel, callback)
+                    self.connected = True
+                    for _, on_connect in self._channels.values():
+                        if on_connect is not None:
+                            on_connect()
+                    try:
+                        await lost.wait()
+                    finally:
+                        self.connected = False
+                        if not listener.is_closed():
+                            for channel, callback in channels.items():
+                                await listener.remove_listener(channel, callback)
+                logger.warning("Availability listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Availability listener failed: {e}", exc_info=True)
+            await asyncio.sleep(self.reconnect_seconds)
+
+
+# Global availability broadcaster instance
+availability_broadcaster = AvailabilityBroadcaster(
+    heartbeat_seconds=settings.AVAILABILITY_STREAM_HEARTBEAT_SECONDS,
+    reconnect_seconds=settings.AVAILABILITY_LISTENER_RECONNECT_SECONDS,
+)
@@ -0,0 +1,109 @@
+"""Seat Counter Service
+
+This module manages the striped seat counters of sessions created with
+``seat_slots``. Single bookings and cancellations touch one slot from inside
+the booking statements; the operations here lock every slot of a session and
+spread its capacity and taken seats evenly again, for bulk bookings, capacity
+edits, reconciliation and slots that ran dry.
+"""
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update, insert, values, column, Integer, SmallInteger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.Models.session_seat_slot import SessionSeatSlot
+
+
+def _spread(total: int, parts: int) -> List[int]:
+    """Split total into parts that differ by at most one."""
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+class SeatCounterService:
+    """Service for creating and rebalancing striped seat counters."""
+
+    @staticmethod
+    async def create_slots(db: AsyncSession, session_id: UUID, capacity: int, slots: int) -> None:
+        """Create the counter slots of a new session, splitting its capacity.
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            capacity: Session capacity
+            slots: Number of slots
+        """
+        await db.execute(
+            insert(SessionSeatSlot),
+            [
+                {"session_id": session_id, "slot": slot, "capacity": share, "taken": 0}
+                for slot, share in enumerate(_spread(capacity, slots))
+            ]
+        )
+
+    @staticmethod
+    async def restripe(
+        db: AsyncSession,
+        session_id: UUID,
+        taken_delta: int = 0,
+        capacity: Optional[int] = None,
+        clamp: bool = True
+    ) -> Optional[Tuple[int, int]]:
+        """Lock all slots of a session, apply a change and spread seats evenly.
+
+        Taken seats and free seats are each split evenly across the slots,
+        so every slot ends up with its share of the remaining capacity. Held
+        seats stay in their slot, since each seat hold records it. The
+        caller is responsible for committing.
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            taken_delta: Seats to take (positive) or release (negative)
+            capacity: New session capacity, None to keep the current total
+            clamp: Limit taken seats to the free seats instead of overbooking
+
+        Returns:
+            (applied taken_delta, free seats left), or None if the session
+            does not use striped counters
+        """
+        result = await db.execute(
+            select(
+                SessionSeatSlot.slot,
+                SessionSeatSlot.capacity,
+                SessionSeatSlot.taken,
+                SessionSeatSlot.held
+            )
+            .where(SessionSeatSlot.session_id == session_id)
+            .order_by(SessionSeatSlot.slot)
+            .with_for_update()
+        )
+        slots = result.all()
+        if not slots:
+            return None
+
+        taken = sum(slot.taken for slot in slots)
+        held = sum(slot.held for slot in slots)
+        total = capacity if capacity is not None else sum(slot.capacity for slot in slots)
+        if clamp and taken_delta > 0:
+            taken_delta = min(taken_delta, max(total - taken - held, 0))
+        taken_delta = max(taken_delta, -taken)
+        taken += taken_delta
+        free = max(total - taken - held, 0)
+
+        counts = values(
+            column("slot", SmallInteger), column("capacity", Integer), column("taken", Integer),
+            name="counts"
+        ).data([
+            (slot.slot, slot_taken + slot.held + slot_free, slot_taken)
+            for slot, slot_taken, slot_free in zip(
+                slots, _spread(taken, len(slots)), _spread(free, len(slots))
+            )
+        ])
+        await db.execute(
+            update(SessionSeatSlot)
+            .where(SessionSeatSlot.session_id == session_id, SessionSeatSlot.slot == counts.c.slot)
+            .values(capacity=counts.c.capacity, taken=counts.c.taken)
+            .execution_options(synchronize_session=False)
+        )
+        return taken_delta, free
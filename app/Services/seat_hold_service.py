@@ -0,0 +1,229 @@
+"""Seat Hold Service
+
+This module implements two-phase enrollment: a student first takes a short
+seat hold, then converts it into a booking with its token. Holds are counted
+in the same conditional statements that reserve seats, so capacity checks
+never scan the holds table, and expired holds are released in bulk by a
+background sweeper.
+"""
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import select, insert, update, delete, func, literal, exists
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.DB.session import AsyncSessionLocal
+from app.Models.booking import Booking
+from app.Models.seat_hold import SeatHold
+from app.Models.session import TrainingSession
+from app.Models.session_seat_slot import SessionSeatSlot
+from app.Services.booking_service import BookingService
+from app.Services.notification_dispatcher import notification_dispatcher, NotificationEvent
+from app.Services.seat_availability import SeatAvailabilityService
+from app.Services.change_log_service import ChangeLogService, SESSION, UPSERT
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from app.core.response_cache import response_cache, SESSIONS
+
+logger = logging.getLogger(__name__)
+
+
+class SeatHoldService:
+    """Service for taking and releasing seat holds."""
+
+    @staticmethod
+    async def create_hold(db: AsyncSession, session_id: UUID, student_id: UUID) -> dict:
+        """Set a seat aside for a student for SEAT_HOLD_TTL_SECONDS.
+
+        The seat is taken with the same conditional reservation as a
+        booking, counted as held, and the hold row is inserted in that
+        statement. A student's own expired hold that the sweeper has not
+        released yet is released on the spot.
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            student_id: Student UUID
+
+        Returns:
+            The hold token, session ID and expiry
+
+        Raises:
+            HTTPException: If the session is missing, full or not bookable,
+                or the student is already booked or holding a seat
+        """
+        await BookingService.check_prerequisites(db, session_id, student_id)
+
+        result = await db.execute(
+            select(exists().where(Booking.session_id == session_id, Booking.student_id == student_id))
+        )
+        if result.scalar():
+            raise HTTPException(status_code=400, detail="Already booked this session")
+
+        for attempt in range(2):
+            reserved = BookingService.reserve_seat(session_id, hold=True)
+            expires_at = datetime.utcnow() + timedelta(seconds=settings.SEAT_HOLD_TTL_SECONDS)
+            stmt = (
+                insert(SeatHold)
+                .from_select(
+                    ["id", "session_id", "student_id", "slot", "created_at", "expires_at"],
+                    select(
+                        literal(uuid.uuid4(), PG_UUID(as_uuid=True)),
+                        reserved.c.id,
+                        literal(student_id, PG_UUID(as_uuid=True)),
+                        reserved.c.slot,
+                        func.now(),
+                        literal(expires_at),
+                    ),
+                )
+                .returning(SeatHold.id, SeatHold.session_id, SeatHold.expires_at)
+            )
+            try:
+                result = await db.execute(stmt)
+                hold = result.first()
+                break
+            except IntegrityError as e:
+                await db.rollback()
+                if "uc_seat_hold_session_student" not in str(e):
+                    raise
+                released = await SeatHoldService.release_holds(
+                    db,
+                    SeatHold.session_id == session_id,
+                    SeatHold.student_id == student_id,
+                    SeatHold.expires_at < datetime.utcnow(),
+                )
+                if attempt or not released:
+                    raise HTTPException(status_code=400, detail="Already holding a seat for this session")
+
+        if hold is None:
+            await db.rollback()
+            await BookingService._raise_booking_rejection(db, session_id)
+
+        await SeatAvailabilityService.publish(db, session_id)
+        await ChangeLogService.record(db, [(SESSION, session_id, UPSERT, None)])
+        await db.commit()
+        await response_cache.invalidate(SESSIONS)
+        return {"hold_token": hold.id, "session_id": hold.session_id, "expires_at": hold.expires_at}
+
+    @staticmethod
+    async def release_holds(db: AsyncSession, *criteria) -> Dict[UUID, int]:
+        """Delete matching holds and give their seats back in one statement.
+
+        The deleted holds are counted per session and per slot and the
+        ``held`` counters decremented with one UPDATE each, however many
+        holds are released. Holds locked by a conversion in progress are
+        skipped. The caller is responsible for committing.
+
+        Args:
+            db: Database session
+            criteria: Filters selecting the holds to release
+
+        Returns:
+            Number of released seats per session
+        """
+        doomed = select(SeatHold.id).where(*criteria).with_for_update(skip_locked=True)
+        released = (
+            delete(SeatHold)
+            .where(SeatHold.id.in_(doomed))
+            .returning(SeatHold.session_id, SeatHold.slot)
+            .cte("released")
+        )
+        per_row = (
+            select(released.c.session_id, func.count().label("seats"))
+            .where(released.c.slot.is_(None))
+            .group_by(released.c.session_id)
+            .cte("per_row")
+        )
+        per_slot = (
+            select(released.c.session_id, released.c.slot, func.count().label("seats"))
+            .where(released.c.slot.is_not(None))
+            .group_by(released.c.session_id, released.c.slot)
+            .cte("per_slot")
+        )
+        released_row = (
+            update(TrainingSession)
+            .where(TrainingSession.id == per_row.c.session_id)
+            .values(held_seats=func.greatest(TrainingSession.held_seats - per_row.c.seats, 0))
+            .returning(TrainingSession.id)
+            .cte("released_row")
+        )
+        released_slot = (
+            update(SessionSeatSlot)
+            .where(
+                SessionSeatSlot.session_id == per_slot.c.session_id,
+                SessionSeatSlot.slot == per_slot.c.slot
+            )
+            .values(held=func.greatest(SessionSeatSlot.held - per_slot.c.seats, 0))
+            .returning(SessionSeatSlot.session_id)
+            .cte("released_slot")
+        )
+        result = await db.execute(
+            select(released.c.session_id, func.count())
+            .group_by(released.c.session_id)
+            .add_cte(released_row, released_slot)
+        )
+        return dict(result.all())
+
+    @staticmethod
+    async def sweep_expired(db: AsyncSession) -> Tuple[int, List[Tuple[UUID, UUID]]]:
+        """Release expired holds and offer their seats to the waitlists.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of released seats and the (session_id, student_id) of
+            every waitlisted student promoted into a booking
+        """
+        released = await SeatHoldService.release_holds(db, SeatHold.expires_at < datetime.utcnow())
+
+        promoted = []
+        for session_id, seats in released.items():
+            for _ in range(seats):
+                student_id = await BookingService.promote_from_waitlist(db, session_id)
+                if student_id is None:
+                    break
+                promoted.append((session_id, student_id))
+            await SeatAvailabilityService.publish(db, session_id)
+        await ChangeLogService.record(db, [(SESSION, session_id, UPSERT, None) for session_id in released])
+
+        await db.commit()
+        return sum(released.values()), promoted
+
+
+async def sweep_expired_holds() -> int:
+    """Release expired seat holds and notify promoted waitlisted students."""
+    async with AsyncSessionLocal() as db:
+        released, promoted = await SeatHoldService.sweep_expired(db)
+        titles = {}
+        if promoted:
+            result = await db.execute(
+                select(TrainingSession.id, TrainingSession.title)
+                .where(TrainingSession.id.in_({session_id for session_id, _ in promoted}))
+            )
+            titles = dict(result.all())
+
+    if released:
+        await response_cache.invalidate(SESSIONS)
+        logger.info(f"Released {released} expired seat holds")
+    for session_id, student_id in promoted:
+        notification_dispatcher.publish(NotificationEvent(
+            "booking",
+            f"A seat opened up: you are now booked for session '{titles.get(session_id)}'",
+            user_ids=(student_id,)
+        ))
+    return released
+
+
+# Expired seat hold sweeper, started with the application
+seat_hold_sweeper = PeriodicTask(
+    "seat-hold-sweeper",
+    settings.SEAT_HOLD_SWEEP_INTERVAL_SECONDS,
+    sweep_expired_holds,
+)
@@ -1,18 +1,64 @@
 """Session Service
 
-This module handles training session management operations.
+This module handles training session management operations, including the
+scheduler that moves sessions from upcoming to active to completed as their
+start and end times pass.
 """
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from fastapi import HTTPException
+from sqlalchemy import select, update, bindparam, case, cast, func, literal, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from app.DB.session import AsyncSessionLocal
+from app.Models.booking import Booking
 from app.Models.session import TrainingSession
+from app.Models.topic import Topic
+from app.Models.user import User
 from app.Schemas.session_schema import SessionCreate, SessionUpdate
+from app.core.pagination import paginate
+from app.core.response_cache import response_cache, SESSIONS
+from app.Services.notification_service import NotificationService
+from app.Services.notification_dispatcher import notification_dispatcher, NotificationEvent
+from app.Services.seat_counter_service import SeatCounterService
+from app.Services.seat_availability import SeatAvailabilityService
+from app.Services.change_log_service import ChangeLogService, SESSION, BOOKING, UPSERT, DELETE
+from app.Services.booking_service import BOOKABLE_STATUSES
+from app.Services.read_models import Projection, SessionRow
+from app.core.background import PeriodicTask
+from app.core.config import settings
+from datetime import datetime, timezone
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock key letting a single worker run each status transition tick
+SESSION_STATUS_LOCK = 4_812_730_551
+
+
+def _status_in(statuses: Sequence[str]):
+    """Filter on session statuses, rendered as literals.
+
+    Literal values (rather than bound parameters) let the planner prove that
+    a filter over upcoming and active sessions matches the partial
+    ``*_open`` indexes.
+    """
+    return TrainingSession.status.in_(
+        bindparam(
+            "statuses", list(statuses), type_=TrainingSession.status.type,
+            expanding=True, literal_execute=True
+        )
+    )
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to the naive UTC stored in TIMESTAMP columns."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class SessionService:
     """Service for managing training sessions."""
@@ -33,9 +79,17 @@ class SessionService:
             **session_in.model_dump(exclude={'trainer_id'}),
             trainer_id=trainer_id
         )
+        db_session.seat_slots = min(db_session.seat_slots, db_session.capacity)
         db.add(db_session)
+        await db.flush()
+        if db_session.seat_slots:
+            await SeatCounterService.create_slots(
+                db, db_session.id, db_session.capacity, db_session.seat_slots
+            )
+        await ChangeLogService.record(db, [(SESSION, db_session.id, UPSERT, None)])
         await db.commit()
         await db.refresh(db_session)
+        await response_cache.invalidate(SESSIONS)
         
         # Eagerly load relationships to avoid lazy loading issues
         result = await db.execute(
@@ -73,24 +127,105 @@ class SessionService:
         return result.scalars().first()
 
     @staticmethod
-    async def get_all_sessions(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[TrainingSession]:
-        """Get all training sessions with pagination.
+    async def get_all_sessions(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        shape: Projection = Projection()
+    ) -> List[SessionRow]:
+        """Get all training sessions, newest first, with pagination.
+
+        Sessions are read in one SELECT, joined only to the relations the
+        shape embeds (trainer and topic by default).
         
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when cursor is given)
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the previous page
+            shape: Fields and relations to read
             
         Returns:
-            List of training sessions
+            List of session read models
         """
+        embed = SessionRow.default_embed if shape.embed is None else shape.embed
+        stmt = select(*SessionRow.joined_columns(embed, shape.fields)).select_from(TrainingSession)
+        if "trainer" in embed:
+            stmt = stmt.outerjoin(User, User.id == TrainingSession.trainer_id)
+        if "topic" in embed:
+            stmt = stmt.outerjoin(Topic, Topic.id == TrainingSession.topic_id)
+        stmt = stmt.where(TrainingSession.deleted_at.is_(None))
         result = await db.execute(
-            select(TrainingSession)
-            .options(selectinload(TrainingSession.trainer), selectinload(TrainingSession.topic))
-            .where(TrainingSession.deleted_at.is_(None))
-            .order_by(TrainingSession.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            paginate(stmt, TrainingSession.created_at, TrainingSession.id, cursor, skip, limit)
+        )
+        return [SessionRow.from_joined(row, embed=embed) for row in result]
+
+    @staticmethod
+    def build_search_query(
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        topic_id: Optional[UUID] = None,
+        trainer_id: Optional[UUID] = None,
+        statuses: Sequence[str] = BOOKABLE_STATUSES,
+        has_free_seats: Optional[bool] = None
+    ) -> Select:
+        """Build the filtered session search, without ordering or paging.
+
+        Args:
+            start_from: Earliest start time, inclusive
+            start_to: Latest start time, exclusive
+            topic_id: Only sessions of this topic
+            trainer_id: Only sessions of this trainer
+            statuses: Allowed session statuses
+            has_free_seats: True for sessions with seats left, False for full ones
+
+        Returns:
+            Select over live sessions matching every given filter
+        """
+        stmt = select(TrainingSession).where(TrainingSession.deleted_at.is_(None), _status_in(statuses))
+        if start_from is not None:
+            stmt = stmt.where(TrainingSession.start_time >= _naive_utc(start_from))
+        if start_to is not None:
+            stmt = stmt.where(TrainingSession.start_time < _naive_utc(start_to))
+        if topic_id is not None:
+            stmt = stmt.where(TrainingSession.topic_id == topic_id)
+        if trainer_id is not None:
+            stmt = stmt.where(TrainingSession.trainer_id == trainer_id)
+        if has_free_seats is not None:
+            seats_left = TrainingSession.seats_taken + TrainingSession.seats_held < TrainingSession.capacity
+            stmt = stmt.where(seats_left if has_free_seats else ~seats_left)
+        return stmt
+
+    @staticmethod
+    async def search_sessions(
+        db: AsyncSession,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        topic_id: Optional[UUID] = None,
+        trainer_id: Optional[UUID] = None,
+        statuses: Sequence[str] = BOOKABLE_STATUSES,
+        has_free_seats: Optional[bool] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[TrainingSession]:
+        """Search sessions by time window, topic, trainer, status and free seats.
+
+        Results are ordered by start time, soonest first, and paged with a
+        ``(start_time, id)`` keyset cursor. See :meth:`build_search_query`
+        for the filters.
+
+        Returns:
+            List of matching training sessions
+        """
+        stmt = SessionService.build_search_query(
+            start_from, start_to, topic_id, trainer_id, statuses, has_free_seats
+        ).options(selectinload(TrainingSession.trainer), selectinload(TrainingSession.topic))
+        result = await db.execute(
+            paginate(
+                stmt, TrainingSession.start_time, TrainingSession.id, cursor,
+                limit=limit, descending=False
+            )
         )
         return result.scalars().all()
 
@@ -105,18 +240,68 @@ class SessionService:
             
         Returns:
             Updated training session if found, None otherwise
+
+        Raises:
+            HTTPException: If the new time overlaps another booking of an enrolled student
         """
         db_session = await SessionService.get_session_by_id(db, session_id)
         if not db_session:
             return None
         
+        was_cancelled = db_session.status == "cancelled"
         update_data = session_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_session, field, value)
             
         db.add(db_session)
+
+        # Striped sessions split a new capacity across their slots
+        if "capacity" in update_data and db_session.seat_slots:
+            await SeatCounterService.restripe(db, session_id, capacity=db_session.capacity)
+
+        # Keep the booked periods in step with a rescheduled session
+        if update_data.keys() & {"start_time", "duration_minutes"}:
+            try:
+                await db.flush()
+                await db.execute(
+                    update(Booking)
+                    .where(Booking.session_id == session_id)
+                    .values(
+                        period=select(TrainingSession.period)
+                        .where(TrainingSession.id == session_id)
+                        .scalar_subquery()
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            except IntegrityError as e:
+                await db.rollback()
+                if "ex_bookings_student_period" in str(e):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="New time overlaps another booking of an enrolled student"
+                    )
+                raise
+
+        # Cancellation notices go out in the same transaction, one statement for all bookers
+        cancelled = db_session.status == "cancelled" and not was_cancelled
+        if cancelled:
+            await NotificationService.notify_session_bookers(
+                db, [(session_id, "session_update", f"Session '{db_session.title}' was cancelled")]
+            )
+
+        # Capacity and status edits change what watchers can book
+        await SeatAvailabilityService.publish(db, session_id)
+        await ChangeLogService.record(db, [(SESSION, session_id, UPSERT, None)])
         await db.commit()
         await db.refresh(db_session)
+        await response_cache.invalidate(SESSIONS)
+
+        if not cancelled:
+            notification_dispatcher.publish(NotificationEvent(
+                "session_update",
+                f"Session '{db_session.title}' was updated",
+                session_id=session_id
+            ))
         logger.info(f"Updated session {session_id}")
         return db_session
 
@@ -135,7 +320,90 @@ class SessionService:
         if not db_session:
             return False
         
+        # Bookings are removed by the database cascade, so notify their
+        # students first, in the same transaction
+        if db_session.status != "cancelled":
+            await NotificationService.notify_session_bookers(
+                db, [(session_id, "session_update", f"Session '{db_session.title}' was cancelled")]
+            )
+
+        # The cascaded bookings leave the feeds of their students too
+        await db.execute(ChangeLogService.record_from(
+            select(literal(BOOKING), Booking.id, literal(DELETE), Booking.student_id)
+            .where(Booking.session_id == session_id)
+        ))
+        await ChangeLogService.record(db, [(SESSION, session_id, DELETE, None)])
         await db.delete(db_session)
         await db.commit()
+        await response_cache.invalidate(SESSIONS)
         logger.info(f"Deleted session {session_id}")
         return True
+
+    @staticmethod
+    async def advance_statuses(db: AsyncSession) -> Dict[str, int]:
+        """Move started sessions to active and ended ones to completed.
+
+        One UPDATE covers every due session. It only reads open sessions
+        whose start time has passed, which after the first run are the few
+        running right now, through the partial ``*_open`` start time index.
+        A transaction-level advisory lock keeps concurrent workers from
+        running the same tick; a worker that cannot take it skips the tick.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of sessions moved to each status
+        """
+        result = await db.execute(select(func.pg_try_advisory_xact_lock(SESSION_STATUS_LOCK)))
+        if not result.scalar():
+            await db.rollback()
+            return {}
+
+        now = datetime.utcnow()
+        ended = func.upper(TrainingSession.period) <= now
+        status_type = TrainingSession.status.type
+        result = await db.execute(
+            update(TrainingSession)
+            .where(
+                TrainingSession.deleted_at.is_(None),
+                _status_in(BOOKABLE_STATUSES),
+                TrainingSession.start_time <= now,
+                or_(TrainingSession.status == "upcoming", ended),
+            )
+            .values(status=case(
+                (ended, cast(literal("completed"), status_type)),
+                else_=cast(literal("active"), status_type)
+            ))
+            .returning(TrainingSession.id, TrainingSession.status)
+            .execution_options(synchronize_session=False)
+        )
+        moved: Dict[str, int] = {}
+        changes = []
+        for session_id, status in result.all():
+            moved[status] = moved.get(status, 0) + 1
+            changes.append((SESSION, session_id, UPSERT, None))
+        await ChangeLogService.record(db, changes)
+        await db.commit()
+        return moved
+
+
+async def advance_session_statuses() -> int:
+    """Run one status transition tick and report how many sessions moved."""
+    async with AsyncSessionLocal() as db:
+        moved = await SessionService.advance_statuses(db)
+    if moved:
+        await response_cache.invalidate(SESSIONS)
+        logger.info(
+            "Advanced session statuses: "
+            + ", ".join(f"{count} {status}" for status, count in sorted(moved.items()))
+        )
+    return sum(moved.values())
+
+
+# Session status scheduler, started with the application
+session_status_scheduler = PeriodicTask(
+    "session-status-scheduler",
+    settings.SESSION_STATUS_INTERVAL_SECONDS,
+    advance_session_statuses,
+)
@@ -0,0 +1,168 @@
+"""Topic Prerequisite Service
+
+This module maintains topic prerequisite relationships together with their
+transitive closure, so cycle checks and "all prerequisites of X" lookups are
+single indexed queries instead of graph walks.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, exists, func, literal, true, any_
+from sqlalchemy.dialects.postgresql import insert, UUID as PG_UUID, ARRAY
+from app.Models.prerequisite import TopicPrerequisite
+from app.Models.prerequisite_closure import TopicPrerequisiteClosure
+from uuid import UUID
+from typing import Optional, Sequence
+
+# Advisory lock key serializing prerequisite graph writes, so two concurrent
+# edge inserts cannot each pass the cycle check and close a loop together.
+PREREQUISITE_GRAPH_LOCK = 7_231_405_118
+
+
+class TopicPrerequisiteService:
+    """Service for managing topic prerequisites and their closure."""
+
+    @staticmethod
+    async def lock_graph(db: AsyncSession) -> None:
+        """Serialize prerequisite graph writes until the transaction ends.
+
+        Args:
+            db: Database session
+        """
+        await db.execute(select(func.pg_advisory_xact_lock(PREREQUISITE_GRAPH_LOCK)))
+
+    @staticmethod
+    async def would_create_cycle(db: AsyncSession, topic_id: UUID, prerequisite_id: UUID) -> bool:
+        """Check if making prerequisite_id a prerequisite of topic_id closes a cycle.
+
+        A cycle appears exactly when topic_id already is a (transitive)
+        prerequisite of prerequisite_id, which is one primary-key lookup.
+
+        Args:
+            db: Database session
+            topic_id: Topic that would gain the prerequisite
+            prerequisite_id: Topic that would become required
+
+        Returns:
+            True if the new relationship would create a cycle
+        """
+        if topic_id == prerequisite_id:
+            return True
+
+        result = await db.execute(
+            select(
+                exists().where(
+                    TopicPrerequisiteClosure.ancestor_id == topic_id,
+                    TopicPrerequisiteClosure.descendant_id == prerequisite_id
+                )
+            )
+        )
+        return result.scalar()
+
+    @staticmethod
+    async def add_prerequisite(db: AsyncSession, topic_id: UUID, prerequisite_id: UUID) -> TopicPrerequisite:
+        """Add a prerequisite edge and extend the closure in the same transaction.
+
+        Every ancestor of prerequisite_id (and prerequisite_id itself) becomes
+        an ancestor of topic_id and of all its descendants. The caller is
+        responsible for the cycle check and for committing.
+
+        Args:
+            db: Database session
+            topic_id: Topic that requires the prerequisite
+            prerequisite_id: Required topic
+
+        Returns:
+            The new (pending) prerequisite relationship
+        """
+        closure = TopicPrerequisiteClosure
+        id_type = PG_UUID(as_uuid=True)
+
+        prerequisite = TopicPrerequisite(topic_id=topic_id, prerequisite_id=prerequisite_id)
+        db.add(prerequisite)
+
+        ancestors = (
+            select(closure.ancestor_id.label("id"), closure.depth.label("depth"))
+            .where(closure.descendant_id == prerequisite_id)
+            .union_all(select(literal(prerequisite_id, id_type), literal(0)))
+            .subquery("ancestors")
+        )
+        descendants = (
+            select(closure.descendant_id.label("id"), closure.depth.label("depth"))
+            .where(closure.ancestor_id == topic_id)
+            .union_all(select(literal(topic_id, id_type), literal(0)))
+            .subquery("descendants")
+        )
+        paths = (
+            select(
+                ancestors.c.id,
+                descendants.c.id,
+                func.min(ancestors.c.depth + descendants.c.depth + 1)
+            )
+            .select_from(ancestors.join(descendants, true()))
+            .group_by(ancestors.c.id, descendants.c.id)
+        )
+        stmt = insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], paths)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[closure.ancestor_id, closure.descendant_id],
+            set_={"depth": func.least(closure.depth, stmt.excluded.depth)}
+        )
+        await db.execute(stmt)
+        return prerequisite
+
+    @staticmethod
+    async def remove_prerequisite(db: AsyncSession, prerequisite: TopicPrerequisite) -> None:
+        """Remove a prerequisite edge and repair the closure in the same transaction.
+
+        Only topic_id and its descendants can lose ancestors, so just their
+        closure rows are recomputed from the remaining edges. The caller is
+        responsible for committing.
+
+        Args:
+            db: Database session
+            prerequisite: Relationship to remove
+        """
+        topic_id = prerequisite.topic_id
+        result = await db.execute(
+            select(TopicPrerequisiteClosure.descendant_id)
+            .where(TopicPrerequisiteClosure.ancestor_id == topic_id)
+        )
+        affected = [topic_id, *result.scalars().all()]
+
+        await db.delete(prerequisite)
+        await db.flush()
+        await TopicPrerequisiteService.rebuild_closure(db, affected)
+
+    @staticmethod
+    async def rebuild_closure(db: AsyncSession, descendant_ids: Optional[Sequence[UUID]] = None) -> None:
+        """Recompute closure rows from topic_prerequisites.
+
+        Args:
+            db: Database session
+            descendant_ids: Topics whose ancestor rows are rebuilt, None for all
+        """
+        closure = TopicPrerequisiteClosure
+        edges = TopicPrerequisite
+
+        clear = delete(closure)
+        seed = select(
+            edges.topic_id.label("descendant_id"),
+            edges.prerequisite_id.label("ancestor_id"),
+            literal(1).label("depth")
+        )
+        if descendant_ids is not None:
+            ids = literal(list(descendant_ids), ARRAY(PG_UUID(as_uuid=True)))
+            clear = clear.where(closure.descendant_id == any_(ids))
+            seed = seed.where(edges.topic_id == any_(ids))
+        await db.execute(clear)
+
+        walk = seed.cte("walk", recursive=True)
+        walk = walk.union(
+            select(walk.c.descendant_id, edges.prerequisite_id, walk.c.depth + 1)
+            .join(edges, edges.topic_id == walk.c.ancestor_id)
+        )
+        await db.execute(
+            insert(closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(walk.c.ancestor_id, walk.c.descendant_id, func.min(walk.c.depth))
+                .group_by(walk.c.ancestor_id, walk.c.descendant_id)
+            )
+        )
@@ -6,6 +6,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.Models.trainer_topic import Trainertopic
+from app.core.response_cache import response_cache, TRAINER_TOPICS
 from uuid import UUID
 from typing import List, Optional
 
@@ -45,6 +46,7 @@ class TrainerTopicService:
         db.add(record)
         await db.commit()
         await db.refresh(record)
+        await response_cache.invalidate(TRAINER_TOPICS)
         logger.info(f"Assigned trainer {trainer_id} to topic {topic_id}")
         return record
 
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.Models.user_role import UserRole
 from app.Schemas.user_role import UserRoleCreate
+from app.core.principal_cache import principal_cache
 
 
 
@@ -21,6 +22,7 @@ async def assign_role_to_user(
         if not user_role.is_active:
             user_role.is_active = True
             await db.commit()
+            principal_cache.invalidate(data.user_id)
             return user_role
         raise ValueError("Role already assigned to user")
 
@@ -32,6 +34,7 @@ async def assign_role_to_user(
     db.add(new_user_role)
     await db.commit()
     await db.refresh(new_user_role)
+    principal_cache.invalidate(data.user_id)
     return new_user_role
 
 async def remove_role_from_user(
@@ -53,6 +56,7 @@ async def remove_role_from_user(
 
     user_role.is_active = False
     await db.commit()
+    principal_cache.invalidate(user_id)
     return user_role
 
 
@@ -6,6 +6,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.Models.user import User
+from app.core.pagination import paginate
 from uuid import UUID
 from typing import List, Optional
 
@@ -30,16 +31,24 @@ class UserService:
         return result.scalars().first()
 
     @staticmethod
-    async def get_all_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination.
+    async def get_all_users(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[User]:
+        """Get all users, newest first, with pagination.
         
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when cursor is given)
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the previous page
             
         Returns:
             List of users
         """
-        result = await db.execute(select(User).offset(skip).limit(limit))
+        result = await db.execute(
+            paginate(select(User), User.created_at, User.id, cursor, skip, limit)
+        )
         return result.scalars().all()
@@ -0,0 +1,115 @@
+"""Waitlist Service
+
+This module manages the queue of students waiting for a seat in a full
+session. Promotion out of the queue happens in BookingService when a booking
+is cancelled.
+"""
+import logging
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, exists, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from fastapi import HTTPException
+from app.Models.booking import Booking
+from app.Models.session import TrainingSession
+from app.Models.waitlist_entry import WaitlistEntry
+from app.Services.booking_service import BookingService, BOOKABLE_STATUSES
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class WaitlistService:
+    """Service for managing session waitlists."""
+
+    @staticmethod
+    async def join_waitlist(db: AsyncSession, session_id: UUID, student_id: UUID) -> dict:
+        """Queue a student for a full session.
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            student_id: Student UUID
+
+        Returns:
+            The waitlist entry with the student's position in the queue
+
+        Raises:
+            HTTPException: If the session is missing, not bookable, has free
+                seats, or the student is already booked or queued
+        """
+        result = await db.execute(
+            select(
+                TrainingSession.status,
+                TrainingSession.start_time,
+                TrainingSession.capacity,
+                TrainingSession.seats_taken,
+                TrainingSession.seats_held,
+                exists().where(
+                    Booking.session_id == session_id,
+                    Booking.student_id == student_id
+                ).label("booked")
+            ).where(TrainingSession.id == session_id, TrainingSession.deleted_at.is_(None))
+        )
+        session = result.first()
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+        if session.status not in BOOKABLE_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Cannot book {session.status} session")
+        if session.start_time < datetime.utcnow():
+            raise HTTPException(status_code=400, detail="Cannot book past sessions")
+        if session.booked:
+            raise HTTPException(status_code=400, detail="Already booked this session")
+        if session.seats_taken + session.seats_held < session.capacity:
+            raise HTTPException(status_code=400, detail="Session has free seats, book it directly")
+
+        await BookingService.check_prerequisites(db, session_id, student_id)
+
+        result = await db.execute(
+            insert(WaitlistEntry)
+            .values(session_id=session_id, student_id=student_id)
+            .on_conflict_do_nothing(constraint="uc_waitlist_session_student")
+            .returning(WaitlistEntry.id, WaitlistEntry.created_at)
+        )
+        entry = result.first()
+        if entry is None:
+            raise HTTPException(status_code=400, detail="Already on the waitlist")
+
+        position = await db.execute(
+            select(func.count())
+            .where(
+                WaitlistEntry.session_id == session_id,
+                tuple_(WaitlistEntry.created_at, WaitlistEntry.id) <= tuple_(entry.created_at, entry.id)
+            )
+        )
+        await db.commit()
+        logger.info(f"Student {student_id} joined the waitlist of session {session_id}")
+
+        return {
+            "id": entry.id,
+            "session_id": session_id,
+            "student_id": student_id,
+            "position": position.scalar_one(),
+            "created_at": entry.created_at,
+        }
+
+    @staticmethod
+    async def leave_waitlist(db: AsyncSession, session_id: UUID, student_id: UUID) -> bool:
+        """Remove a student from a session's waitlist.
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            student_id: Student UUID
+
+        Returns:
+            True if removed, False if the student was not queued
+        """
+        result = await db.execute(
+            delete(WaitlistEntry).where(
+                WaitlistEntry.session_id == session_id,
+                WaitlistEntry.student_id == student_id
+            )
+        )
+        await db.commit()
+        return result.rowcount > 0
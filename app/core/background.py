@@ -0,0 +1,83 @@
+"""Background Task Utilities
+
+This module runs recurring maintenance jobs (reminders, sweepers,
+reconcilers) on the application's event loop. Each job is started on
+application startup and cancelled on shutdown.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Run an async callable every ``interval_seconds`` until stopped.
+
+    Failures are logged and the next tick runs as scheduled, so one bad run
+    never stops the job.
+
+    Example:
+        >>> reminders = PeriodicTask("reminders", 60, send_due_reminders)
+        >>> reminders.start()
+        >>> await reminders.stop()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        action: Callable[[], Awaitable[Any]],
+        enabled: bool = True
+    ):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.action = action
+        self.enabled = enabled
+        self.runs = 0
+        self.failures = 0
+        self.last_result: Any = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Schedule the job on the running event loop."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancel the job and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> Any:
+        """Run the action a single time, outside the schedule."""
+        self.last_result = await self.action()
+        self.runs += 1
+        return self.last_result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return run counters."""
+        return {
+            "running": self._task is not None,
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_result": self.last_result,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Background task {self.name} failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
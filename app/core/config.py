@@ -52,6 +52,176 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins"
     )
     
+    # Principal Cache Configuration
+    PRINCIPAL_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache authenticated principals in-process to skip the per-request user lookup"
+    )
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds a cached principal stays valid"
+    )
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of cached principals per process"
+    )
+    
+    # Password Hashing Configuration
+    PASSWORD_HASH_EXECUTOR: str = Field(
+        default="thread",
+        description="Where Argon2 runs: thread, process or inline (on the event loop)"
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        description="Number of password hashing workers"
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=64,
+        ge=0,
+        description="Hashing jobs allowed to queue before requests get 503"
+    )
+    
+    # Booking Rules Configuration
+    ENFORCE_TRANSITIVE_PREREQUISITES: bool = Field(
+        default=False,
+        description="Require prerequisites of prerequisites too when booking a session"
+    )
+    ATTENDEE_RECONCILE_INTERVAL_SECONDS: int = Field(
+        default=10 * 60,
+        ge=1,
+        description="Seconds between reconciliations of session attendee counts with bookings"
+    )
+    
+    # Session Scheduling Configuration
+    SESSION_STATUS_INTERVAL_SECONDS: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds between runs moving started sessions to active and ended ones to completed"
+    )
+    
+    # Seat Hold Configuration
+    SEAT_HOLD_TTL_SECONDS: int = Field(
+        default=120,
+        ge=10,
+        description="Seconds a seat hold stays valid before its seat is released"
+    )
+    SEAT_HOLD_SWEEP_INTERVAL_SECONDS: int = Field(
+        default=15,
+        ge=1,
+        description="Seconds between sweeps releasing expired seat holds"
+    )
+    
+    # Seat Availability Stream Configuration
+    AVAILABILITY_STREAM_HEARTBEAT_SECONDS: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds of silence before an availability stream sends a keep-alive comment"
+    )
+    AVAILABILITY_LISTENER_RECONNECT_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait before reconnecting a lost availability LISTEN connection"
+    )
+    
+    # Change Feed Configuration
+    CHANGE_LOG_RETENTION_SECONDS: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=60,
+        description="Seconds change log entries are kept; older feed positions must resync"
+    )
+    CHANGE_LOG_COMPACT_INTERVAL_SECONDS: int = Field(
+        default=5 * 60,
+        ge=1,
+        description="Seconds between change log compactions"
+    )
+    
+    # Export Configuration
+    EXPORT_YIELD_PER: int = Field(
+        default=2000,
+        ge=1,
+        description="Rows fetched from the export cursor and encoded per streamed chunk"
+    )
+    
+    # Response Cache Configuration
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Serve public read endpoints from the response cache"
+    )
+    RESPONSE_CACHE_BACKEND: str = Field(
+        default="app.core.response_cache.BroadcastCacheBackend",
+        description=(
+            "Dotted path of the response cache backend class. BroadcastCacheBackend "
+            "sends invalidations to every worker over Postgres NOTIFY; MemoryCacheBackend "
+            "is per process, so other workers can serve stale data until the TTL expires"
+        )
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(
+        default=2000,
+        ge=1,
+        description="Maximum number of cached responses per process"
+    )
+    RESPONSE_CACHE_MAX_BYTES: int = Field(
+        default=32 * 1024 * 1024,
+        ge=1,
+        description="Maximum total size of cached response bodies per process"
+    )
+    RESPONSE_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds a cached response stays valid"
+    )
+    
+    # Notification Configuration
+    NOTIFICATION_QUEUE_MAX_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of notification events waiting to be written"
+    )
+    NOTIFICATION_BATCH_SIZE: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum number of events coalesced into one write"
+    )
+    NOTIFICATION_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=0.5,
+        ge=0,
+        description="How long the worker waits for more events before writing a batch"
+    )
+    NOTIFICATION_REMINDERS_ENABLED: bool = Field(
+        default=True,
+        description="Send reminders to bookers of upcoming sessions"
+    )
+    NOTIFICATION_REMINDER_LEAD_MINUTES: int = Field(
+        default=60,
+        ge=1,
+        description="Minutes before a session starts that its reminder is sent"
+    )
+    NOTIFICATION_REMINDER_INTERVAL_SECONDS: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds between reminder scheduler runs"
+    )
+    NOTIFICATION_COUNTER_RECONCILE_INTERVAL_SECONDS: int = Field(
+        default=600,
+        ge=1,
+        description="Seconds between unread counter reconciliation runs"
+    )
+    
+    # Idempotency Configuration
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = Field(
+        default=24 * 60 * 60,
+        ge=1,
+        description="Seconds a stored Idempotency-Key response can be replayed"
+    )
+    IDEMPOTENCY_SWEEP_INTERVAL_SECONDS: int = Field(
+        default=15 * 60,
+        ge=1,
+        description="Seconds between sweeps of expired idempotency keys"
+    )
+    
     # Application Configuration
     DEBUG: bool = Field(
         default=False,
@@ -66,6 +236,14 @@ class Settings(BaseSettings):
             raise ValueError('DATABASE_URL must start with postgresql+asyncpg:// or postgresql://')
         return v
     
+    @field_validator('PASSWORD_HASH_EXECUTOR')
+    @classmethod
+    def validate_password_hash_executor(cls, v: str) -> str:
+        """Validate password hashing executor kind."""
+        if v not in ("thread", "process", "inline"):
+            raise ValueError('PASSWORD_HASH_EXECUTOR must be one of: thread, process, inline')
+        return v
+    
     @field_validator('SECRET_KEY')
     @classmethod
     def validate_secret_key(cls, v: str) -> str:
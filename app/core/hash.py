@@ -2,8 +2,15 @@
 
 This module provides password hashing and verification using Argon2.
 """
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 
 # Use Argon2 for password hashing (modern, secure)
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
@@ -43,4 +50,94 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         >>> verify_password("wrongpass", hashed)
         False
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+class HashingPoolSaturated(Exception):
+    """Raised when the password hashing pool has no room for more work."""
+
+
+class PasswordHasher:
+    """Runs Argon2 hashing off the event loop in a bounded worker pool.
+
+    Argon2 is deliberately expensive, so hashing inline blocks every other
+    request on the worker. Jobs are submitted to a thread or process pool;
+    once ``workers + max_pending`` jobs are in flight new jobs are rejected
+    with :class:`HashingPoolSaturated` instead of queueing without bound.
+    The ``inline`` kind keeps the old synchronous behaviour.
+    """
+
+    KINDS = ("thread", "process", "inline")
+
+    def __init__(self, kind: str = "thread", workers: int = 4, max_pending: int = 64):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown password hash executor: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.rejected = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.kind == "inline":
+            return func(*args)
+
+        if self.in_flight >= self.workers + self.max_pending:
+            self.rejected += 1
+            raise HashingPoolSaturated("Password hashing pool is saturated")
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password in the pool. See :func:`get_password_hash`."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the pool. See :func:`verify_password`."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, occupancy and rejection counters."""
+        active = min(self.in_flight, self.workers)
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "active": active,
+            "pending": self.in_flight - active,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "utilization": round(active / self.workers, 2) if self.workers else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, waiting for running jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    kind=settings.PASSWORD_HASH_EXECUTOR,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
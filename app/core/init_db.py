@@ -22,6 +22,10 @@ async def init_db():
     """Initialize database with seed data."""
     # Ensure all tables and enums exist
     async with engine.begin() as conn:
+        # btree_gist backs the (student_id =, period &&) booking exclusion constraint
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        # pg_trgm backs typo-tolerant topic name search
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     async with AsyncSessionLocal() as db:
@@ -0,0 +1,109 @@
+"""Keyset Pagination Utilities
+
+This module provides opaque cursor pagination over ``(created_at, id)``, or
+any other ``(timestamp, id)`` key. Pages are fetched with a row-value
+comparison against the last row of the previous page instead of OFFSET, so
+every page costs one index range scan regardless of its depth.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a ``(created_at, id)`` position as an opaque cursor string.
+
+    Example:
+        >>> cursor = encode_cursor(session.created_at, session.id)
+        >>> print(cursor)
+        eyJjIjogIjIwMjUtMDEtMTVUMTA6MDA6MDAiLCAiaSI6ICIxMjNlNDU2Ny...
+    """
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(row_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(
+    stmt: Select,
+    created_at_column: Any,
+    id_column: Any,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    descending: bool = True,
+) -> Select:
+    """Apply newest-first keyset pagination to a select statement.
+
+    When a cursor is given the statement continues strictly after that
+    position and ``skip`` is ignored; otherwise ``skip`` is applied as a
+    plain OFFSET for clients that still page that way.
+
+    Args:
+        stmt: Select statement to paginate
+        created_at_column: Column holding the creation timestamp
+        id_column: Primary key column used as tie-breaker
+        cursor: Opaque cursor returned with the previous page
+        skip: Legacy offset, used only without a cursor
+        limit: Maximum number of rows, or None for no limit
+        descending: False to page oldest first instead
+
+    Returns:
+        The ordered and bounded statement
+    """
+    if descending:
+        stmt = stmt.order_by(created_at_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(created_at_column, id_column)
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        position = tuple_(created_at, row_id)
+        key = tuple_(created_at_column, id_column)
+        stmt = stmt.where(key < position if descending else key > position)
+    elif skip:
+        stmt = stmt.offset(skip)
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def set_next_cursor(
+    response: Response,
+    items: Sequence[Any],
+    limit: Optional[int],
+    sort_attribute: str = "created_at"
+) -> None:
+    """Expose the cursor of the page after ``items`` in the response headers.
+
+    A full page means more rows may follow, so the last item's position is
+    returned; a short page is the end of the listing and sets no header.
+    """
+    if limit and len(items) == limit:
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, sort_attribute), last.id)
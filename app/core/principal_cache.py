@@ -0,0 +1,90 @@
+"""Authenticated Principal Cache
+
+This module keeps a bounded, per-process TTL/LRU cache of the user fields
+needed to authorize a request (id, role, is_active), so authenticated
+endpoints do not have to re-read the users table on every call.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """Authorization-relevant snapshot of a user."""
+    id: UUID
+    role: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """Bounded TTL/LRU cache of principals keyed by user id.
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry is
+    evicted once ``max_size`` is reached. Writers that change a user's role or
+    active flag must call :meth:`invalidate` (or :meth:`clear`) after commit.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, enabled: bool = True):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[UUID, tuple[float, CachedPrincipal]]" = OrderedDict()
+
+    def get(self, user_id: UUID) -> Optional[CachedPrincipal]:
+        """Return the cached principal, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, principal: CachedPrincipal) -> None:
+        """Store a principal, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a single user from the cache."""
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+)
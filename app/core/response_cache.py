@@ -0,0 +1,344 @@
+"""Public Response Cache
+
+This module caches the serialized JSON of public, read-mostly endpoints.
+Entries are keyed on path and query string plus the current version of every
+namespace the endpoint reads from; write paths bump a namespace version after
+commit, which makes all older entries unreachable without scanning for them.
+Cached responses carry an ETag so unchanged pages are answered with 304.
+With several workers, version bumps are broadcast over Postgres NOTIFY so a
+write in one worker invalidates the entries of all of them.
+"""
+import functools
+import hashlib
+import importlib
+import inspect
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select, func
+
+from app.DB.session import engine
+from app.core.config import settings
+from app.core.serialization import dumps, serializer
+
+logger = logging.getLogger(__name__)
+
+# Namespaces bumped by write paths
+SESSIONS = "sessions"
+TOPICS = "topics"
+TOPIC_PREREQUISITES = "topic_prerequisites"
+TRAINER_TOPICS = "trainer_topics"
+
+# Keyword argument the cache wrapper adds to endpoint signatures
+_REQUEST_PARAM = "response_cache_request"
+
+# Postgres NOTIFY channel carrying namespace bumps between workers
+RESPONSE_CACHE_CHANNEL = "response_cache"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response body with the headers needed to replay it."""
+    body: bytes
+    etag: str
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+class ResponseCacheBackend(ABC):
+    """Storage for cached responses and namespace versions.
+
+    Backends shared between processes (e.g. Redis) let every worker see the
+    same versions, so a write in one worker invalidates all of them.
+    Per-process backends can instead name a NOTIFY ``channel``: the
+    application's listener connection then hands its notifications to
+    :meth:`on_notify`, and calls :meth:`on_listen` whenever it (re)connects.
+    """
+
+    # NOTIFY channel the backend listens on, if any
+    channel: Optional[str] = None
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCacheBackend":
+        """Build the backend from application settings."""
+        return cls()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for key, or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedResponse) -> None:
+        """Store a response under key."""
+
+    @abstractmethod
+    async def get_versions(self, namespaces: Sequence[str]) -> Sequence[int]:
+        """Return the current version of each namespace."""
+
+    @abstractmethod
+    async def bump(self, namespace: str) -> None:
+        """Advance a namespace version, invalidating its cached responses."""
+
+    def on_notify(self, connection, pid, channel, payload: str) -> None:
+        """Apply a notification received on :attr:`channel`."""
+
+    def on_listen(self) -> None:
+        """Called when the listener connection (re)connects."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return backend occupancy counters."""
+        return {}
+
+
+class MemoryCacheBackend(ResponseCacheBackend):
+    """Per-process LRU backend bounded by entry count and total body size.
+
+    Namespace versions live in the process too, so with several workers a
+    write only invalidates the worker that made it; the others keep serving
+    their entries until RESPONSE_CACHE_TTL_SECONDS expire. Use it for
+    single-process deployments, or :class:`BroadcastCacheBackend` otherwise.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, CachedResponse]]" = OrderedDict()
+        self._bytes = 0
+        self._versions: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls) -> "MemoryCacheBackend":
+        return cls(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        if len(value.body) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._bytes += len(value.body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    async def get_versions(self, namespaces: Sequence[str]) -> Sequence[int]:
+        return [self._versions.get(namespace, 0) for namespace in namespaces]
+
+    async def bump(self, namespace: str) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].body)
+
+
+class BroadcastCacheBackend(MemoryCacheBackend):
+    """Per-process LRU backend whose version bumps reach every worker.
+
+    Versions stay in process memory, so lookups cost no I/O. A bump is
+    applied locally and sent on RESPONSE_CACHE_CHANNEL; the other workers
+    apply it when their listener receives it. A worker whose listener
+    reconnects drops its entries, since bumps sent meanwhile were missed.
+    """
+
+    channel = RESPONSE_CACHE_CHANNEL
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tags this process's notifications, so it skips its own bumps
+        self.origin = uuid.uuid4().hex
+        self.remote_bumps = 0
+        self.resets = 0
+
+    async def bump(self, namespace: str) -> None:
+        await super().bump(namespace)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(select(func.pg_notify(self.channel, f"{self.origin} {namespace}")))
+                await conn.commit()
+        except Exception as e:
+            # The write already committed; other workers catch up within the TTL
+            logger.error(f"Could not broadcast response cache bump of {namespace}: {e}")
+
+    def on_notify(self, connection, pid, channel, payload: str) -> None:
+        origin, _, namespace = payload.partition(" ")
+        if origin == self.origin:
+            return
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        self.remote_bumps += 1
+
+    def on_listen(self) -> None:
+        self.resets += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "remote_bumps": self.remote_bumps, "resets": self.resets}
+
+
+def load_backend(path: str) -> ResponseCacheBackend:
+    """Instantiate the backend class named by a dotted path."""
+    module_name, _, class_name = path.rpartition(".")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class.from_settings()
+
+
+class ResponseCache:
+    """Versioned response cache in front of public GET endpoints.
+
+    Example:
+        >>> @topic_router.get("/{topic_id}", response_model=TopicResponse)
+        >>> @response_cache.cached(TopicResponse, TOPICS)
+        >>> async def get_topic(topic_id: UUID, db: AsyncSession = Depends(get_db)):
+        >>>     ...
+
+        Writers call ``await response_cache.invalidate(TOPICS)`` after commit.
+    """
+
+    def __init__(self, enabled: bool = True, backend: Optional[ResponseCacheBackend] = None):
+        self.enabled = enabled
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Bump namespace versions after a committed write."""
+        if not self.enabled:
+            return
+        for namespace in namespaces:
+            await self.backend.bump(namespace)
+
+    def cached(self, response_model: Any, *namespaces: str, trusted: bool = False):
+        """Decorate an endpoint so its JSON body is cached.
+
+        Args:
+            response_model: Type the endpoint result is serialized as, or None
+                to encode it with ``jsonable_encoder``
+            namespaces: Namespaces whose writes invalidate the response
+            trusted: The endpoint returns instances of the response schemas,
+                so they are encoded without re-validation
+
+        Only successful results are cached; raised HTTP errors pass through.
+        Headers the endpoint sets on an injected ``Response``, or on the
+        ``Response`` it returns, are cached too.
+        """
+        compiled = serializer(response_model) if response_model is not None else None
+
+        def decorator(endpoint):
+            signature = inspect.signature(endpoint)
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request: Request = kwargs.pop(_REQUEST_PARAM)
+                if not self.enabled:
+                    return await endpoint(*args, **kwargs)
+
+                # Versions are read before the endpoint runs, so a write that
+                # commits meanwhile stores this response under a stale key
+                key = await self._key(request, namespaces)
+                entry = await self.backend.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return self._respond(entry, request)
+
+                self.misses += 1
+                result = await endpoint(*args, **kwargs)
+                responses = [arg for arg in kwargs.values() if isinstance(arg, Response)]
+                if isinstance(result, Response):
+                    # Already rendered, e.g. a ReadModelResponse
+                    body = bytes(result.body)
+                    responses.append(result)
+                elif compiled is not None:
+                    body = compiled.trusted_json(result) if trusted else compiled.validate_json(result)
+                else:
+                    body = dumps(jsonable_encoder(result))
+
+                headers = tuple(
+                    (name, value)
+                    for response in responses
+                    for name, value in response.headers.items()
+                    if name.lower() not in ("content-length", "content-type")
+                )
+                entry = CachedResponse(body=body, etag=self._etag(body), headers=headers)
+                await self.backend.set(key, entry)
+                return self._respond(entry, request)
+
+            wrapper.__signature__ = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            ])
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and backend occupancy."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            **(self.backend.stats() if self.backend else {}),
+        }
+
+    async def _key(self, request: Request, namespaces: Sequence[str]) -> str:
+        versions = await self.backend.get_versions(namespaces)
+        query = urlencode(sorted(request.query_params.multi_items()))
+        tag = ".".join(f"{namespace}:{version}" for namespace, version in zip(namespaces, versions))
+        return f"{tag}|{request.url.path}?{query}"
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    def _respond(self, entry: CachedResponse, request: Request) -> Response:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            if entry.etag in tags or "*" in tags:
+                self.not_modified += 1
+                return Response(status_code=304, headers={"ETag": entry.etag})
+
+        response = Response(content=entry.body, media_type="application/json")
+        for name, value in entry.headers:
+            response.headers[name] = value
+        response.headers["ETag"] = entry.etag
+        return response
+
+
+# Global response cache instance
+response_cache = ResponseCache(
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    backend=load_backend(settings.RESPONSE_CACHE_BACKEND),
+)
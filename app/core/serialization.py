@@ -0,0 +1,91 @@
+"""JSON Serialization
+
+This module provides the JSON encoding used wherever the application renders
+responses itself: :func:`dumps` encodes with ``orjson`` when it is installed
+and falls back to the standard library otherwise, producing the same bytes as
+Pydantic's ``dump_json``. Response types are compiled into a
+:class:`Serializer` once, at import of the routes using them, and shared
+instead of building a ``TypeAdapter`` per decorated endpoint.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson handles natively, for the stdlib fallback."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON.
+
+    UUIDs and datetimes are encoded as Pydantic does, with ``Z`` for UTC.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with :func:`dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class Serializer:
+    """Precompiled serializer for one response type.
+
+    Example:
+        >>> sessions = serializer(List[SessionResponse])
+        >>> body = sessions.validate_json(orm_sessions)
+        >>> body = sessions.trusted_json([SessionResponse.model_construct(...) for ...])
+    """
+
+    def __init__(self, response_type: Any):
+        self.response_type = response_type
+        self.adapter = TypeAdapter(response_type)
+
+    def validate_json(self, content: Any) -> bytes:
+        """Validate content (e.g. ORM objects) against the type and encode it."""
+        return self.adapter.dump_json(self.adapter.validate_python(content, from_attributes=True))
+
+    def trusted_json(self, content: Any) -> bytes:
+        """Encode content that already holds instances of the response schemas.
+
+        Validation is skipped; use only for data built from validated models.
+        """
+        return self.adapter.dump_json(content, warnings=False)
+
+    def response(self, content: Any, trusted: bool = False, **kwargs) -> Response:
+        """Render content as a JSON response."""
+        body = self.trusted_json(content) if trusted else self.validate_json(content)
+        return Response(content=body, media_type="application/json", **kwargs)
+
+
+_serializers: Dict[Any, Serializer] = {}
+
+
+def serializer(response_type: Any) -> Serializer:
+    """Return the shared serializer of a response type, compiling it on first use."""
+    compiled = _serializers.get(response_type)
+    if compiled is None:
+        compiled = _serializers[response_type] = Serializer(response_type)
+    return compiled
+
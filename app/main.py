@@ -13,8 +13,9 @@ from slowapi.errors import RateLimitExceeded
 
 # Import models to ensure they are registered with SQLAlchemy
 from app.Models import (
-    User, Topic, TopicPrerequisite, Trainertopic, Studenttopic,
-    TrainingSession, Booking, Notification
+    User, Topic, TopicPrerequisite, TopicPrerequisiteClosure, Trainertopic,
+    Studenttopic, TrainingSession, SessionSeatSlot, Booking, WaitlistEntry, SeatHold,
+    Notification, NotificationCounter, IdempotencyKey, ChangeLogEntry, ChangeLogFloor
 )
 
 # Import routers
@@ -27,12 +28,28 @@ from app.Routers.sessions import sessions_router
 from app.Routers.bookings import bookings_router
 from app.Routers.student_subjects import student_subjects_router
 from app.Routers.notifications import notifications_router
+from app.Routers.search import search_router
+from app.Routers.changes import changes_router
+from app.Routers.exports import exports_router
 from app.Routers.roles import role_router
 from app.Routers.permission import permission_router
 from app.Routers.role_permission import Role_Permission_router
 from app.Routers.user_roles import user_roles_router
 from app.core.init_db import init_db
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.hash import password_hasher
+from app.core.response_cache import response_cache
+from app.Services.notification_dispatcher import (
+    notification_dispatcher, reminder_scheduler, counter_reconciler
+)
+from app.Services.idempotency_service import idempotency_sweeper, REPLAYED_HEADER
+from app.Services.booking_service import attendee_reconciler
+from app.Services.seat_hold_service import seat_hold_sweeper
+from app.Services.session_service import session_status_scheduler
+from app.Services.seat_availability import availability_broadcaster
+from app.Services.change_log_service import change_log_compactor
+from app.core.pagination import NEXT_CURSOR_HEADER
 
 # Configure logging
 logging.basicConfig(
@@ -65,6 +82,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, REPLAYED_HEADER],
 )
 
 # OAuth2 scheme for authentication
@@ -80,6 +98,9 @@ app.include_router(sessions_router)
 app.include_router(bookings_router)
 app.include_router(student_subjects_router)
 app.include_router(notifications_router)
+app.include_router(search_router)
+app.include_router(changes_router)
+app.include_router(exports_router)
 app.include_router(role_router)
 app.include_router(permission_router)
 app.include_router(Role_Permission_router)
@@ -92,6 +113,35 @@ app.include_router(user_roles_router)
 async def startup_event():
     """Run startup tasks."""
     await init_db()
+    notification_dispatcher.start()
+    reminder_scheduler.start()
+    counter_reconciler.start()
+    idempotency_sweeper.start()
+    attendee_reconciler.start()
+    seat_hold_sweeper.start()
+    session_status_scheduler.start()
+    # Response cache bumps from other workers share the availability listener
+    if response_cache.backend.channel:
+        availability_broadcaster.listen(
+            response_cache.backend.channel, response_cache.backend.on_notify, response_cache.backend.on_listen
+        )
+    availability_broadcaster.start()
+    change_log_compactor.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Run shutdown tasks."""
+    await reminder_scheduler.stop()
+    await counter_reconciler.stop()
+    await idempotency_sweeper.stop()
+    await attendee_reconciler.stop()
+    await seat_hold_sweeper.stop()
+    await session_status_scheduler.stop()
+    await availability_broadcaster.stop()
+    await change_log_compactor.stop()
+    await notification_dispatcher.stop()
+    password_hasher.shutdown()
 
 
 @app.get("/", tags=["Health"])
@@ -108,4 +158,18 @@ async def root(request: Request):
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {
+        "status": "healthy",
+        "principal_cache": principal_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "response_cache": response_cache.stats(),
+        "notifications": notification_dispatcher.stats(),
+        "reminders": reminder_scheduler.stats(),
+        "unread_counters": counter_reconciler.stats(),
+        "idempotency_sweeper": idempotency_sweeper.stats(),
+        "attendee_counts": attendee_reconciler.stats(),
+        "seat_holds": seat_hold_sweeper.stats(),
+        "session_statuses": session_status_scheduler.stats(),
+        "availability_stream": availability_broadcaster.stats(),
+        "change_log": change_log_compactor.stats()
+    }
\ No newline at end of file
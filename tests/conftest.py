@@ -0,0 +1,52 @@
+"""Shared Test Fixtures
+
+Fixtures used by more than one test module:
+1. search_bench_db: one million seeded sessions, rolled back afterwards
+"""
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.DB.session import AsyncSessionLocal
+from app.core.config import settings
+
+SEARCH_BENCH_SESSIONS = 1_000_000
+SEARCH_BENCH_TOPICS = 200
+
+
+@pytest_asyncio.fixture
+async def search_bench_db():
+    """Yield a database session holding 1M sessions over 200 topics and four years.
+
+    The rows are inserted in the session's transaction and rolled back at
+    teardown, so they are never visible to the running API, its background
+    tasks or other tests. Seat counters stay at 0 to match the (absent)
+    bookings.
+    """
+    async with AsyncSessionLocal() as db:
+        trainer = await db.execute(
+            text("SELECT id FROM users WHERE email = :email"), {"email": settings.SUPER_ADMIN_EMAIL}
+        )
+        trainer_id = trainer.scalar_one()
+        await db.execute(text(
+            "INSERT INTO topics (id, name, description, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'Search Bench ' || g, 'Search benchmark', now(), now() "
+            "FROM generate_series(1, :topics) g ON CONFLICT (name) DO NOTHING"
+        ), {"topics": SEARCH_BENCH_TOPICS})
+        await db.execute(text(
+            "INSERT INTO sessions (id, trainer_id, topic_id, title, start_time, duration_minutes, "
+            "capacity, current_attendees, status, created_at, updated_at) "
+            "SELECT gen_random_uuid(), :trainer_id, t.ids[1 + g % array_length(t.ids, 1)], "
+            "'Bench Session ' || g, now() - interval '2 years' + (g % 1051200) * interval '1 minute' * 2, "
+            "60, 10, 0, "
+            "(CASE WHEN g % 1051200 < 525600 THEN (ARRAY['completed', 'cancelled'])[1 + g % 2] "
+            "ELSE (ARRAY['upcoming', 'active', 'cancelled'])[1 + g % 3] END)::session_status, "
+            "now(), now() "
+            "FROM generate_series(1, :count) g, "
+            "(SELECT array_agg(id) AS ids FROM topics WHERE name LIKE 'Search Bench %') t"
+        ), {"trainer_id": trainer_id, "count": SEARCH_BENCH_SESSIONS})
+        # ANALYZE samples the transaction's own rows, so plans reflect the seed
+        await db.execute(text("ANALYZE sessions"))
+        try:
+            yield db
+        finally:
+            await db.rollback()
@@ -41,3 +41,84 @@ async def test_super_admin_login():
         })
         assert response.status_code == 200
         assert response.json()["token_type"] == "bearer"
+
+@pytest.mark.asyncio
+async def test_principal_cache_serves_repeat_requests():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        response = await client.post("/auth/login", json={
+            "email": settings.SUPER_ADMIN_EMAIL,
+            "password": settings.SUPER_ADMIN_PASSWORD
+        })
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        # Warm the cache, then check that repeat requests are hits
+        await client.get("/users/", headers=headers)
+        before = (await client.get("/health")).json()["principal_cache"]
+        if not before["enabled"]:
+            pytest.skip("Principal cache disabled")
+
+        for _ in range(3):
+            assert (await client.get("/users/", headers=headers)).status_code == 200
+        after = (await client.get("/health")).json()["principal_cache"]
+
+        assert after["hits"] - before["hits"] >= 3
+        assert after["misses"] == before["misses"]
+
+async def _health_p99_during_login_burst(logins: int = 200) -> float:
+    """Run a login burst in-process and return /health p99 latency in ms."""
+    import asyncio
+    import time
+    from app.main import app
+    from app.Routers.auth_router import limiter
+
+    limiter.enabled = False  # the burst deliberately exceeds the login rate limit
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120.0) as client:
+            async def login():
+                return await client.post("/auth/login", json={
+                    "email": settings.SUPER_ADMIN_EMAIL,
+                    "password": settings.SUPER_ADMIN_PASSWORD
+                })
+
+            async def probe(burst):
+                while not burst.done():
+                    started = time.perf_counter()
+                    await client.get("/health")
+                    latencies.append(time.perf_counter() - started)
+                    await asyncio.sleep(0.005)
+
+            burst = asyncio.ensure_future(asyncio.gather(*[login() for _ in range(logins)]))
+            await asyncio.gather(burst, probe(burst))
+    finally:
+        limiter.enabled = True
+
+    latencies.sort()
+    return latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000
+
+
+# Largest /health p99 with pooled hashing, relative to inline hashing: the pool
+# must at least halve the stalls, which inline Argon2 causes on the event loop
+POOLED_HASHING_MAX_P99_RATIO = 0.5
+
+
+@pytest.mark.asyncio
+async def test_benchmark_health_latency_during_login_burst():
+    """Compare /health p99 during a 200-login burst: inline vs pooled Argon2."""
+    from app.core.hash import password_hasher
+
+    original = (password_hasher.kind, password_hasher.max_pending)
+    try:
+        password_hasher.kind = "inline"
+        before = await _health_p99_during_login_burst()
+
+        password_hasher.kind, password_hasher.max_pending = "thread", 200
+        after = await _health_p99_during_login_burst()
+    finally:
+        password_hasher.kind, password_hasher.max_pending = original
+
+    print(f"\n/health p99 during 200-login burst: inline={before:.1f}ms pooled={after:.1f}ms")
+    assert after <= before * POOLED_HASHING_MAX_P99_RATIO, (
+        f"Pooled hashing kept /health p99 at {after:.1f}ms against {before:.1f}ms inline"
+    )
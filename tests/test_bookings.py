@@ -5,6 +5,10 @@ Tests for booking flow:
 2. Check Capacity
 3. Cancel Booking
 """
+import asyncio
+import csv
+import io
+import json
 import pytest
 import httpx
 from datetime import datetime, timedelta, timezone
@@ -69,3 +73,558 @@ async def test_booking_flow():
         # 4. Verify
         bookings = await client.get("/sessions/my-bookings", headers=headers)
         assert len(bookings.json()) > 0
+
+@pytest.mark.asyncio
+async def test_batch_booking_reports_per_student_results():
+    session_id = await setup_session()  # capacity 5
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        student_ids = []
+        for i in range(7):
+            response = await client.post("/auth/register", json={
+                "name": f"Batch Booker {i}",
+                "email": f"student_batch_{uuid.uuid4().hex[:8]}@test.com",
+                "password": "Pass123!Student"
+            })
+            student_ids.append(response.json()["id"])
+
+        unknown_id = str(uuid.uuid4())
+        response = await client.post(
+            f"/sessions/{session_id}/bookings:batch",
+            json={"student_ids": student_ids + [student_ids[0], unknown_id]},
+            headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["booked"] == 5
+
+        results = {result["student_id"]: result for result in data["results"]}
+        assert len(data["results"]) == 8
+        assert all(results[s]["success"] and results[s]["booking_id"] for s in student_ids[:5])
+        assert all(results[s]["detail"] == "Session is full" for s in student_ids[5:])
+        assert results[unknown_id]["detail"] == "Student not found"
+
+        session = await client.get(f"/sessions/{session_id}")
+        assert session.json()["current_attendees"] == 5
+
+        # Re-running the batch books nobody twice
+        response = await client.post(
+            f"/sessions/{session_id}/bookings:batch",
+            json={"student_ids": student_ids[:2]},
+            headers=headers
+        )
+        assert response.json()["booked"] == 0
+        assert all(r["detail"] == "Already booked this session" for r in response.json()["results"])
+
+@pytest.mark.asyncio
+async def test_batch_booking_skips_overlapping_student_before_taking_seats():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Batch Overlap {uuid.uuid4().hex[:4]}", "description": "D"}, headers=headers)
+        me = await client.get("/auth/me", headers=headers)
+        base = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=5)
+        # 10:00-11:00 with 2 seats, and 10:30-11:30
+        session_ids = []
+        for offset, capacity in ((0, 2), (30, 5)):
+            s_resp = await client.post("/sessions/", json={
+                "title": "Batch Overlap Test",
+                "start_time": (base + timedelta(minutes=offset)).isoformat(),
+                "duration_minutes": 60,
+                "topic_id": t_resp.json()["id"],
+                "trainer_id": me.json()["id"],
+                "capacity": capacity
+            }, headers=headers)
+            session_ids.append(s_resp.json()["id"])
+        target, other = session_ids
+
+        student_ids = []
+        for i in range(3):
+            response = await client.post("/auth/register", json={
+                "name": f"Batch Overlapper {i}",
+                "email": f"student_batch_overlap_{uuid.uuid4().hex[:8]}@test.com",
+                "password": "Pass123!Student"
+            })
+            student_ids.append(response.json()["id"])
+        response = await client.post(
+            f"/sessions/{other}/bookings:batch", json={"student_ids": student_ids[:1]}, headers=headers
+        )
+        assert response.json()["booked"] == 1
+
+        # The first student overlaps, so both seats go to the other two
+        response = await client.post(
+            f"/sessions/{target}/bookings:batch", json={"student_ids": student_ids}, headers=headers
+        )
+        data = response.json()
+        assert data["booked"] == 2
+        results = {result["student_id"]: result for result in data["results"]}
+        assert results[student_ids[0]]["detail"] == "Already booked a session on the same time"
+        assert all(results[s]["success"] for s in student_ids[1:])
+
+        session = await client.get(f"/sessions/{target}")
+        assert session.json()["current_attendees"] == 2
+
+@pytest.mark.asyncio
+async def test_overlapping_bookings_are_rejected():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Overlap Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        topic_id = t_resp.json()["id"]
+        me = await client.get("/auth/me", headers=admin_headers)
+        trainer_id = me.json()["id"]
+
+        base = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=3)
+        session_ids = []
+        # 10:00-11:00, 10:30-11:30 (overlaps), 11:00-12:00 (adjacent)
+        for offset in (0, 30, 60):
+            s_resp = await client.post("/sessions/", json={
+                "title": "Overlap Test",
+                "start_time": (base + timedelta(minutes=offset)).isoformat(),
+                "duration_minutes": 60,
+                "topic_id": topic_id,
+                "trainer_id": trainer_id,
+                "capacity": 5
+            }, headers=admin_headers)
+            session_ids.append(s_resp.json()["id"])
+
+        student_email = f"student_overlap_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={
+            "name": "Overlapper",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.post("/bookings/", json={"session_id": session_ids[0]}, headers=headers)
+        assert response.status_code == 201
+
+        response = await client.post("/bookings/", json={"session_id": session_ids[1]}, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Already booked a session on the same time"
+
+        # The rejected booking did not keep a seat
+        session = await client.get(f"/sessions/{session_ids[1]}")
+        assert session.json()["current_attendees"] == 0
+
+        response = await client.post("/bookings/", json={"session_id": session_ids[2]}, headers=headers)
+        assert response.status_code == 201
+
+@pytest.mark.asyncio
+async def test_waitlist_head_is_promoted_on_cancellation():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Waitlist Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        me = await client.get("/auth/me", headers=admin_headers)
+        s_resp = await client.post("/sessions/", json={
+            "title": "Waitlist Test",
+            "start_time": (datetime.now(timezone.utc) + timedelta(days=8)).isoformat(),
+            "topic_id": t_resp.json()["id"],
+            "trainer_id": me.json()["id"],
+            "capacity": 1
+        }, headers=admin_headers)
+        session_id = s_resp.json()["id"]
+
+        headers = []
+        for name in ("Seated", "First", "Second"):
+            email = f"student_wait_{uuid.uuid4().hex[:8]}@test.com"
+            await client.post("/auth/register", json={"name": name, "email": email, "password": "Pass123!Student"})
+            headers.append({"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"})
+        seated, first, second = headers
+
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=seated)
+        assert booking.status_code == 201
+
+        # Seats left: book directly instead
+        response = await client.post(f"/sessions/{session_id}/waitlist", headers=seated)
+        assert response.status_code == 400
+
+        response = await client.post(f"/sessions/{session_id}/waitlist", headers=first)
+        assert response.status_code == 201
+        assert response.json()["position"] == 1
+        response = await client.post(f"/sessions/{session_id}/waitlist", headers=second)
+        assert response.json()["position"] == 2
+        response = await client.post(f"/sessions/{session_id}/waitlist", headers=second)
+        assert response.json()["detail"] == "Already on the waitlist"
+
+        await client.delete(f"/bookings/{booking.json()['id']}", headers=seated)
+
+        promoted = await client.get("/sessions/my-bookings", headers=first)
+        assert [b["session_id"] for b in promoted.json()] == [session_id]
+        still_waiting = await client.get("/sessions/my-bookings", headers=second)
+        assert still_waiting.json() == []
+
+        session = await client.get(f"/sessions/{session_id}")
+        assert session.json()["current_attendees"] == 1
+
+@pytest.mark.asyncio
+async def test_seat_hold_is_converted_into_booking():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Hold Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        me = await client.get("/auth/me", headers=admin_headers)
+        s_resp = await client.post("/sessions/", json={
+            "title": "Seat Hold Test",
+            "start_time": (datetime.now(timezone.utc) + timedelta(days=9)).isoformat(),
+            "topic_id": t_resp.json()["id"],
+            "trainer_id": me.json()["id"],
+            "capacity": 1
+        }, headers=admin_headers)
+        session_id = s_resp.json()["id"]
+
+        headers = []
+        for name in ("Holder", "Other"):
+            email = f"student_hold_{uuid.uuid4().hex[:8]}@test.com"
+            await client.post("/auth/register", json={"name": name, "email": email, "password": "Pass123!Student"})
+            headers.append({"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"})
+        holder, other = headers
+
+        hold = await client.post(f"/sessions/{session_id}/hold", headers=holder)
+        assert hold.status_code == 201
+        hold_token = hold.json()["hold_token"]
+
+        # The held seat counts against capacity
+        session = await client.get(f"/sessions/{session_id}")
+        assert session.json()["held_seats"] == 1
+        response = await client.post("/bookings/", json={"session_id": session_id}, headers=other)
+        assert response.json()["detail"] == "Session is full"
+        response = await client.post("/bookings/", json={"session_id": session_id, "hold_token": hold_token}, headers=other)
+        assert response.json()["detail"] == "Seat hold not found or expired"
+
+        booking = await client.post("/bookings/", json={"session_id": session_id, "hold_token": hold_token}, headers=holder)
+        assert booking.status_code == 201
+
+        session = await client.get(f"/sessions/{session_id}")
+        assert session.json()["current_attendees"] == 1
+        assert session.json()["held_seats"] == 0
+
+
+async def setup_hold_session(client, admin_headers, capacity: int = 1):
+    """Create a session and two students; the first takes a seat hold."""
+    t_resp = await client.post("/topics/", json={"name": f"Hold Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+    me = await client.get("/auth/me", headers=admin_headers)
+    s_resp = await client.post("/sessions/", json={
+        "title": "Seat Hold Test",
+        "start_time": (datetime.now(timezone.utc) + timedelta(days=9)).isoformat(),
+        "topic_id": t_resp.json()["id"],
+        "trainer_id": me.json()["id"],
+        "capacity": capacity
+    }, headers=admin_headers)
+    session_id = s_resp.json()["id"]
+
+    headers = []
+    for name in ("Holder", "Other"):
+        email = f"student_hold_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={"name": name, "email": email, "password": "Pass123!Student"})
+        headers.append({"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"})
+
+    hold = await client.post(f"/sessions/{session_id}/hold", headers=headers[0])
+    assert hold.status_code == 201
+    return session_id, hold.json()["hold_token"], headers
+
+
+@pytest.mark.asyncio
+async def test_booking_without_token_books_the_held_seat():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        session_id, _, (holder, other) = await setup_hold_session(client, admin_headers, capacity=2)
+
+        # The holder's own seat is booked, not a second one
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=holder)
+        assert booking.status_code == 201
+        session = (await client.get(f"/sessions/{session_id}")).json()
+        assert (session["current_attendees"], session["held_seats"]) == (1, 0)
+
+        # So the remaining seat is still free for someone else
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=other)
+        assert booking.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_sweeper_releases_expired_holds():
+    from sqlalchemy import update
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.seat_hold import SeatHold
+    from app.Services.seat_hold_service import sweep_expired_holds
+
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        session_id, hold_token, (holder, other) = await setup_hold_session(client, admin_headers)
+        response = await client.post("/bookings/", json={"session_id": session_id}, headers=other)
+        assert response.json()["detail"] == "Session is full"
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(SeatHold)
+                .where(SeatHold.id == uuid.UUID(hold_token))
+                .values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+            )
+            await db.commit()
+        # The server's own sweeper may get there first
+        await sweep_expired_holds()
+
+        session = (await client.get(f"/sessions/{session_id}")).json()
+        assert session["held_seats"] == 0
+        response = await client.post("/bookings/", json={"session_id": session_id, "hold_token": hold_token}, headers=holder)
+        assert response.json()["detail"] == "Seat hold not found or expired"
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=other)
+        assert booking.status_code == 201
+
+@pytest.mark.asyncio
+async def test_idempotency_key_replays_booking_and_session_creation():
+    session_id = await setup_session()
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        student_email = f"student_idem_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={
+            "name": "Retrier",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": uuid.uuid4().hex}
+
+        first = await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+        retry = await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+        assert first.status_code == retry.status_code == 201
+        assert retry.json()["id"] == first.json()["id"]
+        assert retry.headers.get("Idempotent-Replayed") == "true"
+
+        # Same key, different payload
+        other_session_id = await setup_session()
+        reused = await client.post("/bookings/", json={"session_id": other_session_id}, headers=headers)
+        assert reused.status_code == 422
+
+        # Concurrent duplicates create a single session
+        me = await client.get("/auth/me", headers=admin_headers)
+        topic = await client.post("/topics/", json={"name": f"Idem Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        payload = {
+            "title": "Idempotent Session",
+            "start_time": (datetime.now(timezone.utc) + timedelta(days=9)).isoformat(),
+            "topic_id": topic.json()["id"],
+            "trainer_id": me.json()["id"],
+            "capacity": 5
+        }
+        key_headers = {**admin_headers, "Idempotency-Key": uuid.uuid4().hex}
+        responses = await asyncio.gather(*[
+            client.post("/sessions/", json=payload, headers=key_headers) for _ in range(5)
+        ])
+        assert all(r.status_code == 200 for r in responses)
+        assert len({r.json()["id"] for r in responses}) == 1
+
+@pytest.mark.asyncio
+async def test_idempotency_key_replays_rejection_without_partial_write():
+    session_id = await setup_session()
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        student_email = f"student_idem_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={
+            "name": "Rejected",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": uuid.uuid4().hex}
+        payload = {"session_id": session_id, "hold_token": str(uuid.uuid4())}
+
+        # The rejection is stored with the key, and nothing the service wrote survives it
+        first = await client.post("/bookings/", json=payload, headers=headers)
+        retry = await client.post("/bookings/", json=payload, headers=headers)
+        assert first.status_code == retry.status_code == 400
+        assert retry.json() == first.json()
+        assert retry.headers.get("Idempotent-Replayed") == "true"
+
+        session = await client.get(f"/sessions/{session_id}")
+        assert session.json()["current_attendees"] == 0
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers={"Authorization": f"Bearer {token}"})
+        assert booking.status_code == 201
+
+@pytest.mark.asyncio
+async def test_availability_stream_pushes_booking_and_cancellation():
+    import json
+    session_id = await setup_session()
+
+    student_email = f"student_stream_{uuid.uuid4().hex[:4]}@test.com"
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        await client.post("/auth/register", json={
+            "name": "Watcher",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async with client.stream("GET", f"/sessions/{session_id}/availability/stream") as stream:
+            assert stream.status_code == 200
+            assert stream.headers["content-type"].startswith("text/event-stream")
+            events = (
+                json.loads(line.removeprefix("data: "))
+                async for line in stream.aiter_lines() if line.startswith("data: ")
+            )
+
+            snapshot = await asyncio.wait_for(events.__anext__(), 10)
+            assert snapshot["session_id"] == session_id
+            assert snapshot["available_seats"] == 5
+
+            response = await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+            assert response.status_code == 201
+            booked = await asyncio.wait_for(events.__anext__(), 10)
+            assert booked["seats_taken"] == 1
+            assert booked["available_seats"] == 4
+
+            response = await client.delete(f"/bookings/{response.json()['id']}", headers=headers)
+            assert response.status_code in (200, 204)
+            cancelled = await asyncio.wait_for(events.__anext__(), 10)
+            assert cancelled["available_seats"] == 5
+
+            admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+            response = await client.patch(
+                f"/sessions/{session_id}", json={"capacity": 8},
+                headers={"Authorization": f"Bearer {admin_token}"}
+            )
+            assert response.status_code == 200
+            resized = await asyncio.wait_for(events.__anext__(), 10)
+            assert (resized["capacity"], resized["available_seats"]) == (8, 8)
+
+        response = await client.get(f"/sessions/{uuid.uuid4()}/availability/stream")
+        assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_change_feed_returns_latest_change_per_entity():
+    session_id = await setup_session()
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        headers = []
+        for name in ("Syncer", "Other"):
+            email = f"student_sync_{uuid.uuid4().hex[:8]}@test.com"
+            await client.post("/auth/register", json={"name": name, "email": email, "password": "Pass123!Student"})
+            headers.append({"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"})
+        syncer, other = headers
+
+        response = await client.get("/changes", headers=syncer)
+        assert response.status_code == 200
+        assert response.json()["changes"] == []
+        since = response.json()["next_since"]
+
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=syncer)
+        assert booking.status_code == 201
+        booking_id = booking.json()["id"]
+        await client.post("/bookings/", json={"session_id": session_id}, headers=other)
+
+        response = await client.get(
+            "/changes", params={"since": since, "types": ["booking", "session"]}, headers=syncer
+        )
+        feed = response.json()
+        changes = {(c["entity"], c["id"]): c for c in feed["changes"]}
+        # The other student's booking is private to them
+        assert [key for key in changes if key[0] == "booking"] == [("booking", booking_id)]
+        assert changes[("booking", booking_id)]["op"] == "upsert"
+        assert changes[("booking", booking_id)]["data"]["session_id"] == session_id
+        # Two bookings of the session collapse into its latest state
+        assert changes[("session", session_id)]["data"]["current_attendees"] == 2
+        assert feed["next_since"] > since
+
+        await client.delete(f"/bookings/{booking_id}", headers=syncer)
+        response = await client.get(
+            "/changes", params={"since": feed["next_since"], "types": ["booking"]}, headers=syncer
+        )
+        assert [(c["entity"], c["id"], c["op"], c["data"]) for c in response.json()["changes"]] == [
+            ("booking", booking_id, "delete", None)
+        ]
+
+@pytest.mark.asyncio
+async def test_roster_sparse_fields_and_normalized_embedding():
+    session_id = await setup_session()
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        for name in ("Roster One", "Roster Two"):
+            email = f"student_roster_{uuid.uuid4().hex[:8]}@test.com"
+            await client.post("/auth/register", json={"name": name, "email": email, "password": "Pass123!Student"})
+            headers = {"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"}
+            booking = await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+            assert booking.status_code == 201
+
+        full = await client.get(f"/sessions/{session_id}/bookings", headers=admin_headers)
+        assert full.json()[0]["session"]["topic"]["id"] == full.json()[0]["session"]["topic_id"]
+
+        sparse = await client.get(
+            f"/sessions/{session_id}/bookings",
+            params={"fields": "attended", "embed": "student"},
+            headers=admin_headers
+        )
+        assert [set(booking) for booking in sparse.json()] == [{"id", "attended", "student"}] * 2
+        assert len(sparse.content) < len(full.content) / 2
+
+        normalized = await client.get(
+            f"/sessions/{session_id}/bookings", params={"normalized": "true"}, headers=admin_headers
+        )
+        body = normalized.json()
+        assert {booking["session_id"] for booking in body["data"]} == {session_id}
+        assert "session" not in body["data"][0]
+        assert [s["id"] for s in body["included"]["sessions"]] == [session_id]
+        assert len(body["included"]["topics"]) == 1
+        # Two students and the trainer, each once
+        assert len(body["included"]["users"]) == 3
+
+        response = await client.get(
+            f"/sessions/{session_id}/bookings", params={"fields": "password"}, headers=admin_headers
+        )
+        assert response.status_code == 400
+
+        sessions = await client.get("/sessions/", params={"fields": "title,capacity", "embed": "", "limit": 5})
+        assert all(set(session) == {"id", "title", "capacity"} for session in sessions.json())
+
+
+@pytest.mark.asyncio
+async def test_exports_stream_bookings_as_ndjson_and_csv():
+    session_id = await setup_session()
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_id = (await client.get(f"/sessions/{session_id}")).json()["topic_id"]
+        email = f"student_export_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={"name": "Export Student", "email": email, "password": "Pass123!Student"})
+        student_headers = {"Authorization": f"Bearer {await get_token(email, 'Pass123!Student')}"}
+        booking = await client.post("/bookings/", json={"session_id": session_id}, headers=student_headers)
+        assert booking.status_code == 201
+
+        async with client.stream(
+            "GET", "/exports/bookings", params={"topic_id": topic_id}, headers=admin_headers
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            rows = [json.loads(line) async for line in response.aiter_lines() if line]
+        assert [(row["session_id"], row["student_email"]) for row in rows] == [(session_id, email)]
+        assert rows[0]["attended"] is False
+
+        response = await client.get(
+            "/exports/bookings", params={"topic_id": topic_id, "format": "csv"}, headers=admin_headers
+        )
+        assert response.headers["content-type"].startswith("text/csv")
+        records = list(csv.DictReader(io.StringIO(response.text)))
+        assert [record["student_email"] for record in records] == [email]
+
+        attendance = await client.get("/exports/attendance", params={"topic_id": topic_id}, headers=admin_headers)
+        summary = json.loads(attendance.text)
+        assert (summary["session_id"], summary["booked"], summary["attended"]) == (session_id, 1, 0)
+
+        response = await client.get("/exports/sessions", headers=student_headers)
+        assert response.status_code == 403
@@ -6,6 +6,7 @@ Critical for production deployment.
 import pytest
 import httpx
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from app.core.config import settings
 import uuid
@@ -273,3 +274,391 @@ async def test_no_double_booking():
     
     assert success_count == 1, f"Expected exactly 1 success, got {success_count}"
     assert failed_count == 2, f"Expected 2 failures (already booked), got {failed_count}"
+
+
+async def create_students_direct(count: int, prefix: str):
+    """Insert students straight into the database and mint their tokens.
+
+    Registering hundreds of students through /auth/register would hit the
+    rate limiter, so the benchmark seeds them in one multi-row INSERT.
+    """
+    from sqlalchemy import insert
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.user import User
+    from app.core.hash import get_password_hash
+    from app.core.jwt import create_access_token
+
+    hashed = get_password_hash("Pass123!")
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"{prefix} {i}",
+            "email": f"{prefix}_{i}_{uuid.uuid4().hex[:6]}@test.com",
+            "password": hashed,
+            "role": "student",
+            "is_active": True,
+            "is_verified": False,
+        }
+        for i in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), rows)
+        await db.commit()
+
+    return [
+        create_access_token({"sub": str(row["id"]), "role": "student"})
+        for row in rows
+    ]
+
+
+# Booking requests per second the single-seat race must sustain. The old
+# SELECT ... FOR UPDATE path held the session row lock across several round
+# trips, so 500 racers queued on it one at a time; the conditional UPDATE
+# rejects them without waiting for a lock holder's round trips
+BOOKING_RACE_MIN_THROUGHPUT = 200
+
+
+@pytest.mark.asyncio
+async def test_benchmark_500_concurrent_bookers_capacity_one():
+    """
+    Benchmark the booking path with 500 students racing for a single seat.
+    Exactly one booking may succeed, and the race must be served at
+    BOOKING_RACE_MIN_THROUGHPUT requests per second or more.
+    """
+    admin_token = await get_admin_token()
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_resp = await client.post("/topics/", json={
+            "name": f"Bench Topic {uuid.uuid4().hex[:4]}",
+            "description": "Booking benchmark"
+        }, headers=admin_headers)
+        topic_id = topic_resp.json()["id"]
+
+        me_resp = await client.get("/auth/me", headers=admin_headers)
+        trainer_id = me_resp.json()["id"]
+
+        start_time = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        session_resp = await client.post("/sessions/", json={
+            "title": "Benchmark Seat",
+            "start_time": start_time,
+            "topic_id": topic_id,
+            "trainer_id": trainer_id,
+            "capacity": 1
+        }, headers=admin_headers)
+        session_id = session_resp.json()["id"]
+
+    student_tokens = await create_students_direct(500, "bench_booker")
+
+    limits = httpx.Limits(max_connections=500, max_keepalive_connections=500)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=120.0, limits=limits) as client:
+        async def book_session(token):
+            started = time.perf_counter()
+            response = await client.post("/bookings/", json={
+                "session_id": session_id
+            }, headers={"Authorization": f"Bearer {token}"})
+            return response.status_code, time.perf_counter() - started
+
+        wall_started = time.perf_counter()
+        results = await asyncio.gather(*[book_session(token) for token in student_tokens])
+        wall_time = time.perf_counter() - wall_started
+
+    statuses = [status_code for status_code, _ in results]
+    latencies = sorted(latency for _, latency in results)
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"\n500 bookers / capacity 1: wall={wall_time:.3f}s "
+        f"p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms "
+        f"throughput={len(results) / wall_time:.1f} req/s"
+    )
+
+    assert statuses.count(201) == 1, f"Expected exactly 1 success, got {statuses.count(201)}"
+    assert statuses.count(400) == 499, f"Expected 499 rejections, got {statuses.count(400)}"
+    throughput = len(results) / wall_time
+    assert throughput >= BOOKING_RACE_MIN_THROUGHPUT, f"Served only {throughput:.1f} req/s"
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        final_resp = await client.get(f"/sessions/{session_id}")
+        assert final_resp.json()["current_attendees"] == 1
+
+
+async def seed_past_bookings(student_id: str, trainer_id: str, topic_id: str, count: int):
+    """Give a student `count` completed sessions in the past, one booking each."""
+    from sqlalchemy import insert, select, false, func, literal
+    from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.booking import Booking
+    from app.Models.session import TrainingSession
+
+    if not count:
+        return
+    batch_id = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "trainer_id": uuid.UUID(trainer_id),
+            "topic_id": uuid.UUID(topic_id),
+            "title": f"History {batch_id} {i}",
+            "start_time": now - timedelta(hours=2 * (i + 1)),
+            "duration_minutes": 60,
+            "capacity": 10,
+            "current_attendees": 1,
+            "status": "completed",
+        }
+        for i in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(TrainingSession), rows)
+        await db.execute(
+            insert(Booking).from_select(
+                ["id", "session_id", "student_id", "attended", "created_at", "period"],
+                select(
+                    func.gen_random_uuid(),
+                    TrainingSession.id,
+                    literal(uuid.UUID(student_id), PG_UUID(as_uuid=True)),
+                    false(),
+                    TrainingSession.start_time,
+                    TrainingSession.period,
+                ).where(TrainingSession.title.like(f"History {batch_id} %"))
+            )
+        )
+        await db.commit()
+
+
+async def _book_latencies(past_bookings: int, runs: int = 20):
+    """Book `runs` sessions for a student with `past_bookings` past bookings.
+
+    Returns:
+        The sorted /book latencies in seconds
+    """
+    admin_token = await get_admin_token()
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_resp = await client.post("/topics/", json={
+            "name": f"History Topic {uuid.uuid4().hex[:4]}",
+            "description": "Booking history benchmark"
+        }, headers=admin_headers)
+        topic_id = topic_resp.json()["id"]
+
+        me_resp = await client.get("/auth/me", headers=admin_headers)
+        trainer_id = me_resp.json()["id"]
+
+        [token] = await create_students_direct(1, f"history_{past_bookings}")
+        headers = {"Authorization": f"Bearer {token}"}
+        student_id = (await client.get("/auth/me", headers=headers)).json()["id"]
+        await seed_past_bookings(student_id, trainer_id, topic_id, past_bookings)
+
+        session_ids = []
+        base = datetime.now(timezone.utc) + timedelta(days=30)
+        for i in range(runs):
+            session_resp = await client.post("/sessions/", json={
+                "title": f"History Target {i}",
+                "start_time": (base + timedelta(hours=2 * i)).isoformat(),
+                "duration_minutes": 60,
+                "topic_id": topic_id,
+                "trainer_id": trainer_id,
+                "capacity": 10
+            }, headers=admin_headers)
+            session_ids.append(session_resp.json()["id"])
+
+        latencies = []
+        for session_id in session_ids:
+            started = time.perf_counter()
+            response = await client.post(f"/sessions/{session_id}/book", headers=headers)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200
+
+        # A repeat booking is still rejected by uc_session_student
+        response = await client.post(f"/sessions/{session_ids[0]}/book", headers=headers)
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Already booked this session"
+
+    return sorted(latencies)
+
+
+# Largest allowed p50 ratio between the longest and the empty history, and an
+# absolute allowance for run-to-run noise at single-digit millisecond latencies
+HISTORY_LATENCY_FACTOR = 2.0
+HISTORY_LATENCY_SLACK = 0.010
+
+
+@pytest.mark.asyncio
+async def test_benchmark_book_latency_by_booking_history():
+    """
+    Benchmark POST /sessions/{id}/book for students with 0, 100 and 1000
+    past bookings. The admission path no longer loads past bookings, so
+    latency should stay flat as the history grows.
+    """
+    p50 = {}
+    for past_bookings in (0, 100, 1000):
+        latencies = await _book_latencies(past_bookings)
+        p50[past_bookings] = latencies[len(latencies) // 2]
+        print(
+            f"\n/book with {past_bookings} past bookings: "
+            f"p50={p50[past_bookings] * 1000:.1f}ms "
+            f"max={latencies[-1] * 1000:.1f}ms"
+        )
+
+    assert p50[1000] <= p50[0] * HISTORY_LATENCY_FACTOR + HISTORY_LATENCY_SLACK, (
+        f"p50 grew from {p50[0] * 1000:.1f}ms to {p50[1000] * 1000:.1f}ms with 1000 past bookings"
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cancellations_release_every_seat():
+    """
+    Cancel 20 bookings of one session concurrently. Every cancellation
+    releases its seat in the same statement as the delete, so the counter
+    ends at zero; a counter corrupted afterwards is repaired by the reconciler.
+    """
+    from sqlalchemy import select, update
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.session import TrainingSession
+    from app.Services.booking_service import BookingService
+
+    admin_token = await get_admin_token()
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_resp = await client.post("/topics/", json={
+            "name": f"Cancel Topic {uuid.uuid4().hex[:4]}",
+            "description": "Concurrent cancellations"
+        }, headers=admin_headers)
+        topic_id = topic_resp.json()["id"]
+
+        me_resp = await client.get("/auth/me", headers=admin_headers)
+        trainer_id = me_resp.json()["id"]
+
+        start_time = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        session_resp = await client.post("/sessions/", json={
+            "title": "Concurrent Cancellations",
+            "start_time": start_time,
+            "topic_id": topic_id,
+            "trainer_id": trainer_id,
+            "capacity": 20
+        }, headers=admin_headers)
+        session_id = session_resp.json()["id"]
+
+    student_tokens = await create_students_direct(20, "cancel_booker")
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=60.0) as client:
+        async def book_session(token):
+            response = await client.post("/bookings/", json={
+                "session_id": session_id
+            }, headers={"Authorization": f"Bearer {token}"})
+            return response.json()["id"]
+
+        booking_ids = await asyncio.gather(*[book_session(token) for token in student_tokens])
+
+        async def cancel_booking(token, booking_id):
+            response = await client.delete(
+                f"/bookings/{booking_id}", headers={"Authorization": f"Bearer {token}"}
+            )
+            return response.status_code
+
+        results = await asyncio.gather(*[
+            cancel_booking(token, booking_id)
+            for token, booking_id in zip(student_tokens, booking_ids)
+        ])
+        assert results.count(200) == 20
+
+        final_resp = await client.get(f"/sessions/{session_id}")
+        assert final_resp.json()["current_attendees"] == 0
+
+    # Corrupt the counter and let the reconciler repair it
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(TrainingSession)
+            .where(TrainingSession.id == uuid.UUID(session_id))
+            .values(current_attendees=7)
+        )
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        corrected = await BookingService.reconcile_attendee_counts(db)
+        await db.commit()
+    drift = [row for row in corrected if str(row["session_id"]) == session_id]
+    assert drift == [{"session_id": uuid.UUID(session_id), "recorded": 7, "actual": 0}]
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(TrainingSession.current_attendees)
+            .where(TrainingSession.id == uuid.UUID(session_id))
+        )
+        assert result.scalar_one() == 0
+
+
+# Required throughput gain of 16 striped counters over the single sessions
+# row. Striping scales with the slot count only while the row lock is the
+# bottleneck; a quarter of the slot count leaves room for authentication and
+# HTTP overhead, while a reservation serialized on one slot stays near 1x
+STRIPED_MIN_SPEEDUP = 4.0
+
+
+@pytest.mark.asyncio
+async def test_benchmark_striped_seat_counters():
+    """
+    Benchmark 400 concurrent bookers filling a 400-seat session, once with
+    the single sessions-row counter and once with 16 striped counter slots.
+    Both must end exactly full, and the striped counters must sustain at
+    least STRIPED_MIN_SPEEDUP times the throughput of the single row.
+    """
+    admin_token = await get_admin_token()
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_resp = await client.post("/topics/", json={
+            "name": f"Striped Topic {uuid.uuid4().hex[:4]}",
+            "description": "Striped counter benchmark"
+        }, headers=admin_headers)
+        topic_id = topic_resp.json()["id"]
+
+        me_resp = await client.get("/auth/me", headers=admin_headers)
+        trainer_id = me_resp.json()["id"]
+
+        session_ids = {}
+        for days, seat_slots in ((1, 0), (2, 16)):
+            start_time = (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+            session_resp = await client.post("/sessions/", json={
+                "title": f"Lecture with {seat_slots} slots",
+                "start_time": start_time,
+                "topic_id": topic_id,
+                "trainer_id": trainer_id,
+                "capacity": 400,
+                "seat_slots": seat_slots
+            }, headers=admin_headers)
+            assert session_resp.json()["seat_slots"] == seat_slots
+            session_ids[seat_slots] = session_resp.json()["id"]
+
+    student_tokens = await create_students_direct(400, "striped_booker")
+
+    throughput = {}
+    limits = httpx.Limits(max_connections=400, max_keepalive_connections=400)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=120.0, limits=limits) as client:
+        for seat_slots, session_id in session_ids.items():
+            async def book_session(token):
+                response = await client.post("/bookings/", json={
+                    "session_id": session_id
+                }, headers={"Authorization": f"Bearer {token}"})
+                return response.status_code
+
+            started = time.perf_counter()
+            statuses = await asyncio.gather(*[book_session(token) for token in student_tokens])
+            wall_time = time.perf_counter() - started
+            throughput[seat_slots] = len(statuses) / wall_time
+            print(
+                f"\n400 bookers / 400 seats / {seat_slots} slots: wall={wall_time:.3f}s "
+                f"throughput={throughput[seat_slots]:.1f} req/s"
+            )
+
+            assert statuses.count(201) == 400, f"Expected 400 bookings, got {statuses.count(201)}"
+
+            final_resp = await client.get(f"/sessions/{session_id}")
+            assert final_resp.json()["current_attendees"] == 400
+
+    assert throughput[16] >= throughput[0] * STRIPED_MIN_SPEEDUP, (
+        f"Striped counters reached {throughput[16]:.1f} req/s against {throughput[0]:.1f} req/s"
+    )
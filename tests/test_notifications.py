@@ -5,8 +5,10 @@ Tests for notifications:
 2. Mark as Read
 3. Unread Count
 """
+import asyncio
 import pytest
 import httpx
+from datetime import datetime, timedelta, timezone
 from app.core.config import settings
 import uuid
 
@@ -40,3 +42,98 @@ async def test_notifications():
         resp_count = await client.get("/notifications/unread/count", headers=headers)
         assert response.status_code == 200
         assert "unread_count" in resp_count.json()
+
+
+async def wait_for_notifications(client, headers, count, attempts=20):
+    """Poll until the background dispatcher has written `count` notifications."""
+    for _ in range(attempts):
+        response = await client.get("/notifications/", headers=headers)
+        if len(response.json()) >= count:
+            return response.json()
+        await asyncio.sleep(0.25)
+    return response.json()
+
+@pytest.mark.asyncio
+async def test_booking_and_cancellation_notify_students():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Notify Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        me = await client.get("/auth/me", headers=admin_headers)
+        s_resp = await client.post("/sessions/", json={
+            "title": "Notify Test",
+            "start_time": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+            "topic_id": t_resp.json()["id"],
+            "trainer_id": me.json()["id"],
+            "capacity": 5
+        }, headers=admin_headers)
+        session_id = s_resp.json()["id"]
+
+        student_email = f"student_notify_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={
+            "name": "Notified",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+        assert response.status_code == 201
+
+        notifications = await wait_for_notifications(client, headers, 1)
+        assert [n["type"] for n in notifications] == ["booking"]
+
+        # Cancelling the session notifies every booker in the same request
+        await client.patch(f"/sessions/{session_id}", json={"status": "cancelled"}, headers=admin_headers)
+        notifications = (await client.get("/notifications/", headers=headers)).json()
+        assert notifications[0]["type"] == "session_update"
+        assert "cancelled" in notifications[0]["message"]
+
+@pytest.mark.asyncio
+async def test_unread_count_tracks_reads_and_deletes():
+    admin_token = await get_token(settings.SUPER_ADMIN_EMAIL, settings.SUPER_ADMIN_PASSWORD)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        t_resp = await client.post("/topics/", json={"name": f"Count Topic {uuid.uuid4().hex[:4]}", "description": "D"}, headers=admin_headers)
+        me = await client.get("/auth/me", headers=admin_headers)
+        session_ids = []
+        for days in (4, 5, 6):
+            s_resp = await client.post("/sessions/", json={
+                "title": "Count Test",
+                "start_time": (datetime.now(timezone.utc) + timedelta(days=days)).isoformat(),
+                "topic_id": t_resp.json()["id"],
+                "trainer_id": me.json()["id"],
+                "capacity": 5
+            }, headers=admin_headers)
+            session_ids.append(s_resp.json()["id"])
+
+        student_email = f"student_count_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={
+            "name": "Counter",
+            "email": student_email,
+            "password": "Pass123!Student"
+        })
+        token = await get_token(student_email, "Pass123!Student")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for session_id in session_ids:
+            await client.post("/bookings/", json={"session_id": session_id}, headers=headers)
+        notifications = await wait_for_notifications(client, headers, 3)
+        assert len(notifications) == 3
+
+        count = await client.get("/notifications/unread/count", headers=headers)
+        assert count.json()["unread_count"] == 3
+
+        await client.patch(f"/notifications/{notifications[0]['id']}/read", headers=headers)
+        # Reading twice does not decrement twice
+        await client.patch(f"/notifications/{notifications[0]['id']}/read", headers=headers)
+        await client.delete(f"/notifications/{notifications[1]['id']}", headers=headers)
+        count = await client.get("/notifications/unread/count", headers=headers)
+        assert count.json()["unread_count"] == 1
+
+        await client.patch("/notifications/read-all", headers=headers)
+        count = await client.get("/notifications/unread/count", headers=headers)
+        assert count.json()["unread_count"] == 0
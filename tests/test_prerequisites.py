@@ -390,3 +390,140 @@ async def test_multiple_prerequisites():
         # Should fail - needs both Python AND SQL
         assert booking_resp.status_code == 400
         assert "prerequisite" in booking_resp.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_transitive_prerequisites_follow_edge_changes():
+    """
+    The closure must list indirect prerequisites and forget them once the
+    linking edge is removed. A requires B, B requires C.
+    """
+    admin_token = await get_admin_token()
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic_ids = []
+        for label in ("A", "B", "C"):
+            resp = await client.post("/topics/", json={
+                "name": f"Closure {label} {uuid.uuid4().hex[:4]}",
+                "description": "Test closure"
+            }, headers=admin_headers)
+            topic_ids.append(resp.json()["id"])
+        topic_a_id, topic_b_id, topic_c_id = topic_ids
+
+        for topic_id, prereq_id in ((topic_a_id, topic_b_id), (topic_b_id, topic_c_id)):
+            resp = await client.post("/topic-prerequisites/", json={
+                "topic_id": topic_id,
+                "prerequisite_topic_id": prereq_id
+            }, headers=admin_headers)
+            assert resp.status_code == 200
+
+        direct = await client.get(f"/topic-prerequisites/{topic_a_id}")
+        assert [p["id"] for p in direct.json()] == [topic_b_id]
+
+        transitive = await client.get(f"/topic-prerequisites/{topic_a_id}", params={"transitive": True})
+        assert [p["id"] for p in transitive.json()] == [topic_b_id, topic_c_id]
+
+        resp = await client.delete("/topic-prerequisites/", params={
+            "topic_id": topic_b_id,
+            "prerequisite_topic_id": topic_c_id
+        }, headers=admin_headers)
+        assert resp.status_code == 200
+
+        transitive = await client.get(f"/topic-prerequisites/{topic_a_id}", params={"transitive": True})
+        assert [p["id"] for p in transitive.json()] == [topic_b_id]
+
+        # C no longer depends on A's chain, so C requires A is now legal
+        resp = await client.post("/topic-prerequisites/", json={
+            "topic_id": topic_c_id,
+            "prerequisite_topic_id": topic_a_id
+        }, headers=admin_headers)
+        assert resp.status_code == 200
+
+
+async def legacy_has_circular_dependency(db, topic_id, new_prerequisite_id) -> bool:
+    """Previous per-node DFS cycle check, kept as the benchmark baseline."""
+    from sqlalchemy import select
+    from app.Models.prerequisite import TopicPrerequisite
+
+    async def dfs(current_id, visited: set) -> bool:
+        if current_id in visited:
+            return False
+        if current_id == topic_id:
+            return True
+        visited.add(current_id)
+        result = await db.execute(
+            select(TopicPrerequisite.prerequisite_id).where(
+                TopicPrerequisite.topic_id == current_id
+            )
+        )
+        for dependent_id in result.scalars().all():
+            if await dfs(dependent_id, visited):
+                return True
+        return False
+
+    return await dfs(new_prerequisite_id, set())
+
+
+@pytest.mark.asyncio
+async def test_benchmark_closure_vs_dfs_on_5k_topic_dag():
+    """
+    Compare closure-table cycle checks with the per-node DFS on a 5k-topic
+    DAG: 250 tracks of 20 topics, each topic requiring its predecessor and
+    occasionally a topic from an earlier track. Runs in a rolled-back
+    transaction.
+    """
+    import random
+    import time
+    from sqlalchemy import insert
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.topic import Topic
+    from app.Models.prerequisite import TopicPrerequisite
+    from app.Services.topic_prerequisite_service import TopicPrerequisiteService
+
+    rng = random.Random(42)
+    tracks, track_length = 250, 20
+    suffix = uuid.uuid4().hex[:6]
+    ids = [[uuid.uuid4() for _ in range(track_length)] for _ in range(tracks)]
+
+    edges = []
+    for t in range(tracks):
+        for i in range(1, track_length):
+            edges.append({"topic_id": ids[t][i], "prerequisite_id": ids[t][i - 1]})
+            if t and rng.random() < 0.2:
+                other = ids[rng.randrange(t)][rng.randrange(track_length)]
+                edges.append({"topic_id": ids[t][i], "prerequisite_id": other})
+
+    async with AsyncSessionLocal() as db:
+        try:
+            await db.execute(insert(Topic), [
+                {"id": topic_id, "name": f"Bench {suffix} {t}-{i}"}
+                for t, track in enumerate(ids) for i, topic_id in enumerate(track)
+            ])
+            await db.execute(insert(TopicPrerequisite), edges)
+            await TopicPrerequisiteService.rebuild_closure(db)
+
+            # Probe pairs that are not cycles, forcing the DFS to exhaust
+            # every ancestor of the deepest topics
+            probes = [(ids[rng.randrange(tracks)][0], ids[t][-1]) for t in range(tracks - 10, tracks)]
+
+            started = time.perf_counter()
+            legacy = [await legacy_has_circular_dependency(db, a, b) for a, b in probes]
+            dfs_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            closure = [await TopicPrerequisiteService.would_create_cycle(db, a, b) for a, b in probes]
+            closure_time = time.perf_counter() - started
+
+            # A cycle deep inside one track is still detected
+            assert await TopicPrerequisiteService.would_create_cycle(db, ids[0][0], ids[0][-1])
+        finally:
+            await db.rollback()
+
+    print(
+        f"\n5k-topic DAG, {len(probes)} cycle checks: "
+        f"dfs={dfs_time * 1000:.1f}ms closure={closure_time * 1000:.1f}ms "
+        f"speedup={dfs_time / closure_time:.1f}x"
+    )
+    assert legacy == closure
+    assert closure_time < dfs_time
@@ -0,0 +1,113 @@
+"""Search Tests
+
+Tests for full-text search:
+1. Ranked session and topic hits with highlights
+2. Typo-tolerant topic names
+3. Search latency over 1M sessions
+"""
+import random
+import time
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+import uuid
+
+BASE_URL = "http://localhost:8000"
+
+async def get_admin_token():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        response = await client.post("/auth/login", json={
+            "email": settings.SUPER_ADMIN_EMAIL,
+            "password": settings.SUPER_ADMIN_PASSWORD
+        })
+        return response.json()["access_token"]
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_highlights_sessions_and_topics():
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    word = f"xylo{uuid.uuid4().hex[:8]}"
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic = await client.post("/topics/", json={
+            "name": f"Search Topic {word}",
+            "description": "Graph theory drills"
+        }, headers=headers)
+        topic_id = topic.json()["id"]
+        me = await client.get("/auth/me", headers=headers)
+        trainer_id = me.json()["id"]
+
+        start_time = (datetime.now(timezone.utc) + timedelta(days=2)).isoformat()
+        in_title = await client.post("/sessions/", json={
+            "title": f"Intro to {word}",
+            "description": "Hands-on practice",
+            "start_time": start_time,
+            "topic_id": topic_id,
+            "trainer_id": trainer_id
+        }, headers=headers)
+        in_description = await client.post("/sessions/", json={
+            "title": "Weekly practice",
+            "description": f"This week we cover {word} in depth",
+            "start_time": (datetime.now(timezone.utc) + timedelta(days=3)).isoformat(),
+            "topic_id": topic_id,
+            "trainer_id": trainer_id
+        }, headers=headers)
+
+        response = await client.get("/search", params={"q": word, "type": "session"})
+        assert response.status_code == 200
+        hits = response.json()
+        # Title matches outrank description matches
+        assert [hit["id"] for hit in hits] == [in_title.json()["id"], in_description.json()["id"]]
+        assert f"<mark>{word}</mark>" in hits[0]["title_highlight"]
+        assert f"<mark>{word}</mark>" in hits[1]["snippet"]
+        assert hits[0]["topic_id"] == topic_id
+
+        response = await client.get("/search", params={"q": word})
+        assert {hit["type"] for hit in response.json()} == {"session", "topic"}
+
+        response = await client.get("/search", params={"q": word, "limit": 1, "skip": 1, "type": "session"})
+        assert [hit["id"] for hit in response.json()] == [in_description.json()["id"]]
+
+@pytest.mark.asyncio
+async def test_search_finds_misspelled_topic_names():
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    suffix = uuid.uuid4().hex[:4]
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        topic = await client.post("/topics/", json={
+            "name": f"Dijkstra Shortest Paths {suffix}",
+            "description": "Weighted graphs"
+        }, headers=headers)
+
+        response = await client.get("/search", params={"q": f"Dijkstar Shortest Paths {suffix}", "type": "topic"})
+        assert response.status_code == 200
+        assert topic.json()["id"] in [hit["id"] for hit in response.json()]
+
+# Target p95 of a selective search over 1M sessions, and the slack allowed for
+# timing noise on a loaded machine (the query runs in-process, without HTTP)
+SEARCH_P95_TARGET = 0.020
+SEARCH_P95_TOLERANCE = 0.005
+
+@pytest.mark.asyncio
+async def test_benchmark_search_latency_at_one_million_sessions(search_bench_db):
+    """Time selective searches over 1M sessions and hold p95 to the 20 ms
+    target, plus SEARCH_P95_TOLERANCE for shared test hosts."""
+    from app.Services.search_service import SearchService
+
+    latencies = []
+    for _ in range(200):
+        q = f"bench session {random.randint(1, 1_000_000)}"
+        started = time.perf_counter()
+        await SearchService.search(search_bench_db, q)
+        latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)]
+    print(
+        f"\n/search over 1M sessions: "
+        f"p50={latencies[len(latencies) // 2] * 1000:.1f}ms "
+        f"p95={p95 * 1000:.1f}ms"
+    )
+    assert p95 <= SEARCH_P95_TARGET + SEARCH_P95_TOLERANCE, f"p95 {p95 * 1000:.1f}ms over the 20 ms target"
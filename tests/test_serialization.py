@@ -0,0 +1,111 @@
+"""Serialization Benchmarks
+
+CPU-only benchmarks of rendering 1000 sessions and 1000 bookings, run
+without the API server:
+1. Before: ORM-shaped objects validated with from_attributes, then encoded
+   by the stdlib json encoder or by Pydantic's dump_json
+2. After: read models encoded by the fast encoder, and validated schema
+   instances encoded in trusted mode
+"""
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.Schemas.booking_schema import BookingResponse
+from app.Schemas.session_schema import SessionResponse
+from app.Services.read_models import BookingRow, SessionRow, TopicRow, UserRow, dump_json
+from app.core.serialization import serializer
+
+ROWS = 1000
+ROUNDS = 20
+
+
+def build_rows(count: int = ROWS):
+    """Build sessions with shared trainers and topics, and one booking per session."""
+    now = datetime(2025, 1, 15, 10, 0, 0, 123456)
+    trainers = [
+        UserRow(uuid.uuid4(), f"Trainer {i}", f"trainer{i}@example.com", "trainer", True, True,
+                now.replace(tzinfo=timezone.utc), None)
+        for i in range(20)
+    ]
+    topics = [
+        TopicRow(uuid.uuid4(), f"Topic & Practice {i}", "Graphs, DP <and> greedy", now, now)
+        for i in range(50)
+    ]
+    sessions = []
+    bookings = []
+    for i in range(count):
+        trainer, topic = trainers[i % len(trainers)], topics[i % len(topics)]
+        session = SessionRow(
+            uuid.uuid4(), f"Session {i}", "Weekly contest practice and upsolving", now + timedelta(days=i),
+            90, 30, "https://meet.example.com/abc", trainer.id, topic.id, i % 30, 0, 0, "upcoming",
+            now, now, trainer, topic,
+        )
+        student = UserRow(uuid.uuid4(), f"Student {i}", f"student{i}@example.com", "student", True, False,
+                          now.replace(tzinfo=timezone.utc), None)
+        sessions.append(session)
+        bookings.append(BookingRow(uuid.uuid4(), session.id, student.id, False, None, None, now, session, student))
+    return sessions, bookings
+
+
+def as_orm(row):
+    """Mirror a read model as an ORM-like object, as loaded with selectinload."""
+    attributes = {name: getattr(row, name) for name in row.__dataclass_fields__}
+    for name, value in attributes.items():
+        if hasattr(value, "__dataclass_fields__"):
+            attributes[name] = as_orm(value)
+    if isinstance(row, SessionRow):
+        attributes["seats_taken"] = attributes.pop("current_attendees")
+        attributes["seats_held"] = attributes.pop("held_seats")
+    return SimpleNamespace(**attributes)
+
+
+def timed(render) -> List[float]:
+    durations = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        render()
+        durations.append(time.perf_counter() - started)
+    return sorted(durations)
+
+
+def report(label: str, durations: List[float]) -> None:
+    print(
+        f"\n{label:<46} per {ROWS}: "
+        f"p50={durations[len(durations) // 2] * 1000:.2f}ms "
+        f"p95={durations[int(len(durations) * 0.95)] * 1000:.2f}ms"
+    )
+
+
+def benchmark(label: str, rows, schema) -> None:
+    compiled = serializer(List[schema])
+    orm = [as_orm(row) for row in rows]
+    validated = compiled.adapter.validate_python(orm, from_attributes=True)
+
+    # Every path renders the same document
+    expected = compiled.adapter.dump_json(validated)
+    assert dump_json(rows) == expected
+    assert compiled.trusted_json(validated) == expected
+    assert json.loads(json.dumps(jsonable_encoder(validated))) == json.loads(expected)
+
+    report(f"{label}: validate + stdlib json (before)", timed(
+        lambda: json.dumps(jsonable_encoder(compiled.adapter.validate_python(orm, from_attributes=True))).encode()
+    ))
+    report(f"{label}: validate + dump_json (before)", timed(lambda: compiled.validate_json(orm)))
+    report(f"{label}: read models + fast encoder", timed(lambda: dump_json(rows)))
+    report(f"{label}: trusted schema instances", timed(lambda: compiled.trusted_json(validated)))
+
+
+def test_benchmark_serialize_1000_sessions():
+    sessions, _ = build_rows()
+    benchmark("sessions", sessions, SessionResponse)
+
+
+def test_benchmark_serialize_1000_bookings():
+    _, bookings = build_rows()
+    benchmark("bookings", bookings, BookingResponse)
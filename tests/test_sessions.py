@@ -58,3 +58,278 @@ async def test_create_session():
         
         assert response.status_code == 200
         assert response.json()["title"] == "Test Session"
+
+@pytest.mark.asyncio
+async def test_list_sessions_cursor_pagination():
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    topic_id = await create_test_topic(headers)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        me = await client.get("/auth/me", headers=headers)
+        trainer_id = me.json()["id"]
+        start_time = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        for i in range(3):
+            await client.post("/sessions/", json={
+                "title": f"Paged Session {i}",
+                "start_time": start_time,
+                "topic_id": topic_id,
+                "trainer_id": trainer_id
+            }, headers=headers)
+
+        first = await client.get("/sessions/", params={"limit": 2})
+        assert first.status_code == 200
+        assert len(first.json()) == 2
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = await client.get("/sessions/", params={"limit": 2, "cursor": cursor})
+        assert second.status_code == 200
+        first_ids = {s["id"] for s in first.json()}
+        assert not first_ids & {s["id"] for s in second.json()}
+
+        # The legacy offset parameter still lines up with the cursor page
+        legacy = await client.get("/sessions/", params={"limit": 2, "skip": 2})
+        assert [s["id"] for s in legacy.json()] == [s["id"] for s in second.json()]
+
+        bad = await client.get("/sessions/", params={"cursor": "not-a-cursor"})
+        assert bad.status_code == 400
+
+@pytest.mark.asyncio
+async def test_search_sessions_by_topic_window_and_free_seats():
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    topic_id = await create_test_topic(headers)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        me = await client.get("/auth/me", headers=headers)
+        trainer_id = me.json()["id"]
+        now = datetime.now(timezone.utc)
+        created = []
+        for days in (1, 3, 10):
+            response = await client.post("/sessions/", json={
+                "title": f"Searchable Session {days}",
+                "start_time": (now + timedelta(days=days)).isoformat(),
+                "topic_id": topic_id,
+                "trainer_id": trainer_id,
+                "capacity": 1
+            }, headers=headers)
+            created.append(response.json()["id"])
+
+        # Fill the first session
+        email = f"search_student_{uuid.uuid4().hex[:8]}@test.com"
+        await client.post("/auth/register", json={"name": "Searcher", "email": email, "password": "Pass123!Student"})
+        login = await client.post("/auth/login", json={"email": email, "password": "Pass123!Student"})
+        student_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        await client.post("/bookings/", json={"session_id": created[0]}, headers=student_headers)
+
+        this_week = {
+            "topic_id": topic_id,
+            "start_from": now.isoformat(),
+            "start_to": (now + timedelta(days=7)).isoformat(),
+        }
+        response = await client.get("/sessions/search", params=this_week)
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()] == created[:2]
+
+        response = await client.get("/sessions/search", params={**this_week, "has_free_seats": "true"})
+        assert [s["id"] for s in response.json()] == [created[1]]
+
+        # Soonest first, paged by cursor
+        first = await client.get("/sessions/search", params={"topic_id": topic_id, "limit": 2})
+        assert [s["id"] for s in first.json()] == created[:2]
+        second = await client.get("/sessions/search", params={
+            "topic_id": topic_id, "limit": 2, "cursor": first.headers["X-Next-Cursor"]
+        })
+        assert [s["id"] for s in second.json()] == created[2:]
+
+        response = await client.get("/sessions/search", params={"topic_id": topic_id, "status": "cancelled"})
+        assert response.json() == []
+
+async def ensure_sessions(count: int):
+    """Top up the live sessions to at least ``count``, with no seats taken."""
+    from sqlalchemy import text
+    from app.DB.session import AsyncSessionLocal
+
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    async with AsyncSessionLocal() as db:
+        live = await db.execute(text("SELECT count(*) FROM sessions WHERE deleted_at IS NULL"))
+        missing = count - live.scalar()
+    if missing <= 0:
+        return
+
+    topic_id = await create_test_topic(headers)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        me = await client.get("/auth/me", headers=headers)
+        start = datetime.now(timezone.utc) + timedelta(days=400)
+        for i in range(missing):
+            await client.post("/sessions/", json={
+                "title": f"Page Filler {i}",
+                "start_time": (start + timedelta(hours=2 * i)).isoformat(),
+                "topic_id": topic_id,
+                "trainer_id": me.json()["id"],
+                "capacity": 10
+            }, headers=headers)
+
+def plan_index_names(plan) -> set:
+    """Collect the index names used anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    names = set()
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            names.add(plan["Index Name"])
+        for value in plan.values():
+            names |= plan_index_names(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            names |= plan_index_names(value)
+    return names
+
+@pytest.mark.asyncio
+async def test_search_uses_partial_indexes_at_one_million_sessions(search_bench_db):
+    """EXPLAIN the search query over 1M sessions and assert the open-session
+    partial indexes drive it, instead of a sequential scan."""
+    import json
+    from sqlalchemy import text
+    from sqlalchemy.dialects import postgresql
+    from app.Models.session import TrainingSession
+    from app.Services.session_service import SessionService
+    from app.core.pagination import paginate
+
+    db = search_bench_db
+    topic = await db.execute(text("SELECT id FROM topics WHERE name = 'Search Bench 1'"))
+    topic_id = topic.scalar_one()
+
+    async def explain(**filters):
+        stmt = paginate(
+            SessionService.build_search_query(**filters),
+            TrainingSession.start_time, TrainingSession.id, limit=20, descending=False
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        connection = await db.connection()
+        result = await connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql)
+        plan = result.scalar()
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    now = datetime.utcnow()
+    week = {"start_from": now, "start_to": now + timedelta(days=7)}
+
+    plan = await explain(topic_id=topic_id, has_free_seats=True, **week)
+    assert "ix_sessions_topic_id_start_time_id_open" in plan_index_names(plan), plan
+
+    plan = await explain(**week)
+    assert "ix_sessions_start_time_id_open" in plan_index_names(plan), plan
+
+    plan = await explain(topic_id=topic_id, statuses=("upcoming",))
+    assert "ix_sessions_topic_id_start_time_id_open" in plan_index_names(plan), plan
+
+@pytest.mark.asyncio
+async def test_status_scheduler_advances_started_and_ended_sessions():
+    from sqlalchemy import select, update, func
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.session import TrainingSession
+    from app.Services.session_service import (
+        SessionService, advance_session_statuses, SESSION_STATUS_LOCK
+    )
+
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    topic_id = await create_test_topic(headers)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        me = await client.get("/auth/me", headers=headers)
+        trainer_id = me.json()["id"]
+        session_ids = []
+        for days in (1, 2, 3):
+            response = await client.post("/sessions/", json={
+                "title": f"Scheduled Session {days}",
+                "start_time": (datetime.now(timezone.utc) + timedelta(days=days)).isoformat(),
+                "topic_id": topic_id,
+                "trainer_id": trainer_id,
+                "duration_minutes": 60
+            }, headers=headers)
+            session_ids.append(response.json()["id"])
+        running, ended, upcoming = session_ids
+
+        # Move the first two sessions into the past
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            for session_id, start_time in ((running, now - timedelta(minutes=10)), (ended, now - timedelta(hours=2))):
+                await db.execute(
+                    update(TrainingSession)
+                    .where(TrainingSession.id == uuid.UUID(session_id))
+                    .values(start_time=start_time)
+                )
+            await db.commit()
+
+        # A worker holding the lock makes this tick a no-op
+        async with AsyncSessionLocal() as holder:
+            await holder.execute(select(func.pg_advisory_xact_lock(SESSION_STATUS_LOCK)))
+            async with AsyncSessionLocal() as db:
+                assert await SessionService.advance_statuses(db) == {}
+            await holder.rollback()
+
+        assert await advance_session_statuses() >= 2
+
+        statuses = {}
+        for session_id in session_ids:
+            response = await client.get(f"/sessions/{session_id}")
+            statuses[session_id] = response.json()["status"]
+        assert statuses == {running: "active", ended: "completed", upcoming: "upcoming"}
+
+# Throughput the read models must reach relative to validated ORM entities
+READ_MODEL_MIN_SPEEDUP = 3.0
+
+@pytest.mark.asyncio
+async def test_benchmark_session_page_read_model_vs_orm():
+    """Serve a 100-session page through ORM entities validated by
+    SessionResponse and through the read models, side by side, and require
+    the read models to serve at least READ_MODEL_MIN_SPEEDUP times as many
+    pages."""
+    import time
+    from typing import List
+    from pydantic import TypeAdapter
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+    from app.DB.session import AsyncSessionLocal
+    from app.Models.session import TrainingSession
+    from app.Schemas.session_schema import SessionResponse
+    from app.Services.read_models import dump_json
+    from app.Services.session_service import SessionService
+    from app.core.pagination import paginate
+
+    await ensure_sessions(100)
+    adapter = TypeAdapter(List[SessionResponse])
+
+    async def orm_page():
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(TrainingSession)
+                .options(selectinload(TrainingSession.trainer), selectinload(TrainingSession.topic))
+                .where(TrainingSession.deleted_at.is_(None))
+            )
+            result = await db.execute(paginate(stmt, TrainingSession.created_at, TrainingSession.id, limit=100))
+            return adapter.dump_json(adapter.validate_python(result.scalars().all(), from_attributes=True))
+
+    async def read_model_page():
+        async with AsyncSessionLocal() as db:
+            return dump_json(await SessionService.get_all_sessions(db, limit=100))
+
+    assert await orm_page() == await read_model_page()
+
+    timings = {}
+    for name, page in (("orm", orm_page), ("read model", read_model_page)):
+        latencies = []
+        for _ in range(200):
+            started = time.perf_counter()
+            await page()
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        timings[name] = latencies
+        print(
+            f"\n{name} 100-session page: "
+            f"p50={latencies[len(latencies) // 2] * 1000:.2f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms"
+        )
+    ratio = sum(timings["orm"]) / sum(timings["read model"])
+    print(f"throughput ratio: {ratio:.1f}x")
+    assert ratio >= READ_MODEL_MIN_SPEEDUP, f"Read models served pages only {ratio:.1f}x faster"
@@ -43,3 +43,31 @@ async def test_list_topics():
         response = await client.get("/topics/")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
+
+@pytest.mark.asyncio
+async def test_topic_etag_revalidation_and_invalidation():
+    token = await get_admin_token()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        response = await client.post("/topics/", json={
+            "name": f"Cached Topic {uuid.uuid4().hex[:6]}",
+            "description": "Before"
+        }, headers=headers)
+        topic_id = response.json()["id"]
+
+        first = await client.get(f"/topics/{topic_id}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        # Unchanged topic revalidates without a body
+        cached = await client.get(f"/topics/{topic_id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # A write invalidates the cached representation
+        await client.patch(f"/topics/{topic_id}", json={"description": "After"}, headers=headers)
+        updated = await client.get(f"/topics/{topic_id}", headers={"If-None-Match": etag})
+        assert updated.status_code == 200
+        assert updated.json()["description"] == "After"
+        assert updated.headers["ETag"] != etag